@@ -0,0 +1,45 @@
+# app/api/routes/admin.py
+"""
+Rutas de administración. Exponen huellas de SQL y permiten borrar la agregación, así que
+main.py solo las monta si hay ADMIN_TOKEN y cada petición debe traerlo
+(Authorization: Bearer <ADMIN_TOKEN>).
+"""
+import hmac
+from typing import Any, Dict, Literal, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+
+from app.core.config import settings
+from app.db.consultas_lentas import registro_lentas
+
+
+async def verificar_token_admin(authorization: Optional[str] = Header(None)) -> None:
+    esquema, _, token = (authorization or "").partition(" ")
+    if (
+        not settings.ADMIN_TOKEN
+        or esquema.lower() != "bearer"
+        or not hmac.compare_digest(token.strip().encode(), settings.ADMIN_TOKEN.encode())
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token de administración inválido",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+router = APIRouter(prefix="/admin", tags=["Administración"], dependencies=[Depends(verificar_token_admin)])
+
+
+# GET /admin/consultas-lentas -> top-N huellas de sentencia (acumulado desde el arranque del proceso)
+@router.get("/consultas-lentas")
+async def top_consultas_lentas(
+    top: int = Query(20, ge=1, le=500, description="Número de huellas a devolver"),
+    orden: Literal["total_ms", "max_ms", "p95_ms", "n"] = Query("total_ms", description="Criterio de orden"),
+) -> Dict[str, Any]:
+    return {**registro_lentas.estadisticas(), "top": registro_lentas.top(top, orden)}
+
+
+# DELETE /admin/consultas-lentas -> reinicia la agregación (p. ej. antes de una prueba de carga)
+@router.delete("/consultas-lentas", status_code=status.HTTP_204_NO_CONTENT)
+async def reiniciar_consultas_lentas() -> None:
+    registro_lentas.limpiar()
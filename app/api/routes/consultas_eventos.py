@@ -1,96 +1,221 @@
 # app/api/routes/consultas_eventos.py
+import asyncio
+import json
+import logging
+import time
+
 from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date
 from typing import List, Dict, Any
 
-from app.db.mysql import get_session
+from app.core.config import settings
+from app.core.cache import cache_consultas
+from app.core.condicional import condicional
+from app.core.metricas import medir_consulta
+from app.core.serializacion import respuesta_lista
+from app.db.replica import get_session_lectura, sesion_lectura
+from app.db.paralelo import limitar_conexiones
 from app.crud.eventos import consultas as q
+from app.crud.eventos import consultas_resumen as qr
+from app.crud.eventos import consultas_unicas as qu
 
 # (Opcional) usar schema para serializar eventos en la #3
 from app.schemas.eventos.evento import Evento as EventoOut
+from app.schemas.eventos.consultas import (
+    ConsultaBatchPeticion, ConsultaBatchItem, ConsultaBatchResultado, ConsultaBatchRespuesta,
+    ParamsVacios, ParamsOrganizacion, ParamsInstalacion, ParamsPeriodo, ParamsFechaBase,
+)
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/consultas", tags=["Consultas analíticas"])
 
 
+def _consulta(nombre: str):
+    """Elige la implementación: tablas resumen > una sola sentencia > varias sentencias."""
+    if settings.USAR_RESUMENES and hasattr(qr, nombre):
+        fn = getattr(qr, nombre)
+    elif settings.CONSULTAS_UNA_SENTENCIA and hasattr(qu, nombre):
+        fn = getattr(qu, nombre)
+    else:
+        fn = getattr(q, nombre)
+    # la duración se registra por nombre de consulta, sea cual sea la implementación
+    return medir_consulta(nombre, fn)
+
+
+@router.get("/cache/estadisticas")
+async def estadisticas_cache_consultas() -> Dict[str, Any]:
+    # hits / misses / evictions para dimensionar CACHE_CONSULTAS_MAX_ENTRADAS y CACHE_CONSULTAS_TTL
+    return cache_consultas.estadisticas()
+
+
 @router.get("/organizaciones/{id_organizacion}/resumen")
+@condicional("Evento", "Representante")
+@cache_consultas.cachear("Evento", "Representante")
 async def consulta_1_resumen_por_organizacion(
     id_organizacion: int,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_session_lectura),
 ) -> Dict[str, Any]:
-    return await q.q1_eventos_por_organizacion(session, id_organizacion)
+    return await _consulta("q1_eventos_por_organizacion")(session, id_organizacion)
 
 
 @router.get("/instalaciones/{id_instalacion}/resumen")
+@condicional("Evento", "InstalacionEvento", "EventoResponsable")
+@cache_consultas.cachear("Evento", "InstalacionEvento", "EventoResponsable")
 async def consulta_2_resumen_por_instalacion(
     id_instalacion: int,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_session_lectura),
 ) -> Dict[str, Any]:
-    return await q.q2_resumen_por_instalacion(session, id_instalacion)
+    return await _consulta("q2_resumen_por_instalacion")(session, id_instalacion)
 
 
 @router.get("/eventos/pendientes", response_model=List[EventoOut])
+@condicional("Evento", "EventoResponsable", "InstalacionEvento", "Representante")
+@cache_consultas.cachear("Evento", "EventoResponsable", "InstalacionEvento", "Representante")
 async def consulta_3_eventos_pendientes_por_periodo(
     desde: date = Query(..., description="Fecha inicial (YYYY-MM-DD)"),
     hasta: date = Query(..., description="Fecha final (YYYY-MM-DD)"),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_session_lectura),
 ):
     if hasta < desde:
         raise HTTPException(status_code=400, detail="El parámetro 'hasta' no puede ser menor que 'desde'.")
-    eventos = await q.q3_pendientes_por_periodo(session, desde, hasta)
-    # Serializamos con el schema Pydantic
-    return [EventoOut.model_validate(e, from_attributes=True) for e in eventos]
+    eventos = await _consulta("q3_pendientes_por_periodo")(session, desde, hasta, solo_columnas=True)
+    # Serializamos con el schema Pydantic, en bloque (la caché guarda directamente el JSON)
+    return respuesta_lista(EventoOut, eventos)
 
 
 @router.get("/instalaciones/top")
+@condicional("Evento", "InstalacionEvento", "EventoResponsable")
+@cache_consultas.cachear("Evento", "InstalacionEvento", "EventoResponsable")
 async def consulta_4_instalacion_top_y_detalle(
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_session_lectura),
 ) -> Dict[str, Any]:
-    return await q.q4_instalacion_top_y_detalle(session)
+    return await _consulta("q4_instalacion_top_y_detalle")(session)
 
 
 @router.get("/organizadores/unidades/resumen")
+@condicional("Evento", "EventoResponsable", "Representante", "Docente", "UnidadAcademica", "Estudiante", "Programa")
+@cache_consultas.cachear("Evento", "EventoResponsable", "Representante", "Docente", "UnidadAcademica", "Estudiante", "Programa")
 async def consulta_5_eventos_por_unidad_organizadora(
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_session_lectura),
 ) -> Dict[str, Any]:
-    return await q.q5_eventos_por_unidad_organizadora(session)
+    return await _consulta("q5_eventos_por_unidad_organizadora")(session)
 
 
 @router.get("/credenciales/activas-vencidas")
+@condicional("Usuario", "Credencial", por_dia=True)
+@cache_consultas.cachear("Usuario", "Credencial", por_dia=True)
 async def consulta_6_usuarios_con_password_activa_vencida(
     fecha_base: date | None = Query(None, description="Fecha de referencia (opcional). Si no se envía, hoy()."),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_session_lectura),
 ) -> List[Dict[str, Any]]:
-    return await q.q6_usuarios_con_password_activa_vencida(session, fecha_base)
+    return await _consulta("q6_usuarios_con_password_activa_vencida")(session, fecha_base)
 
 
 @router.get("/representantes/proporcion-por-rol")
+@condicional("Usuario", "EventoResponsable", "Representante")
+@cache_consultas.cachear("Usuario", "EventoResponsable", "Representante")
 async def consulta_7_proporcion_representantes_por_rol(
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_session_lectura),
 ) -> List[Dict[str, Any]]:
-    return await q.q7_proporcion_representantes_por_rol_organizador(session)
+    return await _consulta("q7_proporcion_representantes_por_rol_organizador")(session)
 
 
 @router.get("/usuarios/resumen-participacion")
+@condicional("Usuario", "EventoResponsable")
+@cache_consultas.cachear("Usuario", "EventoResponsable")
 async def consulta_8_usuarios_por_rol_y_mas_participa(
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_session_lectura),
 ) -> Dict[str, Any]:
-    return await q.q8_usuarios_por_rol_y_mas_participa(session)
+    return await _consulta("q8_usuarios_por_rol_y_mas_participa")(session)
 
 
 @router.get("/organizadores/top")
+@condicional("Evento", "EventoResponsable", "InstalacionEvento")
+@cache_consultas.cachear("Evento", "EventoResponsable", "InstalacionEvento")
 async def consulta_9_top5_usuarios_activos(
     desde: date = Query(..., description="Fecha inicial (YYYY-MM-DD)"),
     hasta: date = Query(..., description="Fecha final (YYYY-MM-DD)"),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_session_lectura),
 ) -> List[Dict[str, Any]]:
     if hasta < desde:
         raise HTTPException(status_code=400, detail="El parámetro 'hasta' no puede ser menor que 'desde'.")
-    return await q.q9_top5_usuarios_activos(session, desde, hasta)
+    return await _consulta("q9_top5_usuarios_activos")(session, desde, hasta)
 
 
 @router.get("/eventos/revisiones/tasa-rechazo")
+@condicional("Evento", "Evaluacion")
+@cache_consultas.cachear("Evento", "Evaluacion")
 async def consulta_10_tasa_rechazo_y_revisiones(
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_session_lectura),
 ) -> List[Dict[str, Any]]:
-    return await q.q10_rechazo_inicial_y_revisiones(session)
\ No newline at end of file
+    return await _consulta("q10_rechazo_inicial_y_revisiones")(session)
+
+# -----------------------------
+# Batch: varias consultas en una sola petición (dashboard)
+# -----------------------------
+_CONSULTAS_BATCH = {
+    "q1": (consulta_1_resumen_por_organizacion, ParamsOrganizacion),
+    "q2": (consulta_2_resumen_por_instalacion, ParamsInstalacion),
+    "q3": (consulta_3_eventos_pendientes_por_periodo, ParamsPeriodo),
+    "q4": (consulta_4_instalacion_top_y_detalle, ParamsVacios),
+    "q5": (consulta_5_eventos_por_unidad_organizadora, ParamsVacios),
+    "q6": (consulta_6_usuarios_con_password_activa_vencida, ParamsFechaBase),
+    "q7": (consulta_7_proporcion_representantes_por_rol, ParamsVacios),
+    "q8": (consulta_8_usuarios_por_rol_y_mas_participa, ParamsVacios),
+    "q9": (consulta_9_top5_usuarios_activos, ParamsPeriodo),
+    "q10": (consulta_10_tasa_rechazo_y_revisiones, ParamsVacios),
+}
+
+
+async def _ejecutar_item(item: ConsultaBatchItem, semaforo: asyncio.Semaphore) -> ConsultaBatchResultado:
+    fn, modelo_params = _CONSULTAS_BATCH[item.consulta]
+    t_cola = time.perf_counter()
+    t0 = t_cola
+    try:
+        params = modelo_params.model_validate(item.params)
+        async with semaforo:
+            t0 = time.perf_counter()
+            # sesión propia por item: una AsyncSession no admite uso concurrente
+            async with sesion_lectura() as session:
+                resultado = await fn(session=session, **params.model_dump())
+            if isinstance(resultado, Response):
+                resultado = json.loads(resultado.body)  # endpoints con respuesta ya serializada (q3)
+        ok, status_code, error = True, 200, None
+    except ValidationError as e:
+        ok, status_code, error, resultado = False, 422, e.errors(include_url=False, include_context=False), None
+    except HTTPException as e:
+        ok, status_code, error, resultado = False, e.status_code, e.detail, None
+    except Exception as e:  # un fallo no tumba el batch completo
+        logger.exception("Fallo en consulta %s del batch", item.consulta)
+        ok, status_code, error, resultado = False, 500, f"{type(e).__name__}: {e}", None
+    fin = time.perf_counter()
+    return ConsultaBatchResultado(
+        consulta=item.consulta,
+        ok=ok,
+        status_code=status_code,
+        espera_ms=(t0 - t_cola) * 1000,
+        duracion_ms=(fin - t0) * 1000,
+        resultado=jsonable_encoder(resultado) if ok else None,
+        error=jsonable_encoder(error),
+    )
+
+
+@router.post("/batch", response_model=ConsultaBatchRespuesta)
+async def consultas_batch(peticion: ConsultaBatchPeticion) -> ConsultaBatchRespuesta:
+    """
+    Evalúa varias consultas en una sola petición con concurrencia acotada
+    (CONSULTAS_BATCH_CONCURRENCIA). Cada item lleva su tiempo y su error propio.
+    """
+    t0 = time.perf_counter()
+    semaforo = asyncio.Semaphore(settings.CONSULTAS_BATCH_CONCURRENCIA)
+    # límite de conexiones adicionales (además de la sesión de cada item) compartido por todas
+    # las sub-consultas en modo paralelo: el batch usa a lo sumo
+    # CONSULTAS_BATCH_CONCURRENCIA + CONSULTAS_MAX_CONEXIONES_POR_PETICION - 1 conexiones
+    with limitar_conexiones(max(settings.CONSULTAS_MAX_CONEXIONES_POR_PETICION - 1, 1)):
+        resultados = await asyncio.gather(*(_ejecutar_item(item, semaforo) for item in peticion.consultas))
+    return ConsultaBatchRespuesta(duracion_total_ms=(time.perf_counter() - t0) * 1000, resultados=resultados)
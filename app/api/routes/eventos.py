@@ -1,16 +1,27 @@
-from typing import List, Dict, Any, Optional
+import time
+from typing import List, Dict, Any, Optional, Literal
 from datetime import date
 
 from fastapi import APIRouter, Depends, status, HTTPException, Query, Body
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.condicional import condicional
+from app.core.config import settings
+from app.core.serializacion import respuesta_modelo
 from app.db.mysql import get_session
+from app.db.replica import get_session_lectura
 from app.services.eventos import evento as evento_service
-from app.schemas.eventos.evento import EventoCrear, Evento
+from app.schemas.eventos.evento import EventoCrear, EventoCrearLoteItem, Evento, EventoPagina, EventoLoteRespuesta
 from app.models.eventos.evento import EstadoEventoEnum, TipoEventoEnum
 
 router = APIRouter(prefix="/eventos", tags=["Eventos"])
 
+# /bulk recibe los items sin validar (se validan uno a uno en el servicio); para OpenAPI se
+# documenta cada item como EventoCrearLoteItem (sus enums ya están en components por EventoCrear)
+_ESQUEMA_ITEM_LOTE = EventoCrearLoteItem.model_json_schema(ref_template="#/components/schemas/{model}")
+_ESQUEMA_ITEM_LOTE.pop("$defs", None)
+
 # POST /eventos  -> crear (requiere id_responsable estudiante/docente)
 @router.post("/", response_model=Evento, status_code=status.HTTP_201_CREATED)
 async def crear_evento(
@@ -27,26 +38,93 @@ async def crear_evento(
         raise HTTPException(status_code=400, detail=str(e))
 
 
-# GET /eventos -> listar (filtros opcionales)
-@router.get("/", response_model=List[Evento], status_code=status.HTTP_200_OK)
+# POST /eventos/bulk -> crear muchos en una transacción (resultado por item)
+@router.post("/bulk", response_model=EventoLoteRespuesta, status_code=status.HTTP_200_OK)
+async def crear_eventos_lote(
+    items: List[Any] = Body(
+        ...,
+        description="Array de EventoCrearLoteItem (EventoCrear + id_responsable)",
+        json_schema_extra={"items": _ESQUEMA_ITEM_LOTE},
+        openapi_examples={"dos_eventos": {"summary": "Dos eventos", "value": [
+            {"nombre": "Semana de la ciencia", "tipo": "academico", "fecha_inicio": "2031-05-10",
+             "fecha_fin": "2031-05-12", "hora_inicio": "08:00:00", "hora_fin": "17:00:00", "id_responsable": 1},
+            {"nombre": "Torneo de ajedrez", "tipo": "ludico", "fecha_inicio": "2031-06-01",
+             "fecha_fin": "2031-06-01", "hora_inicio": "14:00:00", "hora_fin": "18:00:00", "id_responsable": 2},
+        ]}},
+    ),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    Cada item se valida por separado (422 schema, 400 fechas o responsable inexistente,
+    403 rol no permitido). Los válidos se insertan juntos en una sola transacción; si esta
+    falla, ninguno queda creado y todos reportan 500.
+    """
+    if not items:
+        raise HTTPException(status_code=422, detail="El lote está vacío")
+    if len(items) > settings.EVENTOS_LOTE_MAX:
+        raise HTTPException(status_code=413, detail=f"Máximo {settings.EVENTOS_LOTE_MAX} eventos por lote")
+    t0 = time.perf_counter()
+    resultados = await evento_service.crear_eventos_lote_service(session, items)
+    creados = sum(1 for r in resultados if r["ok"])
+    return EventoLoteRespuesta(
+        creados=creados,
+        fallidos=len(resultados) - creados,
+        duracion_ms=(time.perf_counter() - t0) * 1000,
+        resultados=resultados,
+    )
+
+
+# GET /eventos -> listar (filtros opcionales, paginado por cursor)
+@router.get("/", response_model=EventoPagina, status_code=status.HTTP_200_OK)
+@condicional("Evento")
 async def listar_eventos(
     estado: Optional[EstadoEventoEnum] = Query(None, description="registrado | en_revision | aprobado"),
     tipo: Optional[TipoEventoEnum] = Query(None, description="ludico | academico"),
     desde: Optional[date] = Query(None, description="YYYY-MM-DD"),
     hasta: Optional[date] = Query(None, description="YYYY-MM-DD"),
-    session: AsyncSession = Depends(get_session),
+    cursor: Optional[str] = Query(None, description="next_cursor devuelto por la página anterior"),
+    limite: int = Query(50, ge=1, le=500, description="Tamaño de página"),
+    session: AsyncSession = Depends(get_session_lectura),
 ):
     if desde and hasta and hasta < desde:
         raise HTTPException(status_code=400, detail="'hasta' no puede ser menor que 'desde'")
-    eventos = await evento_service.listar_eventos_service(session, estado, tipo, desde, hasta)
-    return eventos
+    try:
+        eventos, next_cursor = await evento_service.listar_eventos_service(
+            session, estado, tipo, desde, hasta, cursor, limite, solo_columnas=True
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # tuplas de columnas -> EventoPagina -> JSON en bloque (mismo contrato que response_model)
+    return respuesta_modelo(EventoPagina, {"items": eventos, "next_cursor": next_cursor})
+
+
+# GET /eventos/export -> exportación completa en streaming (antes de /{id_evento} para no chocar)
+@router.get("/export", status_code=status.HTTP_200_OK, responses={
+    200: {"content": {"application/x-ndjson": {}, "text/csv": {}}}
+})
+async def exportar_eventos(
+    formato: Literal["ndjson", "csv"] = Query("ndjson", alias="format", description="ndjson | csv"),
+    estado: Optional[EstadoEventoEnum] = Query(None, description="registrado | en_revision | aprobado"),
+    tipo: Optional[TipoEventoEnum] = Query(None, description="ludico | academico"),
+    desde: Optional[date] = Query(None, description="YYYY-MM-DD"),
+    hasta: Optional[date] = Query(None, description="YYYY-MM-DD"),
+):
+    if desde and hasta and hasta < desde:
+        raise HTTPException(status_code=400, detail="'hasta' no puede ser menor que 'desde'")
+    media_type = "text/csv" if formato == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        evento_service.exportar_eventos_service(formato, estado, tipo, desde, hasta),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="eventos.{formato}"'},
+    )
 
 
 # GET /eventos/{id} -> detalle
 @router.get("/{id_evento}", response_model=Evento, status_code=status.HTTP_200_OK)
+@condicional(entidad=("Evento", "id_evento"))
 async def obtener_evento(
     id_evento: int,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_session_lectura),
 ):
     evt = await evento_service.obtener_evento_service(session, id_evento)
     if not evt:
@@ -1,16 +1,86 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, status, HTTPException, UploadFile, File, Form
-from fastapi.responses import Response
+import functools
+import json
+from typing import AsyncIterator, Callable, List, Optional
+from fastapi import APIRouter, Depends, status, HTTPException, Request, UploadFile, File, Form
+from fastapi.responses import Response, StreamingResponse
+from fastapi.routing import APIRoute
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.blobs import BlobDemasiadoGrande, obtener_almacen
+from app.core.condicional import condicional
+from app.core.config import settings
+from app.core.descargas import RangoNoSatisfacible, etag_coincide, etag_fuerte, parsear_rango
 from app.db.mysql import get_session
-from app.services.eventos import representante_service as svc
-from app.schemas.eventos.representante import Representante, RepresentanteCrear
+from app.db.replica import get_session_lectura
+from app.services.eventos import representante as svc
+from app.schemas.eventos.representante import Representante, RepresentanteCrear, RepresentanteLoteRespuesta
 
-router = APIRouter(prefix="/eventos", tags=["Participación externa"])
+# -----------------------------
+# Límite del cuerpo antes de leerlo
+# -----------------------------
+_MARGEN_MULTIPART = 64 * 1024  # campos de formulario y cabeceras de cada parte
+
+
+def limite_cuerpo(maximo: Callable[[], int]):
+    """Marca un endpoint para que CuerpoLimitado rechace (413) cuerpos de más de maximo() bytes."""
+    def decorar(endpoint):
+        endpoint.limite_cuerpo = maximo
+        return endpoint
+    return decorar
+
+
+class CuerpoLimitado(APIRoute):
+    """
+    Starlette vuelca el multipart entero a ficheros temporales antes de llamar al endpoint, así
+    que el tamaño se acota antes de leer: por Content-Length si viene y, si no (chunked),
+    contando los bytes según llegan. Solo en los endpoints marcados con limite_cuerpo.
+    """
+
+    def get_route_handler(self):
+        manejador = super().get_route_handler()
+        limite = getattr(self.endpoint, "limite_cuerpo", None)
+        if limite is None:
+            return manejador
+
+        async def manejador_limitado(request: Request):
+            maximo = limite()
+            demasiado_grande = HTTPException(status_code=413, detail=f"El cuerpo supera el máximo de {maximo} bytes")
+            declarado = request.headers.get("content-length", "")
+            if declarado.isdigit() and int(declarado) > maximo:
+                raise demasiado_grande
+            recibidos = 0
+
+            async def recibir():
+                nonlocal recibidos
+                mensaje = await request.receive()
+                if mensaje["type"] == "http.request":
+                    recibidos += len(mensaje.get("body", b""))
+                    if recibidos > maximo:
+                        raise demasiado_grande
+                return mensaje
+
+            return await manejador(Request(request.scope, recibir))
+
+        return manejador_limitado
+
+
+router = APIRouter(prefix="/eventos", tags=["Participación externa"], route_class=CuerpoLimitado)
+
+
+async def _leer_por_bloques(archivo: UploadFile) -> AsyncIterator[bytes]:
+    # UploadFile ya está en un SpooledTemporaryFile (acotado por CuerpoLimitado): se copia al
+    # almacén sin cargarlo entero en memoria; el máximo por archivo se comprueba al copiar.
+    # Desde el principio: en el alta en lote varios items pueden compartir archivo
+    await archivo.seek(0)
+    while True:
+        bloque = await archivo.read(settings.BLOBS_TAMANO_BLOQUE)
+        if not bloque:
+            break
+        yield bloque
 
 
 @router.post("/{id_evento}/organizaciones", response_model=Representante, status_code=status.HTTP_201_CREATED)
+@limite_cuerpo(lambda: settings.CERTIFICADO_MAX_BYTES + _MARGEN_MULTIPART)
 async def agregar_organizacion_a_evento(
     id_evento: int,
     # Campos simples (Form para combinar con archivo)
@@ -20,20 +90,69 @@ async def agregar_organizacion_a_evento(
     certificado: Optional[UploadFile] = File(None, description="PDF firmado por el representante legal"),
     session: AsyncSession = Depends(get_session),
 ):
+    # 1) Rechazo temprano por el tamaño de la parte (el límite exacto se comprueba al copiar los bloques)
+    if certificado is not None and certificado.size is not None and certificado.size > settings.CERTIFICADO_MAX_BYTES:
+        raise HTTPException(status_code=413, detail=f"El certificado supera el máximo de {settings.CERTIFICADO_MAX_BYTES} bytes")
     try:
-        certificado_bytes = await certificado.read() if certificado else None
         rep = await svc.agregar_representante_service(
-            session, id_evento, id_organizacion, nombre_representante, representante_legal, certificado_bytes
+            session, id_evento, id_organizacion, nombre_representante, representante_legal,
+            _leer_por_bloques(certificado) if certificado else None,
+            (certificado.content_type if certificado else None) or "application/pdf",
         )
         return rep
+    except BlobDemasiadoGrande as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/{id_evento}/organizaciones/bulk", response_model=RepresentanteLoteRespuesta, status_code=status.HTTP_200_OK)
+@limite_cuerpo(lambda: settings.REPRESENTANTES_LOTE_MAX_BYTES)
+async def agregar_organizaciones_a_evento(
+    id_evento: int,
+    items: str = Form(..., description="JSON: array de {id_organizacion, nombre_representante, "
+                                       "representante_legal, certificado (posición en `certificados`, opcional)}"),
+    certificados: Optional[List[UploadFile]] = File(None, description="PDFs referenciados por los items"),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    Varias organizaciones en una petición multipart. Cada item se valida por separado
+    (422 schema, 400 organización inexistente o ya asociada, 413 certificado demasiado
+    grande); los válidos se insertan juntos en una transacción. Un evento inexistente o
+    no 'registrado' rechaza la petición entera (400).
+    """
+    # 1) Cuerpo: array JSON de items y rechazo temprano de archivos demasiado grandes
+    try:
+        crudos = json.loads(items)
+    except ValueError:
+        raise HTTPException(status_code=422, detail="items debe ser un array JSON")
+    if not isinstance(crudos, list) or not crudos:
+        raise HTTPException(status_code=422, detail="items debe ser un array JSON no vacío")
+    if len(crudos) > settings.REPRESENTANTES_LOTE_MAX:
+        raise HTTPException(status_code=413, detail=f"Máximo {settings.REPRESENTANTES_LOTE_MAX} organizaciones por lote")
+    certificados = certificados or []
+    for archivo in certificados:
+        if archivo.size is not None and archivo.size > settings.CERTIFICADO_MAX_BYTES:
+            raise HTTPException(status_code=413, detail=f"{archivo.filename}: el certificado supera el máximo de "
+                                                        f"{settings.CERTIFICADO_MAX_BYTES} bytes")
+
+    # 2) Alta en lote
+    try:
+        resultados = await svc.agregar_representantes_lote_service(
+            session, id_evento, crudos,
+            [(functools.partial(_leer_por_bloques, a), a.content_type or "application/pdf") for a in certificados],
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    creados = sum(1 for r in resultados if r["ok"])
+    return RepresentanteLoteRespuesta(creados=creados, fallidos=len(resultados) - creados, resultados=resultados)
+
+
 @router.get("/{id_evento}/organizaciones", response_model=List[Representante], status_code=status.HTTP_200_OK)
+@condicional("Representante")
 async def listar_organizaciones_de_evento(
     id_evento: int,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_session_lectura),
 ):
     reps = await svc.listar_representantes_por_evento_service(session, id_evento)
     return reps
@@ -55,14 +174,48 @@ async def eliminar_organizacion_de_evento(
 
 
 @router.get("/{id_evento}/organizaciones/{id_organizacion}/certificado", responses={
-    200: {"content": {"application/pdf": {}}}
+    200: {"content": {"application/pdf": {}}},
+    206: {"description": "Rango parcial (cabecera Range)"},
+    304: {"description": "No modificado (If-None-Match)"},
+    416: {"description": "Rango no satisfacible"},
 })
 async def descargar_certificado(
     id_evento: int,
     id_organizacion: int,
-    session: AsyncSession = Depends(get_session),
+    request: Request,
+    session: AsyncSession = Depends(get_session_lectura),
 ):
-    cert = await svc.obtener_certificado_service(session, id_evento, id_organizacion)
-    if cert is None:
+    meta = await svc.obtener_metadatos_certificado_service(session, id_evento, id_organizacion)
+    if meta is None:
         raise HTTPException(status_code=404, detail="Certificado no encontrado")
-    return Response(content=cert, media_type="application/pdf")
+    sha256, tamano, media_type = meta
+
+    # 1) Validación condicional: el digest del contenido es un ETag fuerte
+    etag = etag_fuerte(sha256)
+    cabeceras = {"ETag": etag, "Accept-Ranges": "bytes", "Cache-Control": "private, no-cache"}
+    if etag_coincide(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cabeceras)
+
+    # 2) Range de un solo intervalo (If-Range con otro ETag => se sirve completo)
+    rango = None
+    if_range = request.headers.get("if-range")
+    if if_range is None or if_range.strip() == etag:
+        try:
+            rango = parsear_rango(request.headers.get("range"), tamano)
+        except RangoNoSatisfacible:
+            return Response(status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                            headers={**cabeceras, "Content-Range": f"bytes */{tamano}"})
+
+    # 3) Cuerpo en streaming desde el almacén de blobs
+    almacen = obtener_almacen()
+    if rango is None:
+        inicio, fin, codigo = 0, tamano - 1, status.HTTP_200_OK
+    else:
+        inicio, fin = rango
+        codigo = status.HTTP_206_PARTIAL_CONTENT
+        cabeceras["Content-Range"] = f"bytes {inicio}-{fin}/{tamano}"
+    cabeceras["Content-Length"] = str(fin - inicio + 1 if tamano else 0)
+    return StreamingResponse(
+        almacen.iterar(sha256, inicio, fin if tamano else None, settings.BLOBS_TAMANO_BLOQUE),
+        status_code=codigo, media_type=media_type, headers=cabeceras,
+    )
@@ -0,0 +1,162 @@
+# app/core/blobs.py
+"""
+Almacén de blobs direccionado por contenido (certificados y demás archivos subidos).
+
+  - Clave: SHA-256 del contenido (hex). El mismo archivo subido dos veces se guarda una vez.
+  - Las filas de la BD guardan solo digest, tamaño y media type; los bytes viven aquí.
+  - Backend intercambiable (BLOBS_BACKEND); hoy solo "local": un archivo por blob en
+    BLOBS_DIR/ab/cd/<digest>, escrito en un temporal del mismo directorio, fsync y os.replace
+    (atómico: un lector nunca ve un blob a medias).
+
+Los blobs no se borran al eliminar una fila: pueden estar referenciados por otras.
+Las operaciones síncronas (escribir/leer) sirven para migraciones y scripts; las rutas usan
+las async, que delegan en un hilo para no bloquear el event loop:
+  - guardar_stream: ingesta por bloques con límite de tamaño, calculando el SHA-256 al escribir.
+  - iterar: lectura por bloques de un rango de bytes (descargas con Range).
+"""
+import asyncio
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import AsyncIterable, AsyncIterator, Dict, Optional, Type
+
+from app.core.config import settings
+
+
+class BlobDemasiadoGrande(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Blob:
+    sha256: str
+    tamano: int
+
+
+class AlmacenBlobs:
+    """Interfaz de los backends: escribir/leer/existe síncronos; guardar/obtener async."""
+
+    def escribir(self, datos: bytes) -> Blob:
+        raise NotImplementedError
+
+    def leer(self, sha256: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def existe(self, sha256: str) -> bool:
+        raise NotImplementedError
+
+    async def guardar(self, datos: bytes) -> Blob:
+        return await asyncio.to_thread(self.escribir, datos)
+
+    async def obtener(self, sha256: str) -> Optional[bytes]:
+        return await asyncio.to_thread(self.leer, sha256)
+
+    async def guardar_stream(self, bloques: AsyncIterable[bytes], max_bytes: Optional[int] = None) -> Blob:
+        raise NotImplementedError
+
+    def iterar(self, sha256: str, inicio: int = 0, fin: Optional[int] = None,
+               tamano_bloque: int = 64 * 1024) -> AsyncIterator[bytes]:
+        """Bytes [inicio, fin] (fin inclusive, como en Range) en bloques de tamano_bloque."""
+        raise NotImplementedError
+
+
+class AlmacenLocal(AlmacenBlobs):
+    def __init__(self, raiz: str):
+        self.raiz = raiz
+
+    def ruta(self, sha256: str) -> str:
+        if len(sha256) != 64 or any(c not in "0123456789abcdef" for c in sha256):
+            raise ValueError("Digest SHA-256 inválido")
+        return os.path.join(self.raiz, sha256[:2], sha256[2:4], sha256)
+
+    def escribir(self, datos: bytes) -> Blob:
+        blob = Blob(hashlib.sha256(datos).hexdigest(), len(datos))
+        destino = self.ruta(blob.sha256)
+        if os.path.exists(destino):
+            return blob  # deduplicado
+        directorio = os.path.dirname(destino)
+        os.makedirs(directorio, exist_ok=True)
+        fd, temporal = tempfile.mkstemp(dir=directorio, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(datos)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporal, destino)
+        except BaseException:
+            os.unlink(temporal)
+            raise
+        return blob
+
+    async def guardar_stream(self, bloques: AsyncIterable[bytes], max_bytes: Optional[int] = None) -> Blob:
+        # el digest no se conoce hasta el final: se escribe en un temporal bajo la raíz
+        # (mismo sistema de archivos, para que os.replace sea atómico) y se mueve al terminar
+        directorio_tmp = os.path.join(self.raiz, ".tmp")
+        os.makedirs(directorio_tmp, exist_ok=True)
+        fd, temporal = tempfile.mkstemp(dir=directorio_tmp)
+        h = hashlib.sha256()
+        tamano = 0
+        try:
+            with os.fdopen(fd, "wb") as f:
+                async for bloque in bloques:
+                    tamano += len(bloque)
+                    if max_bytes is not None and tamano > max_bytes:
+                        raise BlobDemasiadoGrande(f"El archivo supera el máximo de {max_bytes} bytes")
+                    h.update(bloque)
+                    await asyncio.to_thread(f.write, bloque)
+                await asyncio.to_thread(os.fsync, f.fileno())
+            blob = Blob(h.hexdigest(), tamano)
+            destino = self.ruta(blob.sha256)
+            if os.path.exists(destino):
+                os.unlink(temporal)  # deduplicado
+            else:
+                os.makedirs(os.path.dirname(destino), exist_ok=True)
+                os.replace(temporal, destino)
+            return blob
+        except BaseException:
+            if os.path.exists(temporal):
+                os.unlink(temporal)
+            raise
+
+    async def iterar(self, sha256: str, inicio: int = 0, fin: Optional[int] = None,
+                     tamano_bloque: int = 64 * 1024) -> AsyncIterator[bytes]:
+        f = await asyncio.to_thread(open, self.ruta(sha256), "rb")
+        try:
+            await asyncio.to_thread(f.seek, inicio)
+            restantes = None if fin is None else fin - inicio + 1
+            while restantes is None or restantes > 0:
+                n = tamano_bloque if restantes is None else min(tamano_bloque, restantes)
+                bloque = await asyncio.to_thread(f.read, n)
+                if not bloque:
+                    break
+                if restantes is not None:
+                    restantes -= len(bloque)
+                yield bloque
+        finally:
+            await asyncio.to_thread(f.close)
+
+    def leer(self, sha256: str) -> Optional[bytes]:
+        try:
+            with open(self.ruta(sha256), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def existe(self, sha256: str) -> bool:
+        return os.path.exists(self.ruta(sha256))
+
+
+BACKENDS: Dict[str, Type[AlmacenBlobs]] = {
+    "local": AlmacenLocal,
+}
+
+_almacen: Optional[AlmacenBlobs] = None
+
+
+def obtener_almacen() -> AlmacenBlobs:
+    """Instancia única del backend configurado (BLOBS_BACKEND / BLOBS_DIR)."""
+    global _almacen
+    if _almacen is None:
+        _almacen = BACKENDS[settings.BLOBS_BACKEND](settings.BLOBS_DIR)
+    return _almacen
@@ -0,0 +1,166 @@
+# app/core/cache.py
+"""
+Caché en memoria (por proceso) para las respuestas de /consultas.
+
+  - Clave: nombre de la consulta + parámetros de la petición.
+  - LRU acotado por número de entradas + TTL por entrada.
+  - Cada entrada se etiqueta con las tablas que lee; al hacer commit de una sesión
+    que modificó alguna de esas tablas, las entradas afectadas se descartan.
+
+Con varios workers cada proceso tiene su propia caché: la invalidación es local
+y el TTL acota cuánto puede tardar otro worker en ver el cambio. Cuando el endpoint
+usa ETags (app/core/condicional.py) la clave incluye además las versiones leídas de la
+BD, así que un cambio hecho en otro worker tampoco sirve una entrada vieja.
+"""
+import functools
+import time
+from collections import OrderedDict
+from datetime import date
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+# versiones de datos de la petición en curso (las fija el decorador condicional)
+versiones_peticion: ContextVar[Optional[Tuple]] = ContextVar("versiones_peticion", default=None)
+
+
+class CacheTTL:
+    def __init__(self, max_entradas: int, ttl_segundos: float):
+        self.max_entradas = max_entradas
+        self.ttl_segundos = ttl_segundos
+        # clave -> (expira_en, tablas, valor)
+        self._datos: "OrderedDict[Hashable, Tuple[float, frozenset, Any]]" = OrderedDict()
+        self._version = 0  # sube con cada invalidación; evita guardar resultados calculados antes de ella
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expiradas = 0
+        self.invalidaciones = 0
+
+    @property
+    def activa(self) -> bool:
+        return self.max_entradas > 0 and self.ttl_segundos > 0
+
+    def obtener(self, clave: Hashable) -> Tuple[bool, Any]:
+        entrada = self._datos.get(clave)
+        if entrada is None:
+            self.misses += 1
+            return False, None
+        expira_en, _tablas, valor = entrada
+        if expira_en <= time.monotonic():
+            del self._datos[clave]
+            self.expiradas += 1
+            self.misses += 1
+            return False, None
+        self._datos.move_to_end(clave)
+        self.hits += 1
+        return True, valor
+
+    def guardar(self, clave: Hashable, valor: Any, tablas: Iterable[str], version: int) -> None:
+        if version != self._version:
+            return  # hubo un commit sobre las tablas mientras se calculaba
+        self._datos[clave] = (time.monotonic() + self.ttl_segundos, frozenset(tablas), valor)
+        self._datos.move_to_end(clave)
+        while len(self._datos) > self.max_entradas:
+            self._datos.popitem(last=False)
+            self.evictions += 1
+
+    def invalidar(self, tablas: Set[str]) -> None:
+        if not tablas:
+            return
+        self._version += 1
+        afectadas = [k for k, (_e, t, _v) in self._datos.items() if t & tablas]
+        for k in afectadas:
+            del self._datos[k]
+        self.invalidaciones += len(afectadas)
+
+    def limpiar(self) -> None:
+        self._version += 1
+        self._datos.clear()
+
+    def estadisticas(self) -> Dict[str, Any]:
+        consultas = self.hits + self.misses
+        return {
+            "entradas": len(self._datos),
+            "max_entradas": self.max_entradas,
+            "ttl_segundos": self.ttl_segundos,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": (self.hits / consultas) if consultas else 0.0,
+            "evictions": self.evictions,
+            "expiradas": self.expiradas,
+            "invalidaciones": self.invalidaciones,
+        }
+
+    def cachear(self, *tablas: str, por_dia: bool = False) -> Callable:
+        """
+        Decorador para endpoints async. La clave son los kwargs del endpoint
+        (sin la sesión); FastAPI sigue viendo la firma original gracias a functools.wraps.
+        por_dia: la respuesta depende de la fecha de hoy (p. ej. q6 sin fecha_base); la fecha
+        entra en la clave para no servir tras medianoche lo calculado el día anterior.
+        """
+        def decorador(fn: Callable) -> Callable:
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                if not self.activa:
+                    return await fn(*args, **kwargs)
+                params = tuple(sorted(
+                    (k, v) for k, v in kwargs.items() if not isinstance(v, (AsyncSession, Session))
+                ))
+                clave = (fn.__name__, args, params, versiones_peticion.get(), date.today() if por_dia else None)
+                encontrado, valor = self.obtener(clave)
+                if encontrado:
+                    return valor
+                version = self._version
+                valor = await fn(*args, **kwargs)
+                self.guardar(clave, valor, tablas, version)
+                return valor
+            return wrapper
+        return decorador
+
+
+cache_consultas = CacheTTL(
+    max_entradas=settings.CACHE_CONSULTAS_MAX_ENTRADAS,
+    ttl_segundos=settings.CACHE_CONSULTAS_TTL,
+)
+
+
+# -----------------------------
+# Invalidación dirigida por escrituras
+# -----------------------------
+def _registrar_tablas_modificadas(session: Session, flush_context) -> None:
+    tablas = session.info.setdefault("tablas_modificadas", set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        tabla = getattr(obj, "__tablename__", None)
+        if tabla:
+            tablas.add(tabla)
+
+
+def _registrar_escritura_en_bloque(orm_execute_state) -> None:
+    # INSERT/UPDATE/DELETE enviados con session.execute() no pasan por flush
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None:
+            orm_execute_state.session.info.setdefault("tablas_modificadas", set()).add(mapper.local_table.name)
+
+
+def _invalidar_tras_commit(session: Session) -> None:
+    cache_consultas.invalidar(session.info.pop("tablas_modificadas", set()))
+
+
+def _descartar_tras_rollback(session: Session) -> None:
+    session.info.pop("tablas_modificadas", None)
+
+
+def instalar_invalidacion_cache() -> None:
+    """Registra los hooks en todas las sesiones: cualquier commit invalida las consultas que leen esas tablas."""
+    if not event.contains(Session, "after_flush", _registrar_tablas_modificadas):
+        event.listen(Session, "after_flush", _registrar_tablas_modificadas)
+        event.listen(Session, "do_orm_execute", _registrar_escritura_en_bloque)
+        event.listen(Session, "after_commit", _invalidar_tras_commit)
+        event.listen(Session, "after_rollback", _descartar_tras_rollback)
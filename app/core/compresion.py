@@ -0,0 +1,233 @@
+# app/core/compresion.py
+"""
+Compresión de respuestas negociada con Accept-Encoding (zstd, br, gzip).
+
+  - gzip siempre está disponible (zlib); br y zstd solo si están instalados los paquetes
+    `brotli` y `zstandard` (si no, no se anuncian ni se negocian).
+  - Se comprimen solo tipos de texto (JSON, NDJSON, CSV, text/*) y cuerpos de al menos
+    COMPRESION_MINIMO_BYTES; por debajo el coste de CPU no compensa.
+  - Respuestas de cuerpo único: se comprimen de una vez. Respuestas en streaming (export
+    NDJSON/CSV): se comprime bloque a bloque con un compresor incremental, sin Content-Length.
+  - A partir de COMPRESION_UMBRAL_HILO bytes la compresión se hace en un hilo
+    (asyncio.to_thread) para no bloquear el event loop con cuerpos de varios MB.
+  - No se tocan respuestas ya codificadas, 204/304, parciales (206: Content-Range se refiere
+    a los bytes sin comprimir) ni las marcadas con Cache-Control: no-transform.
+  - Un ETag fuerte pasa a débil (W/"..."): la representación comprimida no es byte a byte
+    la misma que la original.
+"""
+import asyncio
+import gzip
+import zlib
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import brotli
+except ImportError:  # opcional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # opcional
+    zstandard = None
+
+TIPOS_COMPRIMIBLES = (
+    "text/", "application/json", "application/x-ndjson", "application/problem+json",
+    "application/javascript", "application/xml",
+)
+
+
+# -----------------------------
+# Codificadores
+# -----------------------------
+class _Flujo:
+    """Compresor incremental con interfaz común: comprimir(bloque) y terminar()."""
+
+    def __init__(self, comprimir: Callable[[bytes], bytes], terminar: Callable[[], bytes]):
+        self.comprimir = comprimir
+        self.terminar = terminar
+
+
+class Codificador:
+    def __init__(self, nombre: str, de_una_vez: Callable[[bytes], bytes], flujo: Callable[[], _Flujo]):
+        self.nombre = nombre
+        self.de_una_vez = de_una_vez
+        self.flujo = flujo
+
+
+def _gzip(nivel: int) -> Codificador:
+    def flujo() -> _Flujo:
+        c = zlib.compressobj(nivel, zlib.DEFLATED, 16 + zlib.MAX_WBITS)  # cabecera gzip
+        return _Flujo(c.compress, c.flush)
+    return Codificador("gzip", lambda datos: gzip.compress(datos, nivel, mtime=0), flujo)
+
+
+def _brotli(calidad: int) -> Codificador:
+    def flujo() -> _Flujo:
+        c = brotli.Compressor(quality=calidad)
+        return _Flujo(c.process, c.finish)
+    return Codificador("br", lambda datos: brotli.compress(datos, quality=calidad), flujo)
+
+
+def _zstd(nivel: int) -> Codificador:
+    # ZstdCompressor no es seguro entre hilos: uno nuevo por respuesta
+    def flujo() -> _Flujo:
+        c = zstandard.ZstdCompressor(level=nivel).compressobj()
+        return _Flujo(c.compress, c.flush)
+    return Codificador("zstd", lambda datos: zstandard.ZstdCompressor(level=nivel).compress(datos), flujo)
+
+
+def codificadores_disponibles(
+    preferencia: Sequence[str], nivel_gzip: int = 6, calidad_brotli: int = 4, nivel_zstd: int = 3
+) -> List[Codificador]:
+    """Codificadores instalados, en el orden de preferencia del servidor."""
+    fabricas = {
+        "gzip": lambda: _gzip(nivel_gzip),
+        "br": (lambda: _brotli(calidad_brotli)) if brotli is not None else None,
+        "zstd": (lambda: _zstd(nivel_zstd)) if zstandard is not None else None,
+    }
+    return [fabricas[n]() for n in preferencia if fabricas.get(n) is not None]
+
+
+def negociar(accept_encoding: Optional[str], codificadores: Sequence[Codificador]) -> Optional[Codificador]:
+    """
+    Primer codificador del servidor que el cliente acepta con q > 0 ('*' cubre los no listados).
+    None si no hay cabecera o ninguno es aceptable (se responde sin comprimir).
+    """
+    if not accept_encoding:
+        return None
+    calidades: Dict[str, float] = {}
+    for parte in accept_encoding.lower().split(","):
+        nombre, _, parametros = parte.strip().partition(";")
+        q = 1.0
+        parametros = parametros.strip()
+        if parametros.startswith("q="):
+            try:
+                q = float(parametros[2:])
+            except ValueError:
+                q = 0.0
+        if nombre:
+            calidades[nombre.strip()] = q
+    comodin = calidades.get("*", 0.0)
+    for c in codificadores:
+        if calidades.get(c.nombre, comodin) > 0:
+            return c
+    return None
+
+
+# -----------------------------
+# Middleware ASGI
+# -----------------------------
+def _comprimible(status: int, cabeceras: Dict[bytes, bytes]) -> bool:
+    if status < 200 or status in (204, 206, 304):
+        return False
+    if b"content-encoding" in cabeceras or b"no-transform" in cabeceras.get(b"cache-control", b""):
+        return False
+    tipo = cabeceras.get(b"content-type", b"").decode("latin-1").lower()
+    return tipo.startswith(TIPOS_COMPRIMIBLES)
+
+
+def _cabeceras_comprimidas(
+    headers: List[Tuple[bytes, bytes]], codificacion: str, longitud: Optional[int]
+) -> List[Tuple[bytes, bytes]]:
+    salida = []
+    vary = None
+    for k, v in headers:
+        nombre = k.lower()
+        if nombre == b"content-length":
+            continue
+        if nombre == b"vary":
+            vary = v
+            continue
+        if nombre == b"etag" and not v.startswith(b"W/"):
+            v = b"W/" + v
+        salida.append((k, v))
+    salida.append((b"content-encoding", codificacion.encode()))
+    salida.append((b"vary", b"Accept-Encoding" if vary is None else vary + b", Accept-Encoding"))
+    if longitud is not None:
+        salida.append((b"content-length", str(longitud).encode()))
+    return salida
+
+
+def _con_vary(headers: List[Tuple[bytes, bytes]]) -> List[Tuple[bytes, bytes]]:
+    # respuesta comprimible enviada sin comprimir (cuerpo pequeño): las cachés deben distinguirla igual
+    if any(k.lower() == b"vary" for k, _ in headers):
+        return [(k, v + b", Accept-Encoding" if k.lower() == b"vary" else v) for k, v in headers]
+    return [*headers, (b"vary", b"Accept-Encoding")]
+
+
+class CompresionMiddleware:
+    def __init__(self, app, codificadores: Sequence[Codificador], minimo_bytes: int = 1024,
+                 umbral_hilo: int = 256 * 1024):
+        self.app = app
+        self.codificadores = list(codificadores)
+        self.minimo_bytes = minimo_bytes
+        self.umbral_hilo = umbral_hilo
+
+    async def _ejecutar(self, fn: Callable[..., bytes], *args) -> bytes:
+        if sum(len(a) for a in args) >= self.umbral_hilo:
+            return await asyncio.to_thread(fn, *args)
+        return fn(*args)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.codificadores:
+            await self.app(scope, receive, send)
+            return
+        cabeceras_peticion = dict(scope.get("headers", []))
+        codificador = negociar(cabeceras_peticion.get(b"accept-encoding", b"").decode("latin-1"), self.codificadores)
+        if codificador is None:
+            await self.app(scope, receive, send)
+            return
+
+        inicio: Optional[dict] = None   # http.response.start retenido hasta ver el primer cuerpo
+        flujo: Optional[_Flujo] = None  # compresor incremental (respuestas en streaming)
+        directo = False                 # la respuesta pasa sin comprimir
+
+        async def send_comprimido(message):
+            nonlocal inicio, flujo, directo
+            tipo = message["type"]
+            if tipo == "http.response.start":
+                cabeceras = {k.lower(): v for k, v in message.get("headers", [])}
+                if not _comprimible(message["status"], cabeceras):
+                    directo = True
+                    await send(message)
+                    return
+                longitud = cabeceras.get(b"content-length")
+                if longitud is not None and longitud.isdigit() and int(longitud) < self.minimo_bytes:
+                    directo = True
+                    await send({**message, "headers": _con_vary(message.get("headers", []))})
+                    return
+                inicio = message
+                return
+            if tipo != "http.response.body" or directo:
+                await send(message)
+                return
+
+            cuerpo = message.get("body", b"")
+            mas = message.get("more_body", False)
+            headers = inicio.get("headers", []) if inicio is not None else []
+
+            if flujo is None and inicio is not None and not mas:
+                # 1) cuerpo único
+                inicio_retenido, inicio = inicio, None
+                if len(cuerpo) < self.minimo_bytes:
+                    directo = True
+                    await send({**inicio_retenido, "headers": _con_vary(headers)})
+                    await send(message)
+                    return
+                comprimido = await self._ejecutar(codificador.de_una_vez, cuerpo)
+                await send({**inicio_retenido, "headers": _cabeceras_comprimidas(headers, codificador.nombre, len(comprimido))})
+                await send({"type": "http.response.body", "body": comprimido, "more_body": False})
+                return
+
+            # 2) streaming: se comprime cada bloque y se cierra el flujo con el último
+            if flujo is None:
+                flujo = codificador.flujo()
+                await send({**inicio, "headers": _cabeceras_comprimidas(headers, codificador.nombre, None)})
+                inicio = None
+            salida = await self._ejecutar(flujo.comprimir, cuerpo) if cuerpo else b""
+            if not mas:
+                salida += flujo.terminar()
+            if salida or not mas:
+                await send({"type": "http.response.body", "body": salida, "more_body": mas})
+
+        await self.app(scope, receive, send_comprimido)
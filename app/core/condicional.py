@@ -0,0 +1,91 @@
+# app/core/condicional.py
+"""
+GET condicional (ETag / If-None-Match) para rutas de lectura que se consultan en bucle.
+
+El ETag es fuerte y se deriva de: nombre del endpoint + parámetros + versiones de las
+tablas (o entidad) que lee (app/db/versiones.py). Si el cliente envía un If-None-Match que
+coincide se responde 304 sin ejecutar la consulta ni serializar; el único acceso a la BD
+es la lectura de las versiones, en la misma sesión (primario o réplica) y antes de la
+consulta, así un ETag nunca describe datos más nuevos que los servidos.
+"""
+import copy
+import functools
+import hashlib
+import inspect
+import json
+from datetime import date
+from typing import Callable, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import versiones_peticion
+from app.core.descargas import etag_coincide, etag_fuerte
+from app.db.versiones import clave_entidad, clave_generacion, leer_versiones, versionado_activo
+
+
+def calcular_etag(nombre: str, params: Dict, versiones: Dict[str, int], por_dia: bool = False) -> str:
+    material = [nombre, sorted(params.items()), sorted(versiones.items())]
+    if por_dia:
+        material.append(date.today().isoformat())
+    digest = hashlib.blake2b(json.dumps(material, default=str).encode(), digest_size=16).hexdigest()
+    return etag_fuerte(digest)
+
+
+def condicional(*tablas: str, entidad: Optional[Tuple[str, str]] = None, por_dia: bool = False) -> Callable:
+    """
+    Decorador para endpoints async de lectura (por encima de cache_consultas.cachear).
+      - tablas: versiones de tabla de las que depende la respuesta.
+      - entidad: (tabla, parámetro con la PK), p. ej. ("Evento", "id_evento") para un detalle.
+      - por_dia: la respuesta depende de la fecha de hoy (p. ej. q6 sin fecha_base).
+    Añade a la firma Request y Response para leer If-None-Match y fijar el ETag. Llamado
+    directamente (sin esos argumentos, como hace /consultas/batch) no hace nada.
+    """
+    def decorador(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        async def wrapper(*args, peticion_http: Optional[Request] = None,
+                          respuesta_http: Optional[Response] = None, **kwargs):
+            session = next((v for v in kwargs.values() if isinstance(v, AsyncSession)), None)
+            # sin hooks de versionado (ETAGS_HABILITADOS off o sin migración 0004) no hay ETags
+            if peticion_http is None or session is None or not versionado_activo():
+                return await fn(*args, **kwargs)
+
+            claves = list(tablas)
+            if entidad is not None:
+                claves.append(clave_entidad(entidad[0], kwargs[entidad[1]]))
+                claves.append(clave_generacion(entidad[0]))
+            versiones = await leer_versiones(session, claves)
+            if versiones is None:
+                return await fn(*args, **kwargs)
+
+            params = {k: v for k, v in kwargs.items() if not isinstance(v, (AsyncSession, Session))}
+            etag = calcular_etag(fn.__name__, params, versiones, por_dia)
+            cabeceras = {"ETag": etag, "Cache-Control": "no-cache"}
+            if etag_coincide(peticion_http.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers=cabeceras)
+
+            token = versiones_peticion.set(tuple(sorted(versiones.items())))
+            try:
+                resultado = await fn(*args, **kwargs)
+            finally:
+                versiones_peticion.reset(token)
+            if isinstance(resultado, Response):
+                # respuesta ya serializada (quizá compartida por la caché): copia con las cabeceras
+                resultado = copy.copy(resultado)
+                resultado.raw_headers = [
+                    *(h for h in resultado.raw_headers if h[0] not in (b"etag", b"cache-control")),
+                    *((k.lower().encode(), v.encode()) for k, v in cabeceras.items()),
+                ]
+                return resultado
+            respuesta_http.headers.update(cabeceras)
+            return resultado
+
+        firma = inspect.signature(fn)
+        wrapper.__signature__ = firma.replace(parameters=[
+            *firma.parameters.values(),
+            inspect.Parameter("peticion_http", inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+            inspect.Parameter("respuesta_http", inspect.Parameter.KEYWORD_ONLY, annotation=Response),
+        ])
+        return wrapper
+    return decorador
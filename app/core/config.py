@@ -1,7 +1,7 @@
 # app/core/config.py
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
-from typing import List
+from typing import List, Literal, Optional
 
 class Settings(BaseSettings):
     # --- Base de datos ---
@@ -13,6 +13,185 @@ class Settings(BaseSettings):
         default=False,
         description="Activa el modo debug de SQLAlchemy (echo=True)"
     )
+    DB_POOL_SIZE: int = Field(
+        default=10,
+        ge=1,
+        description="Conexiones que el pool mantiene abiertas por proceso"
+    )
+    DB_MAX_OVERFLOW: int = Field(
+        default=10,
+        ge=0,
+        description="Conexiones extra permitidas por encima de DB_POOL_SIZE en picos"
+    )
+    DB_POOL_TIMEOUT: float = Field(
+        default=30.0,
+        gt=0,
+        description="Segundos de espera por una conexión libre antes de fallar"
+    )
+    DB_POOL_RECYCLE: int = Field(
+        default=1800,
+        description="Segundos tras los que se renueva una conexión (menor que wait_timeout de MySQL)"
+    )
+    DB_POOL_PRECALENTAR: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Conexiones que se abren al arrancar cada worker (None = DB_POOL_SIZE, 0 = ninguna)"
+    )
+    INSTRUMENTAR_SQL: bool = Field(
+        default=True,
+        description="Cuenta sentencias, tiempo en BD y filas modificadas por petición (cabecera Server-Timing + log 'app.peticiones')"
+    )
+    METRICAS_HABILITADAS: bool = Field(
+        default=True,
+        description="Expone GET /metrics (Prometheus): pool, latencia por ruta, duración por consulta y peticiones en curso"
+    )
+    REGISTRAR_CONSULTAS_LENTAS: bool = Field(
+        default=True,
+        description="Agrega por huella todas las sentencias SQL y registra en log las que superan el umbral"
+    )
+    CONSULTAS_LENTAS_UMBRAL_MS: float = Field(
+        default=200.0,
+        description="Duración (ms) a partir de la cual una sentencia se registra en el log 'app.consultas_lentas'"
+    )
+    CONSULTAS_LENTAS_MAX_HUELLAS: int = Field(
+        default=500,
+        ge=1,
+        description="Huellas distintas que se conservan en memoria (se descartan las de menor tiempo total)"
+    )
+    ADMIN_TOKEN: Optional[str] = Field(
+        default=None,
+        description="Token (Authorization: Bearer ...) de /api/v1/admin; sin token las rutas de admin no se montan"
+    )
+    MODO_ESTRICTO_CARGAS: Literal["off", "warn", "raise"] = Field(
+        default="off",
+        description="Detección de N+1: avisa ('warn') o falla ('raise') cuando una sesión repite una carga perezosa"
+    )
+    CARGAS_PEREZOSAS_UMBRAL: int = Field(
+        default=3,
+        ge=1,
+        description="Cargas perezosas de una misma relación en una sesión a partir de las cuales se avisa o falla"
+    )
+
+    # --- Réplica de lectura (opcional) ---
+    REPLICA_DATABASE_URL: Optional[str] = Field(
+        default=None,
+        description="URL de una réplica de MySQL para /consultas y listados/detalle GET (None = todo al primario)"
+    )
+    REPLICA_VENTANA_LECTURA_PROPIA: float = Field(
+        default=5.0,
+        ge=0,
+        description="Segundos tras un commit durante los que el cliente lee del primario (cookie leer_primario)"
+    )
+    REPLICA_REINTENTO_S: float = Field(
+        default=30.0,
+        ge=0,
+        description="Segundos que se usa el primario tras fallar la conexión a la réplica antes de reintentarla"
+    )
+    REPLICA_TIMEOUT_CONEXION: int = Field(
+        default=3,
+        ge=1,
+        description="Timeout (s) al abrir una conexión nueva con la réplica"
+    )
+
+    # --- Consultas analíticas ---
+    USAR_RESUMENES: bool = Field(
+        default=False,
+        description="Mantiene las tablas resumen en cada escritura y las usa en las consultas 1, 2, 4 y 8 "
+                    "(ejecutar 'python -m scripts.resumenes reconstruir' antes de activarlo)"
+    )
+    CACHE_CONSULTAS_MAX_ENTRADAS: int = Field(
+        default=512,
+        description="Máximo de respuestas de /consultas en la caché LRU (0 = desactivada)"
+    )
+    CACHE_CONSULTAS_TTL: float = Field(
+        default=60.0,
+        description="Segundos que vive una respuesta de /consultas en caché (0 = desactivada)"
+    )
+    CONSULTAS_UNA_SENTENCIA: bool = Field(
+        default=False,
+        description="Usa la forma de un solo round trip (CTEs / agregación condicional) de q2, q4, q5, q8, q9 y q10"
+    )
+    CONSULTAS_BATCH_CONCURRENCIA: int = Field(
+        default=4,
+        ge=1,
+        description="Consultas de un mismo POST /consultas/batch que se ejecutan a la vez"
+    )
+    CONSULTAS_PARALELAS: bool = Field(
+        default=False,
+        description="Ejecuta en paralelo (conexiones separadas) las sub-consultas independientes de q2, q4, q8, q9 y q10"
+    )
+    CONSULTAS_MAX_CONEXIONES_POR_PETICION: int = Field(
+        default=3,
+        ge=1,
+        description="Máximo de conexiones que una consulta usa a la vez en modo paralelo, incluida la de la petición (1 = en serie); DB_POOL_SIZE + DB_MAX_OVERFLOW debe cubrir peticiones concurrentes × este valor"
+    )
+
+    # --- Archivos (certificados) ---
+    BLOBS_BACKEND: Literal["local"] = Field(
+        default="local",
+        description="Backend del almacén de blobs direccionado por contenido"
+    )
+    BLOBS_DIR: str = Field(
+        default="./datos/blobs",
+        description="Directorio raíz del backend local de blobs"
+    )
+    CERTIFICADO_MAX_BYTES: int = Field(
+        default=10 * 1024 * 1024,
+        ge=1,
+        description="Tamaño máximo de un certificado subido (bytes); por encima se responde 413"
+    )
+    BLOBS_TAMANO_BLOQUE: int = Field(
+        default=64 * 1024,
+        ge=1024,
+        description="Tamaño de bloque (bytes) para subir y descargar archivos en streaming"
+    )
+
+    # --- Altas en lote ---
+    EVENTOS_LOTE_MAX: int = Field(
+        default=1000,
+        ge=1,
+        description="Máximo de eventos por POST /eventos/bulk"
+    )
+    REPRESENTANTES_LOTE_MAX: int = Field(
+        default=200,
+        ge=1,
+        description="Máximo de organizaciones por POST /eventos/{id}/organizaciones/bulk"
+    )
+    REPRESENTANTES_LOTE_MAX_BYTES: int = Field(
+        default=100 * 1024 * 1024,
+        ge=1,
+        description="Tamaño máximo del cuerpo multipart de POST /eventos/{id}/organizaciones/bulk; "
+                    "se rechaza (413) antes de leerlo"
+    )
+
+    # --- GET condicional ---
+    ETAGS_HABILITADOS: bool = Field(
+        default=True,
+        description="ETag y 304 (If-None-Match) en /eventos y /consultas, según los contadores de VersionDatos"
+    )
+
+    # --- Compresión de respuestas ---
+    COMPRESION_HABILITADA: bool = Field(
+        default=True,
+        description="Comprime las respuestas de texto según Accept-Encoding"
+    )
+    COMPRESION_ALGORITMOS: List[Literal["zstd", "br", "gzip"]] = Field(
+        default=["zstd", "br", "gzip"],
+        description="Orden de preferencia del servidor; br y zstd requieren los paquetes brotli y zstandard"
+    )
+    COMPRESION_MINIMO_BYTES: int = Field(
+        default=1024,
+        ge=0,
+        description="Cuerpos más pequeños se envían sin comprimir"
+    )
+    COMPRESION_UMBRAL_HILO: int = Field(
+        default=256 * 1024,
+        ge=0,
+        description="A partir de este tamaño (bytes por cuerpo o bloque) se comprime en un hilo aparte"
+    )
+    COMPRESION_NIVEL_GZIP: int = Field(default=6, ge=1, le=9, description="Nivel de gzip")
+    COMPRESION_CALIDAD_BROTLI: int = Field(default=4, ge=0, le=11, description="Calidad de brotli")
+    COMPRESION_NIVEL_ZSTD: int = Field(default=3, ge=1, le=22, description="Nivel de zstd")
 
     # --- App / OpenAPI ---
     APP_NAME: str = Field(
@@ -0,0 +1,49 @@
+# app/core/descargas.py
+"""
+Utilidades HTTP para descargas: ETag / If-None-Match (304) y Range de un solo intervalo (206).
+"""
+from typing import Optional, Tuple
+
+
+class RangoNoSatisfacible(Exception):
+    pass
+
+
+def etag_fuerte(valor: str) -> str:
+    return f'"{valor}"'
+
+
+def etag_coincide(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match admite '*' o una lista separada por comas (con o sin prefijo débil W/)."""
+    if not if_none_match:
+        return False
+    candidatos = [c.strip() for c in if_none_match.split(",")]
+    return "*" in candidatos or any(c.removeprefix("W/") == etag for c in candidatos)
+
+
+def parsear_rango(range_header: Optional[str], tamano: int) -> Optional[Tuple[int, int]]:
+    """
+    (inicio, fin) inclusivos para 'bytes=a-b', 'bytes=a-' o 'bytes=-n'; None si no hay cabecera,
+    no es de bytes o pide varios intervalos (se responde el recurso completo, como permite RFC 9110).
+    Lanza RangoNoSatisfacible (416) si el intervalo cae fuera del recurso.
+    """
+    if not range_header or not range_header.startswith("bytes="):
+        return None
+    especificacion = range_header[len("bytes="):].strip()
+    if "," in especificacion:
+        return None
+    inicio_txt, _, fin_txt = especificacion.partition("-")
+    try:
+        if inicio_txt == "":
+            sufijo = int(fin_txt)
+            if sufijo <= 0:
+                raise RangoNoSatisfacible(especificacion)
+            inicio, fin = max(tamano - sufijo, 0), tamano - 1
+        else:
+            inicio = int(inicio_txt)
+            fin = int(fin_txt) if fin_txt else tamano - 1
+    except ValueError:
+        return None  # sintaxis inválida: se ignora la cabecera
+    if inicio >= tamano or fin < inicio:
+        raise RangoNoSatisfacible(especificacion)
+    return inicio, min(fin, tamano - 1)
@@ -0,0 +1,220 @@
+# app/core/metricas.py
+"""
+Métricas del proceso en formato de texto de Prometheus (GET /metrics).
+
+  - Pool de conexiones: tamaño, conexiones en uso, overflow y tiempo de espera al pedir una,
+    por motor (etiqueta motor="primario" | "replica").
+  - Latencia por ruta (histograma por método, plantilla de ruta y status).
+  - Duración de cada consulta analítica (histograma por nombre de consulta).
+  - Peticiones en curso.
+
+Pensado para estar siempre activo: registrar una observación es un bisect y un par de
+sumas en memoria (sin locks: todo corre en el hilo del event loop). Los gauges del pool
+se leen del propio pool en el momento del scrape. Con varios workers, cada proceso
+expone sus propias series.
+"""
+import bisect
+import functools
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# buckets en segundos (convención de Prometheus)
+BUCKETS_LATENCIA = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BUCKETS_ESPERA_POOL = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+
+def _etiquetas(nombres: Tuple[str, ...], valores: Tuple[str, ...], extra: str = "") -> str:
+    pares = [f'{n}="{_escapar(v)}"' for n, v in zip(nombres, valores)]
+    if extra:
+        pares.append(extra)
+    return "{" + ",".join(pares) + "}" if pares else ""
+
+
+def _escapar(valor: str) -> str:
+    return str(valor).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _num(valor: float) -> str:
+    return "+Inf" if valor == float("inf") else repr(float(valor))
+
+
+class Histograma:
+    def __init__(self, nombre: str, ayuda: str, etiquetas: Tuple[str, ...] = (), buckets: Tuple[float, ...] = BUCKETS_LATENCIA):
+        self.nombre = nombre
+        self.ayuda = ayuda
+        self.etiquetas = etiquetas
+        self.buckets = buckets
+        # valores de etiquetas -> [conteos por bucket (no acumulados, + el de +Inf), suma]
+        self._series: Dict[Tuple[str, ...], List] = {}
+
+    def observar(self, valor: float, *valores_etiquetas: str) -> None:
+        serie = self._series.get(valores_etiquetas)
+        if serie is None:
+            serie = self._series[valores_etiquetas] = [[0] * (len(self.buckets) + 1), 0.0]
+        serie[0][bisect.bisect_left(self.buckets, valor)] += 1
+        serie[1] += valor
+
+    def exponer(self) -> List[str]:
+        lineas = [f"# HELP {self.nombre} {self.ayuda}", f"# TYPE {self.nombre} histogram"]
+        for valores, (conteos, suma) in sorted(self._series.items()):
+            acumulado = 0
+            for limite, n in zip((*self.buckets, float("inf")), conteos):
+                acumulado += n
+                le = 'le="%s"' % _num(limite)
+                lineas.append(f"{self.nombre}_bucket{_etiquetas(self.etiquetas, valores, le)} {acumulado}")
+            lineas.append(f"{self.nombre}_sum{_etiquetas(self.etiquetas, valores)} {_num(suma)}")
+            lineas.append(f"{self.nombre}_count{_etiquetas(self.etiquetas, valores)} {acumulado}")
+        return lineas
+
+
+class Gauge:
+    """
+    Gauge con valor propio (inc/dec) o calculado en cada scrape (funcion). Con etiquetas,
+    cada serie es una función registrada con serie(funcion, *valores_etiquetas).
+    """
+
+    def __init__(self, nombre: str, ayuda: str, funcion: Optional[Callable[[], float]] = None,
+                 etiquetas: Tuple[str, ...] = ()):
+        self.nombre = nombre
+        self.ayuda = ayuda
+        self.funcion = funcion
+        self.etiquetas = etiquetas
+        self.valor = 0.0
+        self._series: Dict[Tuple[str, ...], Callable[[], float]] = {}
+
+    def serie(self, funcion: Callable[[], float], *valores_etiquetas: str) -> None:
+        self._series[valores_etiquetas] = funcion
+
+    def inc(self, n: float = 1) -> None:
+        self.valor += n
+
+    def dec(self, n: float = 1) -> None:
+        self.valor -= n
+
+    def exponer(self) -> List[str]:
+        lineas = [f"# HELP {self.nombre} {self.ayuda}", f"# TYPE {self.nombre} gauge"]
+        if self.etiquetas:
+            for valores, funcion in sorted(self._series.items()):
+                lineas.append(f"{self.nombre}{_etiquetas(self.etiquetas, valores)} {_num(funcion())}")
+            return lineas
+        valor = self.funcion() if self.funcion is not None else self.valor
+        lineas.append(f"{self.nombre} {_num(valor)}")
+        return lineas
+
+
+class Registro:
+    def __init__(self):
+        self._metricas: Dict[str, object] = {}
+
+    def registrar(self, metrica):
+        self._metricas[metrica.nombre] = metrica
+        return metrica
+
+    def exponer(self) -> str:
+        return "\n".join(l for m in self._metricas.values() for l in m.exponer()) + "\n"
+
+
+registro = Registro()
+
+latencia_rutas = registro.registrar(Histograma(
+    "http_request_duration_seconds", "Latencia de las peticiones HTTP por ruta",
+    ("metodo", "ruta", "status"),
+))
+peticiones_en_curso = registro.registrar(Gauge(
+    "http_requests_in_flight", "Peticiones HTTP en curso",
+))
+duracion_consultas = registro.registrar(Histograma(
+    "consulta_duration_seconds", "Duración de las consultas analíticas (sin caché)",
+    ("consulta",),
+))
+espera_pool = registro.registrar(Histograma(
+    "db_pool_wait_seconds", "Tiempo de espera para obtener una conexión del pool",
+    ("motor",), buckets=BUCKETS_ESPERA_POOL,
+))
+tamano_pool = registro.registrar(Gauge("db_pool_size", "Tamaño configurado del pool", etiquetas=("motor",)))
+conexiones_en_uso = registro.registrar(Gauge("db_pool_checked_out", "Conexiones del pool en uso", etiquetas=("motor",)))
+overflow_pool = registro.registrar(Gauge(
+    "db_pool_overflow", "Conexiones abiertas por encima de pool_size", etiquetas=("motor",),
+))
+
+
+# -----------------------------
+# Pool de conexiones
+# -----------------------------
+class PoolConMetricas(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool que mide cuánto se espera para obtener una conexión."""
+
+    motor = "primario"  # etiqueta de las series; la réplica usa una subclase
+
+    def _do_get(self):
+        t0 = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            espera_pool.observar(time.perf_counter() - t0, self.motor)
+
+
+def registrar_pool(sync_engine, motor: str = "primario") -> None:
+    """Gauges del pool (series con motor=`motor`) leídos en cada scrape, sin coste en la petición."""
+    # se consulta sync_engine.pool en cada scrape: engine.dispose() sustituye el pool
+    def _leer(atributo: str) -> Callable[[], float]:
+        def leer() -> float:
+            pool = sync_engine.pool
+            return getattr(pool, atributo)() if isinstance(pool, AsyncAdaptedQueuePool) else 0
+        return leer
+
+    tamano_pool.serie(_leer("size"), motor)
+    conexiones_en_uso.serie(_leer("checkedout"), motor)
+    # overflow() es negativo mientras el pool no ha abierto todas sus conexiones base
+    overflow = _leer("overflow")
+    overflow_pool.serie(lambda: max(overflow(), 0), motor)
+
+
+# -----------------------------
+# Consultas
+# -----------------------------
+def medir_consulta(nombre: str, fn: Callable) -> Callable:
+    @functools.wraps(fn)
+    async def envoltura(*args, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            duracion_consultas.observar(time.perf_counter() - t0, nombre)
+
+    return envoltura
+
+
+# -----------------------------
+# Middleware ASGI
+# -----------------------------
+class MetricasMiddleware:
+    """Latencia por plantilla de ruta (no por URL concreta, para acotar la cardinalidad) y peticiones en curso."""
+
+    def __init__(self, app, excluir: Iterable[str] = ("/metrics",)):
+        self.app = app
+        self.excluir = frozenset(excluir)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.excluir:
+            await self.app(scope, receive, send)
+            return
+
+        t0 = time.perf_counter()
+        status = 500
+        peticiones_en_curso.inc()
+
+        async def send_medido(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_medido)
+        finally:
+            peticiones_en_curso.dec()
+            ruta = getattr(scope.get("route"), "path", "<sin_ruta>")
+            latencia_rutas.observar(time.perf_counter() - t0, scope["method"], ruta, str(status))
@@ -0,0 +1,45 @@
+# app/core/serializacion.py
+"""
+Camino rápido de serialización para respuestas grandes (listas de miles de filas).
+
+El camino normal de FastAPI con response_model hace, por fila: objeto ORM -> modelo
+Pydantic -> dict (jsonable_encoder) -> json.dumps. Aquí:
+
+  - las filas llegan como tuplas de columnas (Row de SQLAlchemy, sin objetos ORM),
+  - se validan en bloque con un TypeAdapter cacheado por tipo (pydantic-core, en Rust),
+  - y se codifican a JSON con el mismo adaptador (dump_json), sin pasar por dicts intermedios.
+
+El endpoint conserva su response_model para la documentación; como devuelve un Response
+ya serializado, FastAPI no vuelve a validar ni a codificar.
+"""
+from functools import lru_cache
+from typing import Any, Iterable, List, Type
+
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def adaptador(tipo: Any) -> TypeAdapter:
+    """TypeAdapter por tipo: construir el validador es caro, reutilizarlo no."""
+    return TypeAdapter(tipo)
+
+
+class RespuestaJSONCruda(Response):
+    """Cuerpo JSON ya codificado (bytes)."""
+    media_type = "application/json"
+
+
+def serializar(tipo: Any, datos: Any) -> bytes:
+    a = adaptador(tipo)
+    # from_attributes: acepta Row de SQLAlchemy y objetos ORM además de dicts
+    return a.dump_json(a.validate_python(datos, from_attributes=True))
+
+
+def respuesta_lista(tipo: Type, filas: Iterable[Any]) -> RespuestaJSONCruda:
+    """Lista de `tipo` validada y codificada en bloque."""
+    return RespuestaJSONCruda(serializar(List[tipo], list(filas)))
+
+
+def respuesta_modelo(tipo: Type, datos: Any) -> RespuestaJSONCruda:
+    return RespuestaJSONCruda(serializar(tipo, datos))
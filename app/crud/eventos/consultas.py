@@ -12,6 +12,8 @@ from app.models.eventos.evento_responsable import EventoResponsableModel
 from app.models.eventos.instalacion_evento import InstalacionEventoModel
 from app.models.usuarios.usuario import UsuarioModel
 from app.models.usuarios.credencial import CredencialModel
+from app.db.paralelo import ejecutar_independientes
+from app.crud.eventos.evento import COLUMNAS_EVENTO
 
 
 
@@ -33,14 +35,15 @@ async def q1_eventos_por_organizacion(session: AsyncSession, id_organizacion: in
 
 
 # 2) Para una instalación: n° de eventos, tipo más frecuente, y organizadores por tipo
-async def q2_resumen_por_instalacion(session: AsyncSession, id_instalacion: int) -> Dict[str, Any]:
+async def q2_resumen_por_instalacion(
+    session: AsyncSession, id_instalacion: int, paralelo: Optional[bool] = None
+) -> Dict[str, Any]:
     # total de eventos en la instalación
     total_stmt = (
         select(func.count().label("total"))
         .select_from(InstalacionEventoModel)
         .where(InstalacionEventoModel.id_instalacion == id_instalacion)
     )
-    total = (await session.execute(total_stmt)).scalar_one()
 
     # frecuencia por tipo
     tipo_stmt = (
@@ -49,9 +52,6 @@ async def q2_resumen_por_instalacion(session: AsyncSession, id_instalacion: int)
         .where(InstalacionEventoModel.id_instalacion == id_instalacion)
         .group_by(EventoModel.tipo)
     )
-    tipo_rows = (await session.execute(tipo_stmt)).all()
-    freq_por_tipo = {t.value if isinstance(t, TipoEventoEnum) else t: n for (t, n) in tipo_rows}
-    tipo_mas_frecuente = max(freq_por_tipo, key=freq_por_tipo.get) if freq_por_tipo else None
 
     # organizadores según tipo
     org_stmt = (
@@ -61,7 +61,16 @@ async def q2_resumen_por_instalacion(session: AsyncSession, id_instalacion: int)
         .where(InstalacionEventoModel.id_instalacion == id_instalacion)
         .group_by(EventoModel.tipo)
     )
-    org_rows = (await session.execute(org_stmt)).all()
+
+    # las tres sentencias son independientes
+    total_res, tipo_res, org_res = await ejecutar_independientes(
+        session, total_stmt, tipo_stmt, org_stmt, paralelo=paralelo
+    )
+    total = total_res.scalar_one()
+    tipo_rows = tipo_res.all()
+    freq_por_tipo = {t.value if isinstance(t, TipoEventoEnum) else t: n for (t, n) in tipo_rows}
+    tipo_mas_frecuente = max(freq_por_tipo, key=freq_por_tipo.get) if freq_por_tipo else None
+    org_rows = org_res.all()
     organizadores_por_tipo = {t.value if isinstance(t, TipoEventoEnum) else t: n for (t, n) in org_rows}
 
     return {
@@ -78,14 +87,20 @@ async def q3_pendientes_por_periodo(
     desde: date,
     hasta: date,
     estado_pendiente: EstadoEventoEnum = EstadoEventoEnum.EN_REVISION,
+    solo_columnas: bool = False,
 ) -> Sequence[EventoModel]:
+    filtros = (
+        EventoModel.estado == estado_pendiente,
+        EventoModel.fecha_inicio >= desde,
+        EventoModel.fecha_inicio <= hasta,
+    )
+    if solo_columnas:
+        # tuplas con las columnas del schema Evento: sin objetos ORM ni relaciones (el endpoint no las expone)
+        stmt = select(*COLUMNAS_EVENTO).where(*filtros).order_by(EventoModel.fecha_inicio.asc())
+        return (await session.execute(stmt)).all()
     stmt = (
         select(EventoModel)
-        .where(
-            EventoModel.estado == estado_pendiente,
-            EventoModel.fecha_inicio >= desde,
-            EventoModel.fecha_inicio <= hasta,
-        )
+        .where(*filtros)
         .order_by(EventoModel.fecha_inicio.asc())
         .options(
             selectinload(EventoModel.responsables),
@@ -97,12 +112,12 @@ async def q3_pendientes_por_periodo(
 
 
 # 4) Instalación más asignada + frecuencias de tipo allí + total organizadores
-async def q4_instalacion_top_y_detalle(session: AsyncSession) -> Dict[str, Any]:
+async def q4_instalacion_top_y_detalle(session: AsyncSession, paralelo: Optional[bool] = None) -> Dict[str, Any]:
     # instalación con más asignaciones
     top_stmt = (
         select(InstalacionEventoModel.id_instalacion, func.count().label("n"))
         .group_by(InstalacionEventoModel.id_instalacion)
-        .order_by(desc("n"))
+        .order_by(desc("n"), InstalacionEventoModel.id_instalacion)  # desempate determinista
         .limit(1)
     )
     top_row = (await session.execute(top_stmt)).first()
@@ -117,8 +132,6 @@ async def q4_instalacion_top_y_detalle(session: AsyncSession) -> Dict[str, Any]:
         .where(InstalacionEventoModel.id_instalacion == id_instalacion)
         .group_by(EventoModel.tipo)
     )
-    freq_rows = (await session.execute(freq_stmt)).all()
-    frecuencia_por_tipo = {t.value if isinstance(t, TipoEventoEnum) else t: n for (t, n) in freq_rows}
 
     # organizadores totales (distintos) que han hecho parte de un evento en esa instalación
     org_stmt = (
@@ -127,7 +140,12 @@ async def q4_instalacion_top_y_detalle(session: AsyncSession) -> Dict[str, Any]:
         .join(InstalacionEventoModel, InstalacionEventoModel.id_evento == EventoModel.id_evento)
         .where(InstalacionEventoModel.id_instalacion == id_instalacion)
     )
-    organizadores_totales = (await session.execute(org_stmt)).scalar_one()
+
+    # ambas dependen solo de la instalación top: independientes entre sí
+    freq_res, org_res = await ejecutar_independientes(session, freq_stmt, org_stmt, paralelo=paralelo)
+    freq_rows = freq_res.all()
+    frecuencia_por_tipo = {t.value if isinstance(t, TipoEventoEnum) else t: n for (t, n) in freq_rows}
+    organizadores_totales = org_res.scalar_one()
 
     return {
         "id_instalacion": id_instalacion,
@@ -228,10 +246,9 @@ async def q7_proporcion_representantes_por_rol_organizador(session: AsyncSession
 
 
 # 8) Conteo de usuarios por rol y comparación con el rol que más participa organizando eventos
-async def q8_usuarios_por_rol_y_mas_participa(session: AsyncSession) -> Dict[str, Any]:
+async def q8_usuarios_por_rol_y_mas_participa(session: AsyncSession, paralelo: Optional[bool] = None) -> Dict[str, Any]:
     # usuarios por rol
     u_stmt = select(UsuarioModel.rol, func.count().label("n")).group_by(UsuarioModel.rol)
-    usuarios_por_rol = {rol: n for (rol, n) in (await session.execute(u_stmt)).all()}
 
     # participación por rol (usuarios que han organizado al menos un evento)
     part_stmt = (
@@ -239,7 +256,10 @@ async def q8_usuarios_por_rol_y_mas_participa(session: AsyncSession) -> Dict[str
         .join(EventoResponsableModel, EventoResponsableModel.id_usuario == UsuarioModel.id_usuario)
         .group_by(UsuarioModel.rol)
     )
-    participa_por_rol = {rol: n for (rol, n) in (await session.execute(part_stmt)).all()}
+
+    u_res, part_res = await ejecutar_independientes(session, u_stmt, part_stmt, paralelo=paralelo)
+    usuarios_por_rol = {rol: n for (rol, n) in u_res.all()}
+    participa_por_rol = {rol: n for (rol, n) in part_res.all()}
 
     tipo_mas_registrado = max(usuarios_por_rol, key=usuarios_por_rol.get) if usuarios_por_rol else None
     tipo_que_mas_participa = max(participa_por_rol, key=participa_por_rol.get) if participa_por_rol else None
@@ -256,7 +276,8 @@ async def q8_usuarios_por_rol_y_mas_participa(session: AsyncSession) -> Dict[str
 async def q9_top5_usuarios_activos(
     session: AsyncSession,
     desde: date,
-    hasta: date
+    hasta: date,
+    paralelo: Optional[bool] = None,
 ) -> List[Dict[str, Any]]:
     # total de eventos por usuario en el periodo
     base_evt = (
@@ -267,7 +288,7 @@ async def q9_top5_usuarios_activos(
         .join(EventoModel, EventoModel.id_evento == EventoResponsableModel.id_evento)
         .where(EventoModel.fecha_inicio >= desde, EventoModel.fecha_inicio <= hasta)
         .group_by(EventoResponsableModel.id_usuario)
-        .order_by(desc("n_eventos"))
+        .order_by(desc("n_eventos"), EventoResponsableModel.id_usuario)  # desempate determinista
         .limit(5)
     )
     top = (await session.execute(base_evt)).all()
@@ -289,14 +310,8 @@ async def q9_top5_usuarios_activos(
             EventoModel.fecha_inicio >= desde, EventoModel.fecha_inicio <= hasta
         )
         .group_by(EventoResponsableModel.id_usuario, InstalacionEventoModel.id_instalacion)
-        .order_by(EventoResponsableModel.id_usuario, desc("n"))
+        .order_by(EventoResponsableModel.id_usuario, desc("n"), InstalacionEventoModel.id_instalacion)
     )
-    inst_rows = (await session.execute(inst_stmt)).all()
-    # elegir la de mayor n por usuario
-    top_inst_por_usuario = {}
-    for uid, id_inst, n in inst_rows:
-        if uid not in top_inst_por_usuario:
-            top_inst_por_usuario[uid] = {"id_instalacion": id_inst, "uso": n}
 
     # % por tipo para cada usuario
     tipo_stmt = (
@@ -312,7 +327,17 @@ async def q9_top5_usuarios_activos(
         )
         .group_by(EventoResponsableModel.id_usuario, EventoModel.tipo)
     )
-    tipo_rows = (await session.execute(tipo_stmt)).all()
+
+    # instalaciones y tipos dependen solo de top_ids: independientes entre sí
+    inst_res, tipo_res = await ejecutar_independientes(session, inst_stmt, tipo_stmt, paralelo=paralelo)
+    inst_rows = inst_res.all()
+    # elegir la de mayor n por usuario
+    top_inst_por_usuario = {}
+    for uid, id_inst, n in inst_rows:
+        if uid not in top_inst_por_usuario:
+            top_inst_por_usuario[uid] = {"id_instalacion": id_inst, "uso": n}
+
+    tipo_rows = tipo_res.all()
     conteos_tipo = {}
     for uid, t, n in tipo_rows:
         tval = t.value if isinstance(t, TipoEventoEnum) else t
@@ -340,14 +365,14 @@ async def q9_top5_usuarios_activos(
 
 
 # 10) Tasa de rechazo inicial y promedio de revisiones hasta aprobación final (por tipo de evento)
-async def q10_rechazo_inicial_y_revisiones(session: AsyncSession) -> List[Dict[str, Any]]:
+async def q10_rechazo_inicial_y_revisiones(session: AsyncSession, paralelo: Optional[bool] = None) -> List[Dict[str, Any]]:
     from app.models.eventos.evaluacion import EvaluacionModel
 
     # Row number por evento por fecha_evaluacion
     # MySQL 8+ soporta window functions
     rn = func.row_number().over(
         partition_by=EvaluacionModel.id_evento,
-        order_by=EvaluacionModel.fecha_evaluacion.asc()
+        order_by=(EvaluacionModel.fecha_evaluacion.asc(), EvaluacionModel.id_evaluacion.asc())
     )
 
     # primera evaluación de cada evento + tipo
@@ -380,17 +405,10 @@ async def q10_rechazo_inicial_y_revisiones(session: AsyncSession) -> List[Dict[s
         .group_by(sub_first.c.tipo)
     )
 
-    first_rows = (await session.execute(first_agg)).all()
-    rechazo_inicial = {}
-    for tipo, rej_ini, con_eval in first_rows:
-        tval = tipo.value if isinstance(tipo, TipoEventoEnum) else tipo
-        tasa = (rej_ini / con_eval) * 100 if con_eval else 0
-        rechazo_inicial[tval] = {"rechazos_iniciales": rej_ini, "con_evaluacion": con_eval, "tasa_pct": tasa}
-
     # revisiones hasta la aprobación: posición de la primera 'aprobado'
     rn_aprob = func.row_number().over(
         partition_by=EvaluacionModel.id_evento,
-        order_by=EvaluacionModel.fecha_evaluacion.asc()
+        order_by=(EvaluacionModel.fecha_evaluacion.asc(), EvaluacionModel.id_evaluacion.asc())
     )
     sub_rev = (
         select(
@@ -411,7 +429,16 @@ async def q10_rechazo_inicial_y_revisiones(session: AsyncSession) -> List[Dict[s
         .where(sub_rev.c.estado == "aprobado")
         .group_by(sub_rev.c.tipo)
     )
-    aprob_rows = (await session.execute(aprob_min)).all()
+
+    first_res, aprob_res = await ejecutar_independientes(session, first_agg, aprob_min, paralelo=paralelo)
+    first_rows = first_res.all()
+    rechazo_inicial = {}
+    for tipo, rej_ini, con_eval in first_rows:
+        tval = tipo.value if isinstance(tipo, TipoEventoEnum) else tipo
+        tasa = (rej_ini / con_eval) * 100 if con_eval else 0
+        rechazo_inicial[tval] = {"rechazos_iniciales": rej_ini, "con_evaluacion": con_eval, "tasa_pct": tasa}
+
+    aprob_rows = aprob_res.all()
     revisiones = { (t.value if isinstance(t, TipoEventoEnum) else t): float(p or 0) for (t, p) in aprob_rows }
 
     # merge final por tipo
@@ -0,0 +1,115 @@
+# app/crud/eventos/consultas_resumen.py
+"""
+Versiones de las consultas 1, 2, 4 y 8 que leen las tablas resumen en lugar de
+agregar Evento/Representante/InstalacionEvento/EventoResponsable.
+Devuelven exactamente la misma forma que app/crud/eventos/consultas.py.
+"""
+from typing import Dict, Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, desc
+
+from app.models.eventos.evento import TipoEventoEnum
+from app.models.eventos.resumen import (
+    ResumenOrganizacionTipoModel,
+    ResumenInstalacionTipoModel,
+    ResumenUsuarioTipoModel,
+    ResumenInstalacionOrganizadorModel,
+)
+from app.models.usuarios.usuario import UsuarioModel
+
+
+def _por_tipo(rows) -> Dict[str, int]:
+    return {t.value if isinstance(t, TipoEventoEnum) else t: n for (t, n) in rows}
+
+
+# 1) Por organización externa: total de eventos y si participa más en lúdicos o académicos.
+async def q1_eventos_por_organizacion(session: AsyncSession, id_organizacion: int) -> Dict[str, Any]:
+    r = ResumenOrganizacionTipoModel
+    stmt = select(r.tipo, r.n_eventos).where(r.id_organizacion == id_organizacion, r.n_eventos > 0)
+    por_tipo = _por_tipo((await session.execute(stmt)).all())
+    total = sum(por_tipo.values()) if por_tipo else 0
+    predominante = max(por_tipo.items(), key=lambda x: x[1])[0] if por_tipo else None
+    return {"id_organizacion": id_organizacion, "total": total, "por_tipo": por_tipo, "predominante": predominante}
+
+
+# 2) Para una instalación: n° de eventos, tipo más frecuente, y organizadores por tipo
+async def q2_resumen_por_instalacion(session: AsyncSession, id_instalacion: int) -> Dict[str, Any]:
+    r = ResumenInstalacionTipoModel
+    tipo_stmt = select(r.tipo, r.n_eventos).where(r.id_instalacion == id_instalacion, r.n_eventos > 0)
+    freq_por_tipo = _por_tipo((await session.execute(tipo_stmt)).all())
+    tipo_mas_frecuente = max(freq_por_tipo, key=freq_por_tipo.get) if freq_por_tipo else None
+
+    o = ResumenInstalacionOrganizadorModel
+    org_stmt = (
+        select(o.tipo, func.count().label("organizadores"))
+        .where(o.id_instalacion == id_instalacion, o.n_eventos > 0)
+        .group_by(o.tipo)
+    )
+    organizadores_por_tipo = _por_tipo((await session.execute(org_stmt)).all())
+
+    return {
+        "id_instalacion": id_instalacion,
+        "total_eventos": sum(freq_por_tipo.values()),
+        "tipo_mas_frecuente": tipo_mas_frecuente,
+        "organizadores_por_tipo": organizadores_por_tipo,
+    }
+
+
+# 4) Instalación más asignada + frecuencias de tipo allí + total organizadores
+async def q4_instalacion_top_y_detalle(session: AsyncSession) -> Dict[str, Any]:
+    r = ResumenInstalacionTipoModel
+    top_stmt = (
+        select(r.id_instalacion, func.sum(r.n_eventos).label("n"))
+        .group_by(r.id_instalacion)
+        .having(func.sum(r.n_eventos) > 0)
+        .order_by(desc("n"), r.id_instalacion)  # mismo desempate que la consulta cruda
+        .limit(1)
+    )
+    top_row = (await session.execute(top_stmt)).first()
+    if not top_row:
+        return {"id_instalacion": None, "total_eventos": 0, "frecuencia_por_tipo": {}, "organizadores_totales": 0}
+    id_instalacion, total_eventos = top_row
+
+    freq_stmt = select(r.tipo, r.n_eventos).where(r.id_instalacion == id_instalacion, r.n_eventos > 0)
+    frecuencia_por_tipo = _por_tipo((await session.execute(freq_stmt)).all())
+
+    o = ResumenInstalacionOrganizadorModel
+    org_stmt = (
+        select(func.count(func.distinct(o.id_usuario)))
+        .where(o.id_instalacion == id_instalacion, o.n_eventos > 0)
+    )
+    organizadores_totales = (await session.execute(org_stmt)).scalar_one()
+
+    return {
+        "id_instalacion": id_instalacion,
+        "total_eventos": int(total_eventos),
+        "frecuencia_por_tipo": frecuencia_por_tipo,
+        "organizadores_totales": organizadores_totales,
+    }
+
+
+# 8) Conteo de usuarios por rol y comparación con el rol que más participa organizando eventos
+async def q8_usuarios_por_rol_y_mas_participa(session: AsyncSession) -> Dict[str, Any]:
+    # usuarios por rol (tabla de dimensión, no de hechos)
+    u_stmt = select(UsuarioModel.rol, func.count().label("n")).group_by(UsuarioModel.rol)
+    usuarios_por_rol = {rol: n for (rol, n) in (await session.execute(u_stmt)).all()}
+
+    r = ResumenUsuarioTipoModel
+    part_stmt = (
+        select(UsuarioModel.rol, func.count(func.distinct(r.id_usuario)).label("n"))
+        .join(UsuarioModel, UsuarioModel.id_usuario == r.id_usuario)
+        .where(r.n_eventos > 0)
+        .group_by(UsuarioModel.rol)
+    )
+    participa_por_rol = {rol: n for (rol, n) in (await session.execute(part_stmt)).all()}
+
+    tipo_mas_registrado = max(usuarios_por_rol, key=usuarios_por_rol.get) if usuarios_por_rol else None
+    tipo_que_mas_participa = max(participa_por_rol, key=participa_por_rol.get) if participa_por_rol else None
+
+    return {
+        "usuarios_por_rol": usuarios_por_rol,
+        "participa_por_rol": participa_por_rol,
+        "tipo_mas_registrado": tipo_mas_registrado,
+        "tipo_que_mas_participa": tipo_que_mas_participa,
+    }
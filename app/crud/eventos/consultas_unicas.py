@@ -0,0 +1,232 @@
+# app/crud/eventos/consultas_unicas.py
+"""
+Formas de una sola sentencia (un round trip) de las consultas que en
+app/crud/eventos/consultas.py emiten varias: q2, q4, q5, q8, q9 y q10.
+Usan CTEs, agregación condicional y UNION ALL; devuelven la misma forma de salida.
+Requiere MySQL 8+ (CTEs y funciones ventana).
+"""
+from typing import Dict, Any, List
+from datetime import date
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, case, desc, literal, exists
+from sqlalchemy.orm import aliased
+
+from app.models.eventos.evento import EventoModel, TipoEventoEnum
+from app.models.eventos.representante import RepresentanteModel
+from app.models.eventos.evento_responsable import EventoResponsableModel
+from app.models.eventos.instalacion_evento import InstalacionEventoModel
+from app.models.eventos.evaluacion import EvaluacionModel
+from app.models.usuarios.usuario import UsuarioModel
+from app.models.usuarios.docente import DocenteModel
+from app.models.usuarios.estudiante import EstudianteModel
+
+
+def _tval(t):
+    return t.value if isinstance(t, TipoEventoEnum) else t
+
+
+# 2) total, frecuencia por tipo y organizadores por tipo en un solo GROUP BY
+async def q2_resumen_por_instalacion(session: AsyncSession, id_instalacion: int) -> Dict[str, Any]:
+    stmt = (
+        select(
+            EventoModel.tipo,
+            # (id_evento, id_instalacion) es PK: con la instalación fija, cada evento cuenta una vez
+            func.count(func.distinct(InstalacionEventoModel.id_evento)).label("n"),
+            func.count(func.distinct(EventoResponsableModel.id_usuario)).label("organizadores"),
+        )
+        .select_from(InstalacionEventoModel)
+        .join(EventoModel, EventoModel.id_evento == InstalacionEventoModel.id_evento)
+        .outerjoin(EventoResponsableModel, EventoResponsableModel.id_evento == EventoModel.id_evento)
+        .where(InstalacionEventoModel.id_instalacion == id_instalacion)
+        .group_by(EventoModel.tipo)
+    )
+    rows = (await session.execute(stmt)).all()
+    freq_por_tipo = {_tval(t): n for (t, n, _o) in rows}
+    organizadores_por_tipo = {_tval(t): o for (t, _n, o) in rows if o}
+    return {
+        "id_instalacion": id_instalacion,
+        "total_eventos": sum(freq_por_tipo.values()),
+        "tipo_mas_frecuente": max(freq_por_tipo, key=freq_por_tipo.get) if freq_por_tipo else None,
+        "organizadores_por_tipo": organizadores_por_tipo,
+    }
+
+
+# 4) CTE con la instalación top + frecuencias por tipo + organizadores (subconsulta escalar correlacionada)
+async def q4_instalacion_top_y_detalle(session: AsyncSession) -> Dict[str, Any]:
+    top = (
+        select(InstalacionEventoModel.id_instalacion, func.count().label("n"))
+        .group_by(InstalacionEventoModel.id_instalacion)
+        .order_by(desc("n"), InstalacionEventoModel.id_instalacion)
+        .limit(1)
+        .cte("top_instalacion")
+    )
+    ie2 = aliased(InstalacionEventoModel)
+    organizadores = (
+        select(func.count(func.distinct(EventoResponsableModel.id_usuario)))
+        .join(ie2, ie2.id_evento == EventoResponsableModel.id_evento)
+        .where(ie2.id_instalacion == top.c.id_instalacion)
+        .correlate(top)
+        .scalar_subquery()
+    )
+    stmt = (
+        select(top.c.id_instalacion, top.c.n, EventoModel.tipo, func.count().label("n_tipo"), organizadores.label("org"))
+        .select_from(top)
+        .join(InstalacionEventoModel, InstalacionEventoModel.id_instalacion == top.c.id_instalacion)
+        .join(EventoModel, EventoModel.id_evento == InstalacionEventoModel.id_evento)
+        .group_by(top.c.id_instalacion, top.c.n, EventoModel.tipo)
+    )
+    rows = (await session.execute(stmt)).all()
+    if not rows:
+        return {"id_instalacion": None, "total_eventos": 0, "frecuencia_por_tipo": {}, "organizadores_totales": 0}
+    return {
+        "id_instalacion": rows[0].id_instalacion,
+        "total_eventos": rows[0].n,
+        "frecuencia_por_tipo": {_tval(r.tipo): r.n_tipo for r in rows},
+        "organizadores_totales": rows[0].org,
+    }
+
+
+# 5) docentes por unidad académica y estudiantes por programa en un UNION ALL con discriminador
+async def q5_eventos_por_unidad_organizadora(session: AsyncSession) -> Dict[str, List[Dict[str, Any]]]:
+    def _agregado(grupo: str, subtipo, columna_unidad):
+        return (
+            select(
+                literal(grupo).label("grupo"),
+                columna_unidad.label("id_unidad"),
+                func.count(func.distinct(EventoModel.id_evento)).label("eventos"),
+                func.count(func.distinct(EventoResponsableModel.id_usuario)).label("organizadores"),
+                func.count(func.distinct(RepresentanteModel.id_organizacion)).label("entidades_externas"),
+            )
+            .join(EventoResponsableModel, EventoResponsableModel.id_evento == EventoModel.id_evento)
+            .join(subtipo, subtipo.id_usuario == EventoResponsableModel.id_usuario)
+            .outerjoin(RepresentanteModel, RepresentanteModel.id_evento == EventoModel.id_evento)
+            .group_by(columna_unidad)
+        )
+
+    # la unidad/programa se toma del subtipo (FK), sin volver a unir la tabla de la unidad
+    stmt = _agregado("docentes", DocenteModel, DocenteModel.id_unidad_academica).union_all(
+        _agregado("estudiantes", EstudianteModel, EstudianteModel.id_programa)
+    )
+    salida = {"por_unidad_academica_docentes": [], "por_programa_estudiantes": []}
+    for r in (await session.execute(stmt)).all():
+        fila = {k: v for k, v in r._mapping.items() if k != "grupo"}
+        clave = "por_unidad_academica_docentes" if r.grupo == "docentes" else "por_programa_estudiantes"
+        salida[clave].append(fila)
+    return salida
+
+
+# 8) usuarios por rol y participantes por rol con agregación condicional
+async def q8_usuarios_por_rol_y_mas_participa(session: AsyncSession) -> Dict[str, Any]:
+    participa = exists().where(EventoResponsableModel.id_usuario == UsuarioModel.id_usuario)
+    stmt = (
+        select(
+            UsuarioModel.rol,
+            func.count().label("n"),
+            func.sum(case((participa, 1), else_=0)).label("participa"),
+        )
+        .group_by(UsuarioModel.rol)
+    )
+    rows = (await session.execute(stmt)).all()
+    usuarios_por_rol = {rol: n for (rol, n, _p) in rows}
+    participa_por_rol = {rol: int(p) for (rol, _n, p) in rows if p}
+    return {
+        "usuarios_por_rol": usuarios_por_rol,
+        "participa_por_rol": participa_por_rol,
+        "tipo_mas_registrado": max(usuarios_por_rol, key=usuarios_por_rol.get) if usuarios_por_rol else None,
+        "tipo_que_mas_participa": max(participa_por_rol, key=participa_por_rol.get) if participa_por_rol else None,
+    }
+
+
+# 9) top 5, instalación más usada (row_number) y conteos por tipo en una sentencia con CTEs
+async def q9_top5_usuarios_activos(session: AsyncSession, desde: date, hasta: date) -> List[Dict[str, Any]]:
+    base = (
+        select(EventoResponsableModel.id_usuario, EventoModel.id_evento, EventoModel.tipo)
+        .join(EventoModel, EventoModel.id_evento == EventoResponsableModel.id_evento)
+        .where(EventoModel.fecha_inicio >= desde, EventoModel.fecha_inicio <= hasta)
+        .cte("base")
+    )
+    top = (
+        select(base.c.id_usuario, func.count(func.distinct(base.c.id_evento)).label("n_eventos"))
+        .group_by(base.c.id_usuario)
+        .order_by(desc("n_eventos"), base.c.id_usuario)
+        .limit(5)
+        .cte("top")
+    )
+    inst = (
+        select(
+            base.c.id_usuario,
+            InstalacionEventoModel.id_instalacion,
+            func.row_number().over(
+                partition_by=base.c.id_usuario,
+                order_by=(func.count().desc(), InstalacionEventoModel.id_instalacion),
+            ).label("rn"),
+        )
+        .join(top, top.c.id_usuario == base.c.id_usuario)
+        .join(InstalacionEventoModel, InstalacionEventoModel.id_evento == base.c.id_evento)
+        .group_by(base.c.id_usuario, InstalacionEventoModel.id_instalacion)
+        .cte("inst")
+    )
+    tipos = (
+        select(base.c.id_usuario, base.c.tipo, func.count().label("n"))
+        .join(top, top.c.id_usuario == base.c.id_usuario)
+        .group_by(base.c.id_usuario, base.c.tipo)
+        .cte("tipos")
+    )
+    stmt = (
+        select(top.c.id_usuario, top.c.n_eventos, inst.c.id_instalacion, tipos.c.tipo, tipos.c.n)
+        .select_from(top)
+        .outerjoin(inst, (inst.c.id_usuario == top.c.id_usuario) & (inst.c.rn == 1))
+        .outerjoin(tipos, tipos.c.id_usuario == top.c.id_usuario)
+        .order_by(desc(top.c.n_eventos), top.c.id_usuario)
+    )
+    por_usuario: Dict[int, Dict[str, Any]] = {}
+    for uid, n_evts, id_inst, tipo, n in (await session.execute(stmt)).all():
+        u = por_usuario.setdefault(uid, {"eventos": n_evts, "instalacion": id_inst, "por_tipo": {}})
+        if tipo is not None:
+            u["por_tipo"][_tval(tipo)] = n
+
+    salida = []
+    for uid, u in por_usuario.items():
+        total = sum(u["por_tipo"].values())
+        salida.append({
+            "id_usuario": uid,
+            "eventos": u["eventos"],
+            "instalacion_mas_usada": u["instalacion"],
+            "porcentaje_por_tipo": {k: (v * 100 / total) if total else 0 for k, v in u["por_tipo"].items()},
+        })
+    return salida
+
+
+# 10) una sola ventana row_number y agregación condicional para ambas métricas
+async def q10_rechazo_inicial_y_revisiones(session: AsyncSession) -> List[Dict[str, Any]]:
+    rn = func.row_number().over(
+        partition_by=EvaluacionModel.id_evento,
+        order_by=(EvaluacionModel.fecha_evaluacion.asc(), EvaluacionModel.id_evaluacion.asc()),
+    )
+    sub = (
+        select(EventoModel.tipo.label("tipo"), EvaluacionModel.estado.label("estado"), rn.label("rn"))
+        .join(EvaluacionModel, EvaluacionModel.id_evento == EventoModel.id_evento)
+        .subquery()
+    )
+    stmt = (
+        select(
+            sub.c.tipo,
+            func.sum(case(((sub.c.rn == 1) & (sub.c.estado == "rechazado"), 1), else_=0)).label("rechazos_iniciales"),
+            func.count(case((sub.c.rn == 1, 1))).label("con_evaluacion"),
+            func.avg(case((sub.c.estado == "aprobado", sub.c.rn))).label("prom"),
+        )
+        .group_by(sub.c.tipo)
+    )
+    salida = []
+    for tipo, rej_ini, con_eval, prom in (await session.execute(stmt)).all():
+        salida.append({
+            "tipo": _tval(tipo),
+            "rechazo_inicial": {
+                "rechazos_iniciales": rej_ini,
+                "con_evaluacion": con_eval,
+                "tasa_pct": (rej_ini / con_eval) * 100 if con_eval else 0,
+            },
+            "prom_revisiones_hasta_aprob": float(prom or 0),
+        })
+    return salida
@@ -1,54 +1,226 @@
-from pydantic import BaseModel, Field, ConfigDict, field_validator
-from typing import Optional
-from datetime import date, time
-from enum import Enum
+# app/crud/eventos/evento.py
+import logging
+from datetime import date
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 
+from sqlalchemy import and_, or_, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
 
-class TipoEventoEnum(str, Enum):
-    LUDICO = "ludico"
-    ACADEMICO = "academico"
+from app.models.eventos.evento import EventoModel, EstadoEventoEnum as EstadoEventoModelEnum
+from app.models.eventos.evento_responsable import EventoResponsableModel
+from app.core.config import settings
 
+logger = logging.getLogger(__name__)
 
-class EstadoEventoEnum(str, Enum):
-    REGISTRADO = "registrado"
-    EN_REVISION = "en_revision"
-    APROBADO = "aprobado"
+# -----------------------------
+# CRUD v2 sobre EventoModel
+# -----------------------------
+# Campos que se pueden modificar con PATCH (el estado lo cambia solo la evaluación)
+CAMPOS_ACTUALIZABLES = ("nombre", "descripcion", "tipo", "fecha_inicio", "fecha_fin", "hora_inicio", "hora_fin")
 
 
-class EventoBase(BaseModel):
-    nombre: str = Field(..., min_length=3, max_length=100, description="Nombre del evento")
-    descripcion: Optional[str] = Field(None, max_length=500)
-    tipo: TipoEventoEnum = Field(..., description="Tipo de evento: académico o lúdico")
+async def crear_evento(session: AsyncSession, evento_in, id_responsable: int) -> EventoModel:
+    """Crea el evento en estado 'registrado' y su responsable en la misma transacción."""
+    evento = EventoModel(
+        **evento_in.model_dump(exclude={"estado"}),
+        estado=EstadoEventoModelEnum.REGISTRADO,
+    )
+    evento.responsables.append(
+        EventoResponsableModel(id_usuario=id_responsable, fecha_asignacion=date.today())
+    )
+    session.add(evento)
+    await session.commit()
+    return evento
 
-    fecha_inicio: date = Field(..., description="Fecha de inicio del evento")
-    fecha_fin: date = Field(..., description="Fecha de finalización del evento")
 
-    hora_inicio: time = Field(..., description="Hora de inicio")
-    hora_fin: time = Field(..., description="Hora de finalización")
+# (innodb_autoinc_lock_mode, auto_increment_increment) del servidor MySQL, leído una vez por proceso
+_autoincremento_mysql: Optional[Tuple[int, int]] = None
 
-    @field_validator("fecha_fin")
-    @classmethod
-    def validar_rango_fechas(cls, v, values):
-        fecha_inicio = values.get("fecha_inicio")
-        if fecha_inicio and v < fecha_inicio:
-            raise ValueError("La fecha_fin no puede ser anterior a fecha_inicio")
-        return v
 
-    @field_validator("hora_fin")
-    @classmethod
-    def validar_rango_horas(cls, v, values):
-        hora_inicio = values.get("hora_inicio")
-        if hora_inicio and v <= hora_inicio:
-            raise ValueError("La hora_fin debe ser mayor que hora_inicio")
-        return v
+async def _paso_ids_consecutivos(session: AsyncSession) -> Optional[int]:
+    """
+    Paso entre los ids de un INSERT de varias filas en MySQL, o None si el servidor no
+    garantiza que sean consecutivos (innodb_autoinc_lock_mode distinto de 0 y 1).
+    """
+    global _autoincremento_mysql
+    if _autoincremento_mysql is None:
+        fila = (await session.execute(text("SELECT @@innodb_autoinc_lock_mode, @@auto_increment_increment"))).one()
+        _autoincremento_mysql = (int(fila[0]), int(fila[1]))
+        if _autoincremento_mysql[0] not in (0, 1):
+            logger.warning(
+                "innodb_autoinc_lock_mode=%d: el alta de eventos en lote inserta fila a fila "
+                "(configurar 0 o 1 para un INSERT de varias filas)", _autoincremento_mysql[0],
+            )
+    modo, paso = _autoincremento_mysql
+    return paso if modo in (0, 1) else None
 
 
-class EventoCrear(EventoBase):
-    estado: Optional[EstadoEventoEnum] = EstadoEventoEnum.REGISTRADO
+async def _insertar_eventos(session: AsyncSession, filas: List[Dict[str, Any]]) -> List[int]:
+    """INSERT de los eventos; devuelve sus id_evento en el orden de `filas`."""
+    conn = await session.connection()
+    # 1) Con RETURNING (SQLite, MariaDB): ids en el orden de los parámetros
+    if conn.dialect.insert_returning:
+        res = await session.execute(
+            insert(EventoModel).returning(EventoModel.id_evento, sort_by_parameter_order=True), filas
+        )
+        return list(res.scalars())
 
+    # 2) MySQL: un solo INSERT ... VALUES (...), (...); LAST_INSERT_ID() es el id de la primera
+    #    fila y, con innodb_autoinc_lock_mode 0 o 1, los demás son consecutivos (de `paso` en
+    #    `paso`, auto_increment_increment). No depende del aislamiento de la transacción.
+    paso = await _paso_ids_consecutivos(session)
+    if paso is not None:
+        res = await session.execute(insert(EventoModel).values(filas))
+        if res.rowcount != len(filas) or not res.lastrowid:
+            raise RuntimeError(f"INSERT en lote: {res.rowcount} filas insertadas de {len(filas)}")
+        return [res.lastrowid + k * paso for k in range(len(filas))]
 
-class Evento(EventoBase):
-    id_evento: int = Field(..., alias="id_evento")
-    estado: EstadoEventoEnum
+    # 3) Modo intercalado (2): los ids de un mismo INSERT pueden no ser consecutivos; fila a fila
+    ids = []
+    for fila in filas:
+        res = await session.execute(insert(EventoModel).values(fila))
+        ids.append(res.lastrowid)
+    return ids
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+
+async def crear_eventos_en_lote(
+    session: AsyncSession, filas: Sequence[Dict[str, Any]], id_responsables: Sequence[int]
+) -> List[int]:
+    """
+    Inserta los eventos (estado 'registrado') y un responsable por evento en una sola
+    transacción, con INSERT de varias filas. Devuelve los id_evento en el orden de `filas`.
+    En MySQL requiere innodb_autoinc_lock_mode 0 o 1 para el INSERT de varias filas (ver
+    _insertar_eventos); con el modo 2 inserta los eventos fila a fila, en la misma transacción.
+    """
+    if not filas:
+        return []
+    ids = await _insertar_eventos(session, [{**f, "estado": EstadoEventoModelEnum.REGISTRADO} for f in filas])
+
+    hoy = date.today()
+    await session.execute(insert(EventoResponsableModel), [
+        {"id_evento": id_evento, "id_usuario": id_usuario, "fecha_asignacion": hoy}
+        for id_evento, id_usuario in zip(ids, id_responsables)
+    ])
+    if settings.USAR_RESUMENES:
+        # el INSERT en bloque no pasa por flush: los resúmenes se actualizan aquí
+        from app.crud.eventos.resumenes import registrar_altas_responsables
+        await session.run_sync(registrar_altas_responsables, [
+            (id_usuario, f["tipo"]) for f, id_usuario in zip(filas, id_responsables)
+        ])
+    await session.commit()
+    return list(ids)
+
+
+async def buscar_evento_por_id(session: AsyncSession, id_evento: int) -> Optional[EventoModel]:
+    return await session.get(EventoModel, id_evento)
+
+
+async def actualizar_evento(
+    session: AsyncSession, id_evento: int, datos_actualizados: Dict[str, Any]
+) -> Optional[EventoModel]:
+    """Devuelve None si el evento no existe o ya no está 'registrado'."""
+    evento = await session.get(EventoModel, id_evento)
+    if not evento or evento.estado != EstadoEventoModelEnum.REGISTRADO:
+        return None
+    for campo, valor in datos_actualizados.items():
+        if campo in CAMPOS_ACTUALIZABLES:
+            setattr(evento, campo, valor)
+    await session.commit()
+    return evento
+
+
+async def eliminar_evento(session: AsyncSession, id_evento: int) -> bool:
+    """Devuelve False si el evento no existe o ya no está 'registrado'."""
+    evento = await session.get(EventoModel, id_evento)
+    if not evento or evento.estado != EstadoEventoModelEnum.REGISTRADO:
+        return False
+    await session.delete(evento)
+    await session.commit()
+    return True
+
+
+# -----------------------------
+# Listado con filtros en SQL + paginación keyset
+# -----------------------------
+
+
+# Columnas que se exportan (mismo orden que el schema Evento)
+COLUMNAS_EXPORTACION = (
+    "id_evento", "nombre", "descripcion", "tipo", "estado",
+    "fecha_inicio", "fecha_fin", "hora_inicio", "hora_fin",
+)
+# Las mismas como atributos del modelo: select(*COLUMNAS_EVENTO) da tuplas para el schema Evento
+COLUMNAS_EVENTO = tuple(getattr(EventoModel, c) for c in COLUMNAS_EXPORTACION)
+
+
+def _aplicar_filtros(stmt, estado=None, tipo=None, desde=None, hasta=None):
+    if estado is not None:
+        stmt = stmt.where(EventoModel.estado == estado)
+    if tipo is not None:
+        stmt = stmt.where(EventoModel.tipo == tipo)
+    if desde is not None:
+        stmt = stmt.where(EventoModel.fecha_inicio >= desde)
+    if hasta is not None:
+        stmt = stmt.where(EventoModel.fecha_inicio <= hasta)
+    return stmt
+
+
+async def listar_eventos(
+    session: AsyncSession,
+    estado=None,
+    tipo=None,
+    desde: Optional[date] = None,
+    hasta: Optional[date] = None,
+    despues_de: Optional[Tuple[date, int]] = None,
+    limite: Optional[int] = None,
+    solo_columnas: bool = False,
+) -> Sequence[EventoModel]:
+    """
+    Lista eventos aplicando los filtros dentro del SELECT.
+    La paginación es por clave (keyset) sobre (fecha_inicio, id_evento):
+      - despues_de: última clave (fecha_inicio, id_evento) de la página anterior.
+      - limite: máximo de filas a devolver (None = sin límite).
+      - solo_columnas: devuelve Row (tuplas con nombre) en vez de objetos ORM; para serializar
+        listas grandes sin el coste de construir e instrumentar cada objeto.
+    """
+    base = select(*COLUMNAS_EVENTO) if solo_columnas else select(EventoModel)
+    stmt = _aplicar_filtros(base, estado, tipo, desde, hasta)
+    if despues_de is not None:
+        fecha_ult, id_ult = despues_de
+        # Equivalente a (fecha_inicio, id_evento) > (fecha_ult, id_ult), escrito así para que use el índice
+        stmt = stmt.where(
+            or_(
+                EventoModel.fecha_inicio > fecha_ult,
+                and_(EventoModel.fecha_inicio == fecha_ult, EventoModel.id_evento > id_ult),
+            )
+        )
+    stmt = stmt.order_by(EventoModel.fecha_inicio.asc(), EventoModel.id_evento.asc())
+    if limite is not None:
+        stmt = stmt.limit(limite)
+    result = await session.execute(stmt)
+    return result.all() if solo_columnas else result.scalars().all()
+
+
+
+async def iterar_eventos_por_lotes(
+    session: AsyncSession,
+    estado=None,
+    tipo=None,
+    desde: Optional[date] = None,
+    hasta: Optional[date] = None,
+    tamano_lote: int = 1000,
+) -> AsyncIterator[Sequence[Tuple]]:
+    """
+    Recorre los eventos con un cursor del lado del servidor (session.stream) y entrega
+    lotes de `tamano_lote` tuplas de columnas. No se materializan objetos ORM, así que
+    la memoria no crece con el número de filas.
+    """
+    stmt = (
+        _aplicar_filtros(select(*COLUMNAS_EVENTO), estado, tipo, desde, hasta)
+        .order_by(EventoModel.fecha_inicio.asc(), EventoModel.id_evento.asc())
+        .execution_options(yield_per=tamano_lote)
+    )
+    result = await session.stream(stmt)
+    async for lote in result.partitions():
+        yield lote
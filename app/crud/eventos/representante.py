@@ -1,11 +1,14 @@
-from typing import List, Optional
+from typing import Any, AsyncIterable, Dict, List, Optional, Sequence, Tuple, Union
 
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from app.models.eventos.evento import EventoModel, EstadoEventoEnum
-from app.models.organizaciones.organizacion import OrganizacionModel
+from app.models.organizaciones.organizacion_externa import OrganizacionExternaModel as OrganizacionModel
 from app.models.eventos.representante import RepresentanteModel
+from app.core.blobs import Blob, BlobDemasiadoGrande, obtener_almacen
+from app.core.config import settings
 
 
 async def _verificar_evento_registrado(session: AsyncSession, id_evento: int) -> EventoModel:
@@ -30,13 +33,25 @@ async def _verificar_organizacion(session: AsyncSession, id_organizacion: int) -
     return org
 
 
+async def _guardar_certificado(certificado: Union[bytes, AsyncIterable[bytes]]) -> Blob:
+    # el archivo va al almacén de blobs antes del commit; si el commit falla queda un blob
+    # huérfano (inofensivo: direccionado por contenido, se reutiliza si se vuelve a subir)
+    almacen = obtener_almacen()
+    if isinstance(certificado, (bytes, bytearray)):
+        if len(certificado) > settings.CERTIFICADO_MAX_BYTES:
+            raise BlobDemasiadoGrande(f"El certificado supera el máximo de {settings.CERTIFICADO_MAX_BYTES} bytes")
+        return await almacen.guardar(bytes(certificado))
+    return await almacen.guardar_stream(certificado, settings.CERTIFICADO_MAX_BYTES)
+
+
 async def agregar_representante(
     session: AsyncSession,
     id_evento: int,
     id_organizacion: int,
     nombre_representante: str,
     representante_legal: str,             # 'Si' | 'No'
-    certificado_bytes: Optional[bytes],   # puede ser None
+    certificado: Optional[Union[bytes, AsyncIterable[bytes]]],  # bytes o bloques (streaming); puede ser None
+    certificado_media_type: str = "application/pdf",
 ) -> RepresentanteModel:
     await _verificar_evento_registrado(session, id_evento)
     await _verificar_organizacion(session, id_organizacion)
@@ -57,18 +72,105 @@ async def agregar_representante(
         id_organizacion=id_organizacion,
         nombre_representante=nombre_representante,
         representante_legal=representante_legal,
-        certificado_participacion=certificado_bytes
     )
+    if certificado is not None:
+        blob = await _guardar_certificado(certificado)
+        rep.certificado_sha256 = blob.sha256
+        rep.certificado_tamano = blob.tamano
+        rep.certificado_media_type = certificado_media_type
     session.add(rep)
     await session.commit()
     await session.refresh(rep)
     return rep
 
 
+async def agregar_representantes_en_lote(
+    session: AsyncSession,
+    id_evento: int,
+    items: Sequence[Tuple[int, Dict[str, Any]]],
+) -> List[Dict[str, Any]]:
+    """
+    Versión en lote de agregar_representante. `items` son pares (indice, datos) con las claves
+    de agregar_representante (certificado y certificado_media_type opcionales).
+
+    El evento se verifica una vez (ValueError si no existe o no está 'registrado'); las
+    organizaciones y los vínculos ya existentes, con una consulta IN cada uno; las altas
+    válidas se insertan en un solo flush (INSERT de varias filas) y un commit. Devuelve un
+    resultado por item (ver RepresentanteLoteResultado): uno rechazado no impide el resto.
+    """
+    await _verificar_evento_registrado(session, id_evento)
+    resultados: List[Dict[str, Any]] = []
+
+    def _error(i: int, status_code: int, error: str) -> None:
+        resultados.append({"indice": i, "ok": False, "status_code": status_code, "error": error})
+
+    # 1) Organizaciones existentes y ya vinculadas, en dos consultas
+    ids = {datos["id_organizacion"] for _, datos in items}
+    existentes, ligadas = set(), set()
+    if ids:
+        existentes = set((await session.execute(
+            select(OrganizacionModel.id_organizacion).where(OrganizacionModel.id_organizacion.in_(ids))
+        )).scalars())
+        ligadas = set((await session.execute(
+            select(RepresentanteModel.id_organizacion).where(
+                RepresentanteModel.id_evento == id_evento,
+                RepresentanteModel.id_organizacion.in_(ids),
+            )
+        )).scalars())
+
+    # 2) Vínculos nuevos (y sus certificados al almacén)
+    nuevos: List[Tuple[int, RepresentanteModel]] = []
+    for i, datos in items:
+        id_organizacion = datos["id_organizacion"]
+        if id_organizacion not in existentes:
+            _error(i, 400, "Organización externa no encontrada")
+            continue
+        if id_organizacion in ligadas:
+            _error(i, 400, "La organización ya está asociada a este evento")
+            continue
+        rep = RepresentanteModel(
+            id_evento=id_evento,
+            id_organizacion=id_organizacion,
+            nombre_representante=datos["nombre_representante"],
+            representante_legal=datos["representante_legal"],
+            # mismas columnas en todas las filas: el flush las agrupa en un único INSERT
+            certificado_sha256=None,
+            certificado_tamano=None,
+            certificado_media_type=None,
+        )
+        if datos.get("certificado") is not None:
+            try:
+                blob = await _guardar_certificado(datos["certificado"])
+            except BlobDemasiadoGrande as e:
+                _error(i, 413, str(e))
+                continue
+            rep.certificado_sha256 = blob.sha256
+            rep.certificado_tamano = blob.tamano
+            rep.certificado_media_type = datos.get("certificado_media_type") or "application/pdf"
+        ligadas.add(id_organizacion)  # una organización repetida en el lote cuenta como ya asociada
+        nuevos.append((i, rep))
+
+    # 3) Inserción en bloque (todo o nada para los válidos)
+    if nuevos:
+        session.add_all([rep for _, rep in nuevos])
+        try:
+            await session.commit()
+        except SQLAlchemyError as e:
+            await session.rollback()
+            for i, _ in nuevos:
+                _error(i, 500, f"No se insertó ningún vínculo del lote: {type(e).__name__}: {e}")
+        else:
+            resultados.extend(
+                {"indice": i, "ok": True, "status_code": 201, "representante": rep} for i, rep in nuevos
+            )
+    return resultados
+
+
 async def listar_representantes_por_evento(
     session: AsyncSession, id_evento: int
 ) -> List[RepresentanteModel]:
-    # No exige estado 'registrado' para consultar
+    # No exige estado 'registrado' para consultar. La fila solo lleva los metadatos del
+    # certificado (los bytes están en el almacén de blobs), así que se carga entera
     result = await session.execute(
         select(RepresentanteModel).where(RepresentanteModel.id_evento == id_evento)
     )
@@ -95,16 +197,40 @@ async def eliminar_representante(
     return True
 
 
+async def obtener_metadatos_certificado(
+    session: AsyncSession, id_evento: int, id_organizacion: int
+) -> Optional[Tuple[str, int, str]]:
+    """(sha256, tamaño, media type) del certificado sin leer el archivo; None si no hay certificado."""
+    result = await session.execute(
+        select(
+            RepresentanteModel.certificado_sha256,
+            RepresentanteModel.certificado_tamano,
+            RepresentanteModel.certificado_media_type,
+        ).where(
+            RepresentanteModel.id_evento == id_evento,
+            RepresentanteModel.id_organizacion == id_organizacion
+        )
+    )
+    fila = result.first()
+    if not fila or fila.certificado_sha256 is None:
+        return None
+    return fila.certificado_sha256, fila.certificado_tamano, fila.certificado_media_type or "application/pdf"
+
+
 async def obtener_certificado(
     session: AsyncSession, id_evento: int, id_organizacion: int
-) -> Optional[bytes]:
+) -> Optional[Tuple[bytes, str]]:
+    """(contenido, media type) del certificado, o None si no hay vínculo o no tiene certificado."""
     result = await session.execute(
-        select(RepresentanteModel).where(
+        select(RepresentanteModel.certificado_sha256, RepresentanteModel.certificado_media_type).where(
             RepresentanteModel.id_evento == id_evento,
             RepresentanteModel.id_organizacion == id_organizacion
         )
     )
-    rep = result.scalar_one_or_none()
-    if not rep:
+    fila = result.first()
+    if not fila or fila.certificado_sha256 is None:
+        return None
+    contenido = await obtener_almacen().obtener(fila.certificado_sha256)
+    if contenido is None:
         return None
-    return rep.certificado_participacion
+    return contenido, fila.certificado_media_type or "application/pdf"
@@ -0,0 +1,314 @@
+# app/crud/eventos/resumenes.py
+"""
+Mantenimiento incremental de las tablas resumen (rollups) de las consultas analíticas.
+
+Cada escritura del ORM sobre Representante, InstalacionEvento, EventoResponsable o el
+tipo de un Evento se traduce, dentro de la misma transacción, en deltas +/-n que se
+aplican con INSERT ... ON DUPLICATE KEY UPDATE (ON CONFLICT DO UPDATE en SQLite). Nunca
+se recorre la tabla completa: solo se leen las filas del evento afectado.
+
+  - before_flush: cambios de tipo y bajas (las filas crudas aún existen).
+  - after_flush:  altas (las filas crudas y sus ids ya existen).
+
+Una fila hija cuya clave cambia (p. ej. id_organizacion de un Representante, o su evento)
+cuenta como baja de la fila vieja en before_flush y alta de la nueva en after_flush.
+"""
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event, select, func, delete, insert, inspect
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.eventos.evento import EventoModel
+from app.models.eventos.representante import RepresentanteModel
+from app.models.eventos.evento_responsable import EventoResponsableModel
+from app.models.eventos.instalacion_evento import InstalacionEventoModel
+from app.models.eventos.resumen import (
+    ResumenOrganizacionTipoModel,
+    ResumenInstalacionTipoModel,
+    ResumenUsuarioTipoModel,
+    ResumenInstalacionOrganizadorModel,
+)
+
+
+# -----------------------------
+# SELECTs de referencia (tablas crudas) por resumen
+# -----------------------------
+def _select_organizacion_tipo(id_evento: Optional[int] = None):
+    stmt = (
+        select(RepresentanteModel.id_organizacion, EventoModel.tipo, func.count().label("n"))
+        .join(EventoModel, EventoModel.id_evento == RepresentanteModel.id_evento)
+        .group_by(RepresentanteModel.id_organizacion, EventoModel.tipo)
+    )
+    if id_evento is not None:
+        stmt = stmt.where(RepresentanteModel.id_evento == id_evento)
+    return stmt
+
+
+def _select_instalacion_tipo(id_evento: Optional[int] = None):
+    stmt = (
+        select(InstalacionEventoModel.id_instalacion, EventoModel.tipo, func.count().label("n"))
+        .join(EventoModel, EventoModel.id_evento == InstalacionEventoModel.id_evento)
+        .group_by(InstalacionEventoModel.id_instalacion, EventoModel.tipo)
+    )
+    if id_evento is not None:
+        stmt = stmt.where(InstalacionEventoModel.id_evento == id_evento)
+    return stmt
+
+
+def _select_usuario_tipo(id_evento: Optional[int] = None):
+    stmt = (
+        select(EventoResponsableModel.id_usuario, EventoModel.tipo, func.count().label("n"))
+        .join(EventoModel, EventoModel.id_evento == EventoResponsableModel.id_evento)
+        .group_by(EventoResponsableModel.id_usuario, EventoModel.tipo)
+    )
+    if id_evento is not None:
+        stmt = stmt.where(EventoResponsableModel.id_evento == id_evento)
+    return stmt
+
+
+def _select_instalacion_organizador(id_evento: Optional[int] = None):
+    stmt = (
+        select(
+            InstalacionEventoModel.id_instalacion,
+            EventoModel.tipo,
+            EventoResponsableModel.id_usuario,
+            func.count().label("n"),
+        )
+        .join(EventoModel, EventoModel.id_evento == InstalacionEventoModel.id_evento)
+        .join(EventoResponsableModel, EventoResponsableModel.id_evento == InstalacionEventoModel.id_evento)
+        .group_by(InstalacionEventoModel.id_instalacion, EventoModel.tipo, EventoResponsableModel.id_usuario)
+    )
+    if id_evento is not None:
+        stmt = stmt.where(InstalacionEventoModel.id_evento == id_evento)
+    return stmt
+
+
+# (modelo, columnas clave en el orden del SELECT de referencia, SELECT de referencia)
+RESUMENES = (
+    (ResumenOrganizacionTipoModel, ("id_organizacion", "tipo"), _select_organizacion_tipo),
+    (ResumenInstalacionTipoModel, ("id_instalacion", "tipo"), _select_instalacion_tipo),
+    (ResumenUsuarioTipoModel, ("id_usuario", "tipo"), _select_usuario_tipo),
+    (ResumenInstalacionOrganizadorModel, ("id_instalacion", "tipo", "id_usuario"), _select_instalacion_organizador),
+)
+
+# filas hijas: columnas que las sitúan en los resúmenes y la relación que fija cada una
+CLAVES_HIJAS = {
+    RepresentanteModel: (("id_evento", "evento"), ("id_organizacion", "organizacion")),
+    InstalacionEventoModel: (("id_evento", "evento"), ("id_instalacion", "instalacion")),
+    EventoResponsableModel: (("id_evento", "evento"), ("id_usuario", "usuario")),
+}
+
+Deltas = Dict[Any, Dict[Tuple, int]]
+
+
+# -----------------------------
+# Cálculo de deltas
+# -----------------------------
+def _tipo_evento(session: Session, obj) -> Any:
+    """Tipo del evento de una fila hija: primero en memoria, si no, desde la BD."""
+    evento = obj.__dict__.get("evento")
+    if evento is None:
+        evento = session.identity_map.get(inspect(EventoModel).identity_key_from_primary_key((obj.id_evento,)))
+    if evento is not None:
+        return evento.tipo
+    return session.connection().execute(
+        select(EventoModel.tipo).where(EventoModel.id_evento == obj.id_evento)
+    ).scalar_one()
+
+
+def _ids_en_bd(session: Session, columna, id_evento: int, excluir: Set[int]) -> List[int]:
+    filas = session.connection().execute(
+        select(columna).where(columna.table.c.id_evento == id_evento)
+    ).scalars().all()
+    return [i for i in filas if i not in excluir]
+
+
+def _ids_pendientes(objetos, modelo, atributo: str, id_evento: int) -> Set[int]:
+    return {getattr(o, atributo) for o in objetos if isinstance(o, modelo) and o.id_evento == id_evento}
+
+
+def _clave_cambiada(obj) -> bool:
+    estado = inspect(obj)
+    return any(
+        estado.attrs[columna].history.has_changes() or estado.attrs[relacion].history.has_changes()
+        for columna, relacion in CLAVES_HIJAS[type(obj)]
+    )
+
+
+def _huerfana(obj) -> bool:
+    """Fila hija quitada de la colección de su evento: delete-orphan la borra en este flush."""
+    historia = inspect(obj).attrs.evento.history
+    return bool(historia.deleted) and not any(v is not None for v in historia.added)
+
+
+def _imagen_anterior(obj):
+    """Copia transitoria (fuera de la sesión) de la fila hija con las claves guardadas en BD."""
+    estado = inspect(obj)
+    valores = {}
+    for columna, _relacion in CLAVES_HIJAS[type(obj)]:
+        historia = estado.attrs[columna].history
+        valores[columna] = historia.deleted[0] if historia.deleted else getattr(obj, columna)
+    return type(obj)(**valores)
+
+
+def _contribucion(session: Session, deltas: Deltas, obj, signo: int, alta: bool, pendientes) -> None:
+    """
+    Suma la contribución de una fila cruda (signo=+1 alta, -1 baja).
+    `pendientes`: todas las filas que se dan de alta (o de baja) en este flush.
+    Para el resumen instalación x organizador, cuando en el mismo flush cambian filas de
+    ambos lados, solo uno de los dos lados cuenta el par, así no se duplica ni se pierde.
+    """
+    if isinstance(obj, RepresentanteModel):
+        tipo = _tipo_evento(session, obj)
+        deltas[ResumenOrganizacionTipoModel][(obj.id_organizacion, tipo)] += signo
+
+    elif isinstance(obj, InstalacionEventoModel):
+        tipo = _tipo_evento(session, obj)
+        deltas[ResumenInstalacionTipoModel][(obj.id_instalacion, tipo)] += signo
+        excluir = _ids_pendientes(pendientes, EventoResponsableModel, "id_usuario", obj.id_evento) if alta else set()
+        for id_usuario in _ids_en_bd(session, EventoResponsableModel.id_usuario, obj.id_evento, excluir):
+            deltas[ResumenInstalacionOrganizadorModel][(obj.id_instalacion, tipo, id_usuario)] += signo
+
+    elif isinstance(obj, EventoResponsableModel):
+        tipo = _tipo_evento(session, obj)
+        deltas[ResumenUsuarioTipoModel][(obj.id_usuario, tipo)] += signo
+        excluir = set() if alta else _ids_pendientes(pendientes, InstalacionEventoModel, "id_instalacion", obj.id_evento)
+        for id_instalacion in _ids_en_bd(session, InstalacionEventoModel.id_instalacion, obj.id_evento, excluir):
+            deltas[ResumenInstalacionOrganizadorModel][(id_instalacion, tipo, obj.id_usuario)] += signo
+
+
+def _mover_tipo(session: Session, deltas: Deltas, evento: EventoModel) -> None:
+    """Traslada los conteos de un evento existente desde el tipo guardado en BD al nuevo tipo."""
+    for modelo, claves, select_ref in RESUMENES:
+        i_tipo = claves.index("tipo")
+        for *clave, n in session.connection().execute(select_ref(evento.id_evento)).all():
+            if clave[i_tipo] == evento.tipo:
+                continue
+            deltas[modelo][tuple(clave)] -= n
+            clave[i_tipo] = evento.tipo
+            deltas[modelo][tuple(clave)] += n
+
+
+def _aplicar_deltas(session: Session, deltas: Deltas) -> None:
+    for modelo, claves, _select_ref in RESUMENES:
+        filas = [
+            {**dict(zip(claves, clave)), "n_eventos": n}
+            for clave, n in deltas.get(modelo, {}).items() if n
+        ]
+        if not filas:
+            continue
+        conn = session.connection()
+        if conn.dialect.name == "sqlite":
+            stmt = sqlite_insert(modelo).values(filas)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(claves), set_={"n_eventos": modelo.n_eventos + stmt.excluded.n_eventos}
+            )
+        else:
+            stmt = mysql_insert(modelo).values(filas)
+            stmt = stmt.on_duplicate_key_update(n_eventos=modelo.n_eventos + stmt.inserted.n_eventos)
+        conn.execute(stmt)
+
+
+# -----------------------------
+# Hooks de sesión
+# -----------------------------
+def _antes_de_flush(session: Session, flush_context, instances) -> None:
+    deltas: Deltas = defaultdict(lambda: defaultdict(int))
+    movidas = []  # filas hijas con clave cambiada: baja de la imagen anterior ahora, alta tras el flush
+    huerfanas = []  # aún no están en session.deleted: el flush las borra por delete-orphan
+    with session.no_autoflush:
+        for obj in session.dirty:
+            if obj in session.deleted:
+                continue
+            if isinstance(obj, EventoModel):
+                if inspect(obj).attrs.tipo.history.has_changes():
+                    _mover_tipo(session, deltas, obj)
+            elif type(obj) in CLAVES_HIJAS and _huerfana(obj):
+                huerfanas.append(obj)
+            elif type(obj) in CLAVES_HIJAS and _clave_cambiada(obj):
+                movidas.append(obj)
+        bajas = [*session.deleted, *(_imagen_anterior(obj) for obj in movidas + huerfanas)]
+        for obj in bajas:
+            _contribucion(session, deltas, obj, -1, alta=False, pendientes=bajas)
+    session.info["resumenes_movidas"] = movidas
+    _aplicar_deltas(session, deltas)
+
+
+def _despues_de_flush(session: Session, flush_context) -> None:
+    deltas: Deltas = defaultdict(lambda: defaultdict(int))
+    # las movidas ya tienen sus claves nuevas (el flush sincroniza las FK de las relaciones)
+    altas = [*session.new, *session.info.pop("resumenes_movidas", [])]
+    with session.no_autoflush:
+        for obj in altas:
+            _contribucion(session, deltas, obj, +1, alta=True, pendientes=altas)
+    _aplicar_deltas(session, deltas)
+
+
+def registrar_altas_responsables(session: Session, altas: Iterable[Tuple[int, Any]]) -> None:
+    """
+    Altas de EventoResponsable insertadas en bloque (sin flush), como pares (id_usuario, tipo).
+    Solo para eventos nuevos: aún no tienen instalaciones, así que el resumen instalación x
+    organizador no cambia.
+    """
+    deltas: Deltas = defaultdict(lambda: defaultdict(int))
+    for id_usuario, tipo in altas:
+        deltas[ResumenUsuarioTipoModel][(id_usuario, tipo)] += 1
+    _aplicar_deltas(session, deltas)
+
+
+def instalar_mantenimiento_resumenes() -> None:
+    """Registra los hooks en todas las sesiones (AsyncSession usa una Session síncrona por debajo)."""
+    if not event.contains(Session, "before_flush", _antes_de_flush):
+        event.listen(Session, "before_flush", _antes_de_flush)
+        event.listen(Session, "after_flush", _despues_de_flush)
+
+
+# -----------------------------
+# Reconstrucción y verificación
+# -----------------------------
+async def reconstruir_resumenes(session: AsyncSession) -> Dict[str, int]:
+    """
+    Recalcula todos los resúmenes desde las tablas crudas en una sola transacción.
+    INSERT ... SELECT bloquea las filas leídas, así que las escrituras concurrentes esperan.
+    La tabla se vacía antes, así que basta un INSERT normal (vale para MySQL y SQLite).
+    Devuelve el número de filas por tabla resumen.
+    """
+    filas_por_tabla = {}
+    for modelo, claves, select_ref in RESUMENES:
+        await session.execute(delete(modelo))
+        res = await session.execute(
+            insert(modelo).from_select([*claves, "n_eventos"], select_ref())
+        )
+        filas_por_tabla[modelo.__tablename__] = res.rowcount
+    await session.commit()
+    return filas_por_tabla
+
+
+async def verificar_resumenes(session: AsyncSession) -> List[Dict[str, Any]]:
+    """
+    Compara cada resumen contra la respuesta calculada desde las tablas crudas.
+    Devuelve las diferencias (lista vacía = consistente).
+    """
+    diferencias = []
+    for modelo, claves, select_ref in RESUMENES:
+        esperado = {tuple(clave): n for *clave, n in (await session.execute(select_ref())).all()}
+        columnas = [getattr(modelo, c) for c in claves]
+        actual = {
+            tuple(clave): n
+            for *clave, n in (await session.execute(
+                select(*columnas, modelo.n_eventos).where(modelo.n_eventos != 0)
+            )).all()
+        }
+        for clave in esperado.keys() | actual.keys():
+            if esperado.get(clave, 0) != actual.get(clave, 0):
+                diferencias.append({
+                    "resumen": modelo.__tablename__,
+                    "clave": dict(zip(claves, (getattr(c, "value", c) for c in clave))),
+                    "esperado": esperado.get(clave, 0),
+                    "actual": actual.get(clave, 0),
+                })
+    return diferencias
@@ -0,0 +1,100 @@
+# app/db/cargas_perezosas.py
+"""
+Detección de N+1: cargas perezosas (lazy) de relaciones repetidas en una misma sesión.
+
+Con AsyncSession una carga perezosa es un MissingGreenlet o, dentro de run_sync, un
+round trip oculto por objeto. En modo estricto (MODO_ESTRICTO_CARGAS) se cuenta cada
+carga perezosa por relación (p. ej. "EventoModel.responsables") en session.info; al
+llegar a CARGAS_PEREZOSAS_UMBRAL se registra un aviso ("warn") o se lanza
+CargaPerezosaRepetida ("raise"). Como get_session abre una sesión por petición, el
+conteo es por petición.
+
+Para tests: `max_sentencias(n)` falla si el bloque ejecuta más de n sentencias SQL.
+"""
+import logging
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, ORMExecuteState
+
+from app.core.config import settings
+from app.db.instrumentacion import metricas_actuales
+
+logger = logging.getLogger("app.cargas_perezosas")
+
+
+class CargaPerezosaRepetida(RuntimeError):
+    pass
+
+
+def _relacion(orm_execute_state: ORMExecuteState) -> str:
+    ruta = orm_execute_state.loader_strategy_path
+    prop = getattr(ruta, "prop", None)
+    return str(prop) if prop is not None else str(ruta)
+
+
+def _al_ejecutar(orm_execute_state: ORMExecuteState) -> None:
+    # selectinload/joinedload también son cargas de relación, pero no perezosas
+    if not orm_execute_state.is_relationship_load or orm_execute_state.lazy_loaded_from is None:
+        return
+    conteo: Dict[str, int] = orm_execute_state.session.info.setdefault("_cargas_perezosas", {})
+    relacion = _relacion(orm_execute_state)
+    n = conteo[relacion] = conteo.get(relacion, 0) + 1
+    if n != settings.CARGAS_PEREZOSAS_UMBRAL:
+        return
+
+    metricas = metricas_actuales()
+    ruta = metricas.ruta() if metricas is not None else None
+    mensaje = (
+        f"{relacion} se ha cargado de forma perezosa {n} veces en la misma sesión (ruta={ruta}); "
+        f"usa selectinload/joinedload en la consulta original"
+    )
+    if settings.MODO_ESTRICTO_CARGAS == "raise":
+        raise CargaPerezosaRepetida(mensaje)
+    logger.warning(mensaje, extra={"relacion": relacion, "cargas": n, "ruta": ruta})
+
+
+def instalar_deteccion_cargas_perezosas() -> None:
+    """Listener global de Session (aplica también a AsyncSession.sync_session)."""
+    if not event.contains(Session, "do_orm_execute", _al_ejecutar):
+        event.listen(Session, "do_orm_execute", _al_ejecutar)
+
+
+def cargas_perezosas(session) -> Dict[str, int]:
+    """Conteo de cargas perezosas por relación acumulado en la sesión (Session o AsyncSession)."""
+    sync_session = getattr(session, "sync_session", session)
+    return dict(sync_session.info.get("_cargas_perezosas", {}))
+
+
+# -----------------------------
+# Helper para tests
+# -----------------------------
+class _ContadorSentencias:
+    def __init__(self):
+        self.n = 0
+
+    def __call__(self, *args, **kwargs) -> None:
+        self.n += 1
+
+
+@contextmanager
+def max_sentencias(maximo: int, sync_engine: Optional[Engine] = None) -> Iterator[_ContadorSentencias]:
+    """
+    Falla (AssertionError) si dentro del bloque se envían al driver más de `maximo` sentencias.
+    Cuenta en el engine, no por petición: usar con peticiones en serie.
+
+        with max_sentencias(2):
+            resp = await cliente.get("/api/v1/eventos/1/organizaciones")
+    """
+    if sync_engine is None:
+        from app.db.mysql import engine
+        sync_engine = engine.sync_engine
+    contador = _ContadorSentencias()
+    event.listen(sync_engine, "before_cursor_execute", contador)
+    try:
+        yield contador
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", contador)
+    assert contador.n <= maximo, f"se ejecutaron {contador.n} sentencias SQL (máximo {maximo})"
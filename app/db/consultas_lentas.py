@@ -0,0 +1,161 @@
+# app/db/consultas_lentas.py
+"""
+Registro de consultas lentas con huellas de sentencia.
+
+Cada sentencia que pasa por el engine se normaliza a una huella (literales y
+placeholders -> ?, listas IN y VALUES de cualquier longitud -> una sola forma) y se
+acumula en una tabla acotada en memoria: n, tiempo total, máximo y p95 (sobre las
+últimas muestras). Las sentencias que superan el umbral se registran en el log
+'app.consultas_lentas' junto con la ruta que las originó (si la instrumentación
+por petición está activa).
+
+GET /admin/consultas-lentas devuelve el top-N de huellas por tiempo total, máximo o p95.
+"""
+import functools
+import logging
+import math
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.db.instrumentacion import metricas_actuales
+
+logger = logging.getLogger("app.consultas_lentas")
+
+MUESTRAS_POR_HUELLA = 256
+
+
+# -----------------------------
+# Huellas
+# -----------------------------
+_RE_CADENAS = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+_RE_NUMEROS = re.compile(r"\b\d+(?:\.\d+)?\b")
+_RE_PLACEHOLDERS = re.compile(r"%s|%\(\w+\)s|:\w+|\?")
+_RE_LISTA_IN = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_RE_VALUES = re.compile(r"\bVALUES\s*\([^()]*\)(?:\s*,\s*\([^()]*\))*", re.IGNORECASE)
+_RE_ESPACIOS = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=4096)
+def huella(sql: str) -> str:
+    """Forma normalizada de la sentencia; dos ejecuciones de la misma consulta comparten huella."""
+    s = _RE_CADENAS.sub("?", sql)
+    s = _RE_PLACEHOLDERS.sub("?", s)
+    s = _RE_NUMEROS.sub("?", s)
+    s = _RE_LISTA_IN.sub("IN (...)", s)
+    s = _RE_VALUES.sub("VALUES (...)", s)
+    return _RE_ESPACIOS.sub(" ", s).strip()
+
+
+# -----------------------------
+# Agregación
+# -----------------------------
+@dataclass
+class EstadisticaHuella:
+    huella: str
+    n: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    lentas: int = 0
+    ultima_ruta: Optional[str] = None
+    muestras: Deque[float] = field(default_factory=lambda: deque(maxlen=MUESTRAS_POR_HUELLA), repr=False)
+
+    def p95_ms(self) -> float:
+        orden = sorted(self.muestras)
+        return orden[max(0, math.ceil(0.95 * len(orden)) - 1)] if orden else 0.0
+
+    def como_dict(self) -> Dict[str, Any]:
+        return {
+            "huella": self.huella,
+            "n": self.n,
+            "total_ms": round(self.total_ms, 2),
+            "media_ms": round(self.total_ms / self.n, 2) if self.n else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "p95_ms": round(self.p95_ms(), 2),
+            "lentas": self.lentas,
+            "ultima_ruta": self.ultima_ruta,
+        }
+
+
+class RegistroConsultasLentas:
+    def __init__(self, umbral_ms: float, max_huellas: int):
+        self.umbral_ms = umbral_ms
+        self.max_huellas = max_huellas
+        self._huellas: Dict[str, EstadisticaHuella] = {}
+        self.descartadas = 0
+
+    def registrar(self, sql: str, duracion_ms: float) -> None:
+        h = huella(sql)
+        est = self._huellas.get(h)
+        if est is None:
+            if len(self._huellas) >= self.max_huellas:
+                # tabla llena: sale la huella que menos tiempo acumula
+                del self._huellas[min(self._huellas.values(), key=lambda e: e.total_ms).huella]
+                self.descartadas += 1
+            est = self._huellas[h] = EstadisticaHuella(h)
+        est.n += 1
+        est.total_ms += duracion_ms
+        est.max_ms = max(est.max_ms, duracion_ms)
+        est.muestras.append(duracion_ms)
+
+        if duracion_ms >= self.umbral_ms:
+            metricas = metricas_actuales()
+            ruta = metricas.ruta() if metricas is not None else None
+            est.lentas += 1
+            est.ultima_ruta = ruta
+            logger.warning(
+                "consulta lenta %.1f ms ruta=%s huella=%s", duracion_ms, ruta, h,
+                extra={"duracion_ms": round(duracion_ms, 2), "ruta": ruta, "huella": h},
+            )
+
+    def top(self, n: int = 20, orden: str = "total_ms") -> List[Dict[str, Any]]:
+        clave = {
+            "total_ms": lambda e: e.total_ms,
+            "max_ms": lambda e: e.max_ms,
+            "p95_ms": lambda e: e.p95_ms(),
+            "n": lambda e: e.n,
+        }[orden]
+        return [e.como_dict() for e in sorted(self._huellas.values(), key=clave, reverse=True)[:n]]
+
+    def estadisticas(self) -> Dict[str, Any]:
+        return {
+            "umbral_ms": self.umbral_ms,
+            "huellas": len(self._huellas),
+            "max_huellas": self.max_huellas,
+            "descartadas": self.descartadas,
+            "tiempo_total_ms": round(sum(e.total_ms for e in self._huellas.values()), 2),
+        }
+
+    def limpiar(self) -> None:
+        self._huellas.clear()
+        self.descartadas = 0
+
+
+registro_lentas = RegistroConsultasLentas(
+    umbral_ms=settings.CONSULTAS_LENTAS_UMBRAL_MS,
+    max_huellas=settings.CONSULTAS_LENTAS_MAX_HUELLAS,
+)
+
+
+# -----------------------------
+# Hooks del engine
+# -----------------------------
+def _antes(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("_t_lenta", []).append(time.perf_counter())
+
+
+def _despues(conn, cursor, statement, parameters, context, executemany) -> None:
+    registro_lentas.registrar(statement, (time.perf_counter() - conn.info["_t_lenta"].pop()) * 1000)
+
+
+def instalar_registro_lentas(sync_engine: Engine) -> None:
+    """Registra los hooks en el engine síncrono subyacente (AsyncEngine.sync_engine)."""
+    if not event.contains(sync_engine, "before_cursor_execute", _antes):
+        event.listen(sync_engine, "before_cursor_execute", _antes)
+        event.listen(sync_engine, "after_cursor_execute", _despues)
@@ -0,0 +1,124 @@
+# app/db/instrumentacion.py
+"""
+Instrumentación SQL por petición.
+
+Los hooks del engine (before/after_cursor_execute) acumulan en la métrica de la petición
+en curso (ContextVar) el número de sentencias, el tiempo en BD y las filas modificadas
+(INSERT/UPDATE/DELETE). Las filas devueltas por un SELECT no se cuentan: cursor.rowcount
+no las da de forma fiable (-1 en SQLite, parcial con resultados en streaming/yield_per).
+El middleware abre la métrica al entrar, añade la cabecera Server-Timing y deja una línea
+de log con campos estructurados al terminar.
+"""
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger("app.peticiones")
+
+
+@dataclass
+class MetricasSQL:
+    sentencias: int = 0
+    tiempo_db_ms: float = 0.0
+    filas_modificadas: int = 0
+    inicio: float = field(default_factory=time.perf_counter)
+    # scope ASGI de la petición: el router añade "route" al mismo dict al resolver la ruta
+    scope: Optional[Dict[str, Any]] = field(default=None, repr=False)
+
+    def ruta(self) -> Optional[str]:
+        if self.scope is None:
+            return None
+        return getattr(self.scope.get("route"), "path", self.scope.get("path"))
+
+    def server_timing(self) -> str:
+        total_ms = (time.perf_counter() - self.inicio) * 1000
+        return (
+            f'db;dur={self.tiempo_db_ms:.2f};desc="{self.sentencias} sentencias, {self.filas_modificadas} filas modificadas", '
+            f"total;dur={total_ms:.2f}"
+        )
+
+
+_metricas_actuales: ContextVar[Optional[MetricasSQL]] = ContextVar("metricas_sql", default=None)
+
+
+def metricas_actuales() -> Optional[MetricasSQL]:
+    return _metricas_actuales.get()
+
+
+# -----------------------------
+# Hooks del engine
+# -----------------------------
+def _antes(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("_t_sentencia", []).append(time.perf_counter())
+
+
+def _despues(conn, cursor, statement, parameters, context, executemany) -> None:
+    duracion = time.perf_counter() - conn.info["_t_sentencia"].pop()
+    metricas = _metricas_actuales.get()
+    if metricas is not None:
+        metricas.sentencias += 1
+        metricas.tiempo_db_ms += duracion * 1000
+        # rowcount solo es fiable en DML (en executemany puede ser -1 según el driver)
+        es_dml = context is not None and (context.isinsert or context.isupdate or context.isdelete)
+        if es_dml and cursor.rowcount and cursor.rowcount > 0:
+            metricas.filas_modificadas += cursor.rowcount
+
+
+def instalar_instrumentacion_sql(sync_engine: Engine) -> None:
+    """Registra los hooks en el engine síncrono subyacente (AsyncEngine.sync_engine)."""
+    if not event.contains(sync_engine, "before_cursor_execute", _antes):
+        event.listen(sync_engine, "before_cursor_execute", _antes)
+        event.listen(sync_engine, "after_cursor_execute", _despues)
+
+
+# -----------------------------
+# Middleware ASGI
+# -----------------------------
+class InstrumentacionSQLMiddleware:
+    """
+    Middleware ASGI puro (no BaseHTTPMiddleware) para no romper StreamingResponse.
+    En respuestas en streaming la cabecera refleja lo ocurrido antes del primer byte;
+    la línea de log sí incluye todo lo ejecutado hasta el final del cuerpo.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metricas = MetricasSQL(scope=scope)
+        token = _metricas_actuales.set(metricas)
+        status = 500
+
+        async def send_instrumentado(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", metricas.server_timing().encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_instrumentado)
+        finally:
+            _metricas_actuales.reset(token)
+            campos = {
+                "metodo": scope["method"],
+                "ruta": metricas.ruta(),
+                "status": status,
+                "duracion_ms": round((time.perf_counter() - metricas.inicio) * 1000, 2),
+                "sql_sentencias": metricas.sentencias,
+                "sql_tiempo_ms": round(metricas.tiempo_db_ms, 2),
+                "sql_filas_modificadas": metricas.filas_modificadas,
+            }
+            # texto en formato logfmt + los mismos campos en `extra` para formateadores JSON
+            logger.info(" ".join(f"{k}={v}" for k, v in campos.items()), extra=campos)
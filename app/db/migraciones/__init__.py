@@ -0,0 +1,124 @@
+# app/db/migraciones/__init__.py
+"""
+Migraciones de esquema versionadas.
+
+Cada migración es un módulo en app/db/migraciones/versiones/ llamado vNNNN_descripcion.py
+con una constante DESCRIPCION y dos funciones síncronas que reciben una Connection:
+
+    def subir(conn) -> None: ...
+    def bajar(conn) -> None: ...
+
+Las aplicadas se registran en la tabla schema_migraciones. Se ejecutan en orden de versión,
+cada una en su propia transacción (en MySQL el DDL hace commit implícito: una migración que
+falla a medias puede requerir limpieza manual; por eso las de índices usan checkfirst).
+
+CLI: python -m scripts.migrar estado | subir [--hasta V] | bajar --hasta V
+"""
+import importlib
+import pkgutil
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, select, insert, delete, inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateColumn
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# MetaData propia: la tabla de control no forma parte de Base.metadata (create_all/drop_all)
+TABLA_MIGRACIONES = Table(
+    "schema_migraciones",
+    MetaData(),
+    Column("version", String(16), primary_key=True),
+    Column("descripcion", String(255), nullable=False),
+    Column("aplicada_en", DateTime, nullable=False),
+)
+
+
+@dataclass(frozen=True)
+class Migracion:
+    version: str
+    descripcion: str
+    subir: Callable[[Connection], None]
+    bajar: Callable[[Connection], None]
+
+
+def descubrir() -> List[Migracion]:
+    from app.db.migraciones import versiones
+
+    migraciones = []
+    for info in pkgutil.iter_modules(versiones.__path__):
+        if not info.name.startswith("v"):
+            continue
+        modulo = importlib.import_module(f"{versiones.__name__}.{info.name}")
+        version = info.name[1:].split("_", 1)[0]
+        migraciones.append(Migracion(version, modulo.DESCRIPCION, modulo.subir, modulo.bajar))
+    migraciones.sort(key=lambda m: m.version)
+    return migraciones
+
+
+# -----------------------------
+# Utilidades para las migraciones (DDL portable MySQL / SQLite)
+# -----------------------------
+def tiene_columna(conn: Connection, tabla: str, columna: str) -> bool:
+    return any(c["name"] == columna for c in inspect(conn).get_columns(tabla))
+
+
+def agregar_columna(conn: Connection, tabla: str, columna: Column) -> None:
+    if tiene_columna(conn, tabla, columna.name):
+        return
+    Table(tabla, MetaData(), columna)  # CreateColumn necesita la columna asociada a una tabla
+    q = conn.dialect.identifier_preparer.quote
+    conn.execute(text(f"ALTER TABLE {q(tabla)} ADD COLUMN {CreateColumn(columna).compile(dialect=conn.dialect)}"))
+
+
+def eliminar_columna(conn: Connection, tabla: str, columna: str) -> None:
+    if not tiene_columna(conn, tabla, columna):
+        return
+    q = conn.dialect.identifier_preparer.quote
+    conn.execute(text(f"ALTER TABLE {q(tabla)} DROP COLUMN {q(columna)}"))
+
+
+async def _aplicadas(engine: AsyncEngine) -> Dict[str, datetime]:
+    async with engine.begin() as conn:
+        await conn.run_sync(TABLA_MIGRACIONES.create, checkfirst=True)
+        filas = (await conn.execute(select(TABLA_MIGRACIONES.c.version, TABLA_MIGRACIONES.c.aplicada_en))).all()
+    return {v: f for v, f in filas}
+
+
+async def estado(engine: AsyncEngine) -> List[Tuple[Migracion, Optional[datetime]]]:
+    aplicadas = await _aplicadas(engine)
+    return [(m, aplicadas.get(m.version)) for m in descubrir()]
+
+
+async def subir(engine: AsyncEngine, hasta: Optional[str] = None) -> List[str]:
+    """Aplica las pendientes (hasta la versión `hasta` incluida). Devuelve las versiones aplicadas."""
+    aplicadas = await _aplicadas(engine)
+    hechas = []
+    for m in descubrir():
+        if hasta is not None and m.version > hasta:
+            break
+        if m.version in aplicadas:
+            continue
+        async with engine.begin() as conn:
+            await conn.run_sync(m.subir)
+            await conn.execute(insert(TABLA_MIGRACIONES).values(
+                version=m.version, descripcion=m.descripcion, aplicada_en=datetime.utcnow()))
+        hechas.append(m.version)
+    return hechas
+
+
+async def bajar(engine: AsyncEngine, hasta: str) -> List[str]:
+    """Revierte, de la más nueva a la más antigua, las aplicadas con versión mayor que `hasta`."""
+    aplicadas = await _aplicadas(engine)
+    hechas = []
+    for m in reversed(descubrir()):
+        if m.version <= hasta:
+            break
+        if m.version not in aplicadas:
+            continue
+        async with engine.begin() as conn:
+            await conn.run_sync(m.bajar)
+            await conn.execute(delete(TABLA_MIGRACIONES).where(TABLA_MIGRACIONES.c.version == m.version))
+        hechas.append(m.version)
+    return hechas
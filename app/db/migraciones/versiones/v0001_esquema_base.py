@@ -0,0 +1,161 @@
+# app/db/migraciones/versiones/v0001_esquema_base.py
+"""
+Esquema base: las tablas tal como existían antes de versionar el esquema.
+
+Las tablas se redeclaran aquí (no se usa Base.metadata) para que la migración no cambie
+si cambian los modelos: sin los índices de 0002, sin las columnas de certificado de 0003
+(con la columna antigua certificado_participacion), sin VersionDatos (0004) y sin las
+tablas resumen (las crea 'python -m scripts.resumenes reconstruir').
+"""
+from sqlalchemy import (
+    Boolean, Column, Date, DateTime, Enum, ForeignKey, Integer, MetaData, String, Table, Time,
+)
+from sqlalchemy.engine import Connection
+
+DESCRIPCION = "Esquema base (tablas de app/models)"
+
+_md = MetaData()
+
+# enums con los nombres de miembro (lo que guarda Enum(ClaseEnum) del ORM)
+_tipo_evento = Enum("LUDICO", "ACADEMICO", name="tipoeventoenum")
+_estado_evento = Enum("REGISTRADO", "EN_REVISION", "APROBADO", name="estadoeventoenum")
+_estado_evaluacion = Enum("APROBADO", "RECHAZADO", name="estadoevaluacionenum")
+_estado_notificacion = Enum("PENDIENTE", "ENVIADO", name="estadonotificacionenum")
+_estado_credencial = Enum("VIGENTE", "EXPIRADA", name="estadocredencialenum")
+
+# -----------------------------
+# Organizaciones
+# -----------------------------
+Table(
+    "Facultad", _md,
+    Column("id_facultad", Integer, primary_key=True, index=True, autoincrement=True),
+    Column("nombre", String(150), nullable=False),
+)
+Table(
+    "Programa", _md,
+    Column("id_programa", Integer, primary_key=True, index=True, autoincrement=True),
+    Column("nombre", String(150), nullable=False),
+    Column("id_facultad", Integer, ForeignKey("Facultad.id_facultad")),
+)
+Table(
+    "UnidadAcademica", _md,
+    Column("id_unidad_academica", Integer, primary_key=True, index=True, autoincrement=True),
+    Column("nombre", String(150), nullable=False),
+    Column("id_facultad", Integer, ForeignKey("Facultad.id_facultad")),
+)
+Table(
+    "OrganizacionExterna", _md,
+    Column("id_organizacion", Integer, primary_key=True, index=True, autoincrement=True),
+    Column("nombre", String(150), nullable=False),
+    Column("representante_legal", String(100), nullable=False),
+    Column("telefono", String(20)),
+    Column("ubicacion", String(200), nullable=False),
+    Column("sector_economico", String(100)),
+    Column("actividad_principal", String(200)),
+)
+Table(
+    "Instalacion", _md,
+    Column("id_instalacion", Integer, primary_key=True, index=True, autoincrement=True),
+    Column("nombre", String(150), nullable=False),
+    Column("ubicacion", String(200)),
+    Column("capacidad", Integer),
+)
+
+# -----------------------------
+# Usuarios
+# -----------------------------
+Table(
+    "Usuario", _md,
+    Column("id_usuario", Integer, primary_key=True, index=True, autoincrement=False),
+    Column("nombre", String(100), nullable=False),
+    Column("correo", String(100), unique=True, nullable=False),
+    Column("telefono", String(20)),
+    Column("rol", String(30), nullable=False),
+)
+Table(
+    "Docente", _md,
+    Column("id_usuario", Integer, ForeignKey("Usuario.id_usuario"), primary_key=True, autoincrement=False),
+    Column("id_unidad_academica", Integer, ForeignKey("UnidadAcademica.id_unidad_academica"), nullable=False),
+)
+Table(
+    "Estudiante", _md,
+    Column("id_usuario", Integer, ForeignKey("Usuario.id_usuario"), primary_key=True, autoincrement=False),
+    Column("id_programa", Integer, ForeignKey("Programa.id_programa"), nullable=False),
+)
+Table(
+    "SecretariaAcademica", _md,
+    Column("id_usuario", Integer, ForeignKey("Usuario.id_usuario"), primary_key=True, autoincrement=False),
+    Column("id_facultad", Integer, ForeignKey("Facultad.id_facultad"), nullable=False),
+)
+Table(
+    "Credencial", _md,
+    Column("id_credencial", Integer, primary_key=True, index=True, autoincrement=True),
+    Column("id_usuario", Integer, ForeignKey("Usuario.id_usuario"), nullable=False),
+    Column("hash_password", String(255), nullable=False),
+    Column("fecha_creacion", DateTime),
+    Column("estado", _estado_credencial),
+)
+
+# -----------------------------
+# Eventos
+# -----------------------------
+Table(
+    "Evento", _md,
+    Column("id_evento", Integer, primary_key=True, index=True, autoincrement=True),
+    Column("nombre", String(100), nullable=False),
+    Column("descripcion", String(500)),
+    Column("tipo", _tipo_evento, nullable=False),
+    Column("estado", _estado_evento),
+    Column("fecha_inicio", Date, nullable=False),
+    Column("fecha_fin", Date, nullable=False),
+    Column("hora_inicio", Time, nullable=False),
+    Column("hora_fin", Time, nullable=False),
+)
+Table(
+    "EventoResponsable", _md,
+    Column("id_evento", Integer, ForeignKey("Evento.id_evento"), primary_key=True),
+    Column("id_usuario", Integer, ForeignKey("Usuario.id_usuario"), primary_key=True),
+    Column("fecha_asignacion", Date, nullable=False),
+)
+Table(
+    "InstalacionEvento", _md,
+    Column("id_evento", Integer, ForeignKey("Evento.id_evento"), primary_key=True),
+    Column("id_instalacion", Integer, ForeignKey("Instalacion.id_instalacion"), primary_key=True),
+)
+Table(
+    "Representante", _md,
+    Column("id_evento", Integer, ForeignKey("Evento.id_evento"), primary_key=True),
+    Column("id_organizacion", Integer, ForeignKey("OrganizacionExterna.id_organizacion"), primary_key=True),
+    Column("es_legal", Boolean),
+    Column("nombre_representante", String(100)),
+    Column("representante_legal", String(2)),
+    Column("certificado_participacion", String(255)),  # sustituida por el almacén de blobs en 0003
+)
+Table(
+    "Evaluacion", _md,
+    Column("id_evaluacion", Integer, primary_key=True, index=True, autoincrement=True),
+    Column("id_evento", Integer, ForeignKey("Evento.id_evento")),
+    Column("id_secretaria", Integer, ForeignKey("SecretariaAcademica.id_usuario")),
+    Column("estado", _estado_evaluacion, nullable=False),
+    Column("fecha_evaluacion", Date, nullable=False),
+    Column("justificacion", String(500)),
+    Column("acta_aprobacion", String(255)),
+)
+Table(
+    "Notificacion", _md,
+    Column("id_notificacion", Integer, primary_key=True, index=True, autoincrement=True),
+    Column("id_evaluacion", Integer, ForeignKey("Evaluacion.id_evaluacion"), nullable=False),
+    Column("id_usuario", Integer, ForeignKey("Usuario.id_usuario"), nullable=False),
+    Column("mensaje", String(500), nullable=False),
+    Column("estado", _estado_notificacion),
+    Column("fecha_envio", DateTime),
+)
+
+
+def subir(conn: Connection) -> None:
+    # bases ya creadas con create_all (p. ej. por scripts.sembrar_datos) quedan como están
+    _md.create_all(conn, checkfirst=True)
+
+
+def bajar(conn: Connection) -> None:
+    raise RuntimeError("El esquema base no se revierte; usa 'python -m scripts.sembrar_datos --reset' para recrearlo")
@@ -0,0 +1,59 @@
+# app/db/migraciones/versiones/v0002_indices_consultas.py
+"""
+Índices compuestos / de cobertura para las rutas de acceso de las consultas analíticas.
+
+Las tablas se redeclaran aquí solo con las columnas indexadas para que la migración no
+cambie si cambian los modelos. En InnoDB cada índice secundario lleva implícita la PK,
+así que (id_organizacion, id_evento) o (id_instalacion, id_evento) cubren la consulta entera.
+"""
+from sqlalchemy import Column, Index, MetaData, Table
+from sqlalchemy.engine import Connection
+
+DESCRIPCION = "Índices para q1, q2/q4, q3, q6, q8/q9, q10 y el listado paginado de eventos"
+
+_md = MetaData()
+_evento = Table("Evento", _md, Column("estado"), Column("fecha_inicio"))
+_representante = Table("Representante", _md, Column("id_organizacion"), Column("id_evento"))
+_instalacion_evento = Table("InstalacionEvento", _md, Column("id_instalacion"), Column("id_evento"))
+_evento_responsable = Table("EventoResponsable", _md, Column("id_usuario"), Column("id_evento"))
+_evaluacion = Table("Evaluacion", _md, Column("id_evento"), Column("fecha_evaluacion"),
+                    Column("id_evaluacion"), Column("estado"))
+_credencial = Table("Credencial", _md, Column("estado"), Column("fecha_creacion"), Column("id_usuario"))
+
+# (índice, columna FK con la que empieza o None)
+INDICES = (
+    (Index("ix_evento_estado_fecha_inicio", _evento.c.estado, _evento.c.fecha_inicio), None),
+    (Index("ix_evento_fecha_inicio", _evento.c.fecha_inicio), None),
+    (Index("ix_representante_organizacion", _representante.c.id_organizacion, _representante.c.id_evento),
+     "id_organizacion"),
+    (Index("ix_instalacion_evento_instalacion", _instalacion_evento.c.id_instalacion, _instalacion_evento.c.id_evento),
+     "id_instalacion"),
+    (Index("ix_evento_responsable_usuario", _evento_responsable.c.id_usuario, _evento_responsable.c.id_evento),
+     "id_usuario"),
+    (Index("ix_evaluacion_evento_fecha", _evaluacion.c.id_evento, _evaluacion.c.fecha_evaluacion,
+           _evaluacion.c.id_evaluacion, _evaluacion.c.estado),
+     "id_evento"),
+    (Index("ix_credencial_estado_fecha", _credencial.c.estado, _credencial.c.fecha_creacion, _credencial.c.id_usuario),
+     None),
+)
+
+
+def _indice_fk(indice: Index, fk: str) -> Index:
+    """Índice simple sobre la columna FK, con el nombre que MySQL da al índice automático."""
+    return Index(fk, Table(indice.table.name, MetaData(), Column(fk)).c[fk])
+
+
+def subir(conn: Connection) -> None:
+    for indice, fk in INDICES:
+        indice.create(conn, checkfirst=True)
+        if fk is not None and conn.dialect.name == "mysql":
+            # el índice nuevo empieza por la FK y la respalda: el simple (si quedó de un bajar) sobra
+            _indice_fk(indice, fk).drop(conn, checkfirst=True)
+
+
+def bajar(conn: Connection) -> None:
+    for indice, fk in reversed(INDICES):
+        if fk is not None and conn.dialect.name == "mysql":
+            # MySQL no deja borrar el único índice que respalda una FK: se repone antes uno simple
+            _indice_fk(indice, fk).create(conn, checkfirst=True)
+        indice.drop(conn, checkfirst=True)
@@ -0,0 +1,65 @@
+# app/db/migraciones/versiones/v0003_certificados_a_blobs.py
+"""
+Certificados de participación fuera de la fila de Representante.
+
+Sube cada certificado_participacion existente al almacén de blobs (BLOBS_BACKEND/BLOBS_DIR),
+guarda en la fila digest, tamaño y media type, y elimina la columna con los bytes.
+Se recorre fila a fila leyendo solo la PK primero para no cargar todos los PDF a la vez.
+"""
+from sqlalchemy import Column, Integer, LargeBinary, MetaData, String, Table, select, update
+from sqlalchemy.dialects.mysql import LONGBLOB
+from sqlalchemy.engine import Connection
+
+from app.core.blobs import obtener_almacen
+from app.db.migraciones import agregar_columna, eliminar_columna, tiene_columna
+
+DESCRIPCION = "Certificados de Representante al almacén de blobs (sha256, tamaño, media type)"
+
+_TABLA = "Representante"
+_COLUMNA_ANTIGUA = "certificado_participacion"
+
+
+def _tabla(*extra: Column) -> Table:
+    return Table(_TABLA, MetaData(), Column("id_evento", Integer), Column("id_organizacion", Integer), *extra)
+
+
+def _media_type(datos: bytes) -> str:
+    return "application/pdf" if datos.startswith(b"%PDF") else "application/octet-stream"
+
+
+def subir(conn: Connection) -> None:
+    agregar_columna(conn, _TABLA, Column("certificado_sha256", String(64), nullable=True))
+    agregar_columna(conn, _TABLA, Column("certificado_tamano", Integer, nullable=True))
+    agregar_columna(conn, _TABLA, Column("certificado_media_type", String(100), nullable=True))
+    if not tiene_columna(conn, _TABLA, _COLUMNA_ANTIGUA):
+        return
+
+    t = _tabla(Column(_COLUMNA_ANTIGUA, LargeBinary), Column("certificado_sha256", String(64)),
+               Column("certificado_tamano", Integer), Column("certificado_media_type", String(100)))
+    almacen = obtener_almacen()
+    claves = conn.execute(
+        select(t.c.id_evento, t.c.id_organizacion).where(t.c[_COLUMNA_ANTIGUA].is_not(None))
+    ).all()
+    for id_evento, id_organizacion in claves:
+        pk = (t.c.id_evento == id_evento) & (t.c.id_organizacion == id_organizacion)
+        datos = conn.execute(select(t.c[_COLUMNA_ANTIGUA]).where(pk)).scalar_one()
+        if isinstance(datos, str):  # columnas VARCHAR/TEXT heredadas
+            datos = datos.encode("latin-1")
+        blob = almacen.escribir(datos)
+        conn.execute(update(t).where(pk).values(
+            certificado_sha256=blob.sha256, certificado_tamano=blob.tamano, certificado_media_type=_media_type(datos)))
+    eliminar_columna(conn, _TABLA, _COLUMNA_ANTIGUA)
+
+
+def bajar(conn: Connection) -> None:
+    agregar_columna(conn, _TABLA, Column(_COLUMNA_ANTIGUA, LargeBinary().with_variant(LONGBLOB(), "mysql"), nullable=True))
+    t = _tabla(Column(_COLUMNA_ANTIGUA, LargeBinary), Column("certificado_sha256", String(64)))
+    almacen = obtener_almacen()
+    filas = conn.execute(
+        select(t.c.id_evento, t.c.id_organizacion, t.c.certificado_sha256).where(t.c.certificado_sha256.is_not(None))
+    ).all()
+    for id_evento, id_organizacion, sha256 in filas:
+        pk = (t.c.id_evento == id_evento) & (t.c.id_organizacion == id_organizacion)
+        conn.execute(update(t).where(pk).values({_COLUMNA_ANTIGUA: almacen.leer(sha256)}))
+    for columna in ("certificado_media_type", "certificado_tamano", "certificado_sha256"):
+        eliminar_columna(conn, _TABLA, columna)
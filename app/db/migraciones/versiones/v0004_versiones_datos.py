@@ -0,0 +1,27 @@
+# app/db/migraciones/versiones/v0004_versiones_datos.py
+"""
+Tabla VersionDatos: contadores de cambios por tabla y por entidad para los ETags de
+/eventos y /consultas (app/db/versiones.py). Se crea con una versión inicial por tabla; las claves
+de entidad aparecen con la primera escritura que las toca.
+"""
+from sqlalchemy import BigInteger, Column, MetaData, String, Table
+from sqlalchemy.engine import Connection
+
+from app.db.versiones import reiniciar_versiones
+
+DESCRIPCION = "Contadores de versión para ETags (VersionDatos)"
+
+_tabla = Table(
+    "VersionDatos", MetaData(),
+    Column("clave", String(100), primary_key=True),
+    Column("version", BigInteger, nullable=False),
+)
+
+
+def subir(conn: Connection) -> None:
+    _tabla.create(conn, checkfirst=True)
+    reiniciar_versiones(conn)
+
+
+def bajar(conn: Connection) -> None:
+    _tabla.drop(conn, checkfirst=True)
@@ -0,0 +1,72 @@
+# app/db/paralelo.py
+"""
+Ejecución concurrente de SELECTs independientes de una misma consulta.
+
+En modo paralelo la primera sentencia va en la sesión de la petición y cada una de las
+demás en su propia sesión (y por tanto su propia conexión del pool); se lanzan con
+asyncio.gather. Un semáforo limita las conexiones adicionales para que una consulta no use
+más de CONSULTAS_MAX_CONEXIONES_POR_PETICION a la vez contando la de la petición, y así no
+vaciar el pool bajo carga.
+
+Importante: al ir en conexiones distintas, cada sentencia ve su propio snapshot y solo la
+primera ve escrituras sin commit de la sesión de la petición. Solo usar para lecturas analíticas.
+"""
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+
+from sqlalchemy.engine import Result
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.mysql import AsyncSessionLocal
+
+# Semáforo compartido por todas las consultas de una misma petición (lo fija p. ej. un batch)
+_semaforo_peticion: ContextVar[Optional[asyncio.Semaphore]] = ContextVar("semaforo_peticion", default=None)
+
+
+@contextmanager
+def limitar_conexiones(max_conexiones: int) -> Iterator[asyncio.Semaphore]:
+    """
+    Comparte un único límite de conexiones adicionales (las que se abren además de la sesión
+    de cada consulta) entre todo lo que se ejecute dentro del bloque.
+    """
+    semaforo = asyncio.Semaphore(max_conexiones)
+    token = _semaforo_peticion.set(semaforo)
+    try:
+        yield semaforo
+    finally:
+        _semaforo_peticion.reset(token)
+
+
+async def ejecutar_independientes(
+    session: AsyncSession,
+    *stmts,
+    paralelo: Optional[bool] = None,
+) -> List[Result]:
+    """
+    Ejecuta sentencias que no dependen entre sí y devuelve sus resultados en el mismo orden.
+      - paralelo=False: una tras otra en `session` (comportamiento clásico).
+      - paralelo=True: concurrentes; la primera en `session` y el resto cada una en su conexión,
+        acotadas por el semáforo de la petición (CONSULTAS_MAX_CONEXIONES_POR_PETICION - 1).
+      - paralelo=None: usa settings.CONSULTAS_PARALELAS.
+    """
+    if paralelo is None:
+        paralelo = settings.CONSULTAS_PARALELAS
+    adicionales = settings.CONSULTAS_MAX_CONEXIONES_POR_PETICION - 1
+    if not paralelo or len(stmts) < 2 or adicionales < 1:
+        return [await session.execute(stmt) for stmt in stmts]
+
+    semaforo = _semaforo_peticion.get() or asyncio.Semaphore(adicionales)
+
+    async def _una(stmt):
+        async with semaforo:
+            # mismo engine que la sesión de la petición (primario o réplica)
+            async with AsyncSessionLocal(bind=session.bind) as s:
+                # freeze() deja las filas en memoria para usarlas tras cerrar la sesión
+                return (await s.execute(stmt)).freeze()
+
+    # la conexión de la petición ya cuenta en el límite: la primera sentencia va en ella
+    primero, *congelados = await asyncio.gather(session.execute(stmts[0]), *(_una(stmt) for stmt in stmts[1:]))
+    return [primero, *(frozen() for frozen in congelados)]
@@ -0,0 +1,189 @@
+# app/db/replica.py
+"""
+Lecturas contra una réplica de MySQL (opcional: REPLICA_DATABASE_URL).
+
+  - get_session_lectura: dependencia para rutas de solo lectura (/consultas, listados y detalle).
+    Usa la réplica si está configurada y disponible; si no, el primario.
+  - Lectura de las propias escrituras: cuando una petición hace commit con cambios, la
+    respuesta lleva la cookie `leer_primario` durante REPLICA_VENTANA_LECTURA_PROPIA segundos;
+    mientras el cliente la envíe (o envíe la cabecera `X-Leer-Primario: 1`) lee del primario.
+  - Réplica caída: si no se puede obtener conexión se usa el primario y la réplica se
+    descarta durante REPLICA_REINTENTO_S segundos antes de volver a probarla.
+
+La respuesta indica el origen de la lectura en la cabecera `X-Origen-Lectura` (replica | primario).
+Para probarlo en local basta con dos instancias (p. ej. dos contenedores MySQL en los puertos
+3306 y 3307, o dos ficheros sqlite+aiosqlite) y REPLICA_DATABASE_URL apuntando a la segunda.
+Nota: una respuesta de /consultas leída de una réplica con retraso puede quedar en la caché
+hasta su TTL aunque el commit en el primario la haya invalidado.
+"""
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine
+from sqlalchemy.orm import sessionmaker, Session
+
+from app.core.config import settings
+from app.core.metricas import PoolConMetricas
+from app.db.mysql import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+COOKIE_LEER_PRIMARIO = "leer_primario"
+
+
+class _PoolReplica(PoolConMetricas):
+    motor = "replica"
+
+
+# 1) Engine y session factory de la réplica (mismos parámetros de pool que el primario)
+def _crear_engine_replica(url: str) -> AsyncEngine:
+    connect_args = {"connect_timeout": settings.REPLICA_TIMEOUT_CONEXION} if url.startswith("mysql") else {}
+    return create_async_engine(
+        url,
+        echo=settings.DEBUG,
+        poolclass=_PoolReplica,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_pre_ping=True,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        connect_args=connect_args,
+    )
+
+
+engine_replica: Optional[AsyncEngine] = (
+    _crear_engine_replica(settings.REPLICA_DATABASE_URL) if settings.REPLICA_DATABASE_URL else None
+)
+AsyncSessionReplica = (
+    sessionmaker(bind=engine_replica, class_=AsyncSession, expire_on_commit=False)
+    if engine_replica is not None else None
+)
+
+_replica_caida_hasta = 0.0
+
+# Estado de la petición en curso (lo fija LecturaConsistenteMiddleware):
+#   leer_primario: el cliente pidió leer del primario; escribio: hubo commit con cambios; origen: replica|primario
+_estado_peticion: ContextVar[Optional[Dict[str, Any]]] = ContextVar("estado_lectura", default=None)
+
+
+def replica_disponible() -> bool:
+    return AsyncSessionReplica is not None and time.monotonic() >= _replica_caida_hasta
+
+
+def _marcar_replica_caida(error: BaseException) -> None:
+    global _replica_caida_hasta
+    _replica_caida_hasta = time.monotonic() + settings.REPLICA_REINTENTO_S
+    logger.warning("Réplica no disponible, se lee del primario durante %.0f s: %s", settings.REPLICA_REINTENTO_S, error)
+
+
+async def _abrir_en_replica() -> Optional[AsyncSession]:
+    estado = _estado_peticion.get()
+    if not replica_disponible() or (estado is not None and estado["leer_primario"]):
+        return None
+    session = AsyncSessionReplica()
+    try:
+        # fuerza el checkout ahora para detectar la caída antes de entregar la sesión
+        await session.connection()
+    except (DBAPIError, OSError, asyncio.TimeoutError) as e:
+        await session.close()
+        _marcar_replica_caida(e)
+        return None
+    return session
+
+
+# 2) Sesión de lectura
+@asynccontextmanager
+async def sesion_lectura() -> AsyncIterator[AsyncSession]:
+    """Sesión en la réplica si procede; si no, en el primario. Solo para lecturas."""
+    session = await _abrir_en_replica()
+    origen = "replica" if session is not None else "primario"
+    estado = _estado_peticion.get()
+    if estado is not None:
+        estado["origen"] = origen
+    async with (session or AsyncSessionLocal()) as s:
+        s.info["origen_lectura"] = origen
+        yield s
+
+
+async def get_session_lectura() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependencia de FastAPI para rutas de solo lectura:
+        async def endpoint(session: AsyncSession = Depends(get_session_lectura)):
+            ...
+    """
+    async with sesion_lectura() as session:
+        yield session
+
+
+# 3) Detección de escrituras (commit con cambios en la petición en curso)
+def _al_flush(session, flush_context) -> None:
+    session.info["_escribio"] = True
+
+
+def _al_commit(session) -> None:
+    if session.info.pop("_escribio", False):
+        estado = _estado_peticion.get()
+        if estado is not None:
+            estado["escribio"] = True
+
+
+def _al_rollback(session) -> None:
+    session.info.pop("_escribio", None)
+
+
+def _al_ejecutar(orm_execute_state) -> None:
+    # INSERT/UPDATE/DELETE enviados con session.execute() no pasan por flush
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["_escribio"] = True
+
+
+def instalar_deteccion_escrituras() -> None:
+    for nombre, fn in (("after_flush", _al_flush), ("after_commit", _al_commit),
+                       ("after_rollback", _al_rollback), ("do_orm_execute", _al_ejecutar)):
+        if not event.contains(Session, nombre, fn):
+            event.listen(Session, nombre, fn)
+
+
+# 4) Middleware ASGI
+class LecturaConsistenteMiddleware:
+    """Lee la preferencia del cliente y marca con cookie las respuestas de peticiones que escribieron."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        cabeceras = dict(scope.get("headers", []))
+        leer_primario = (
+            cabeceras.get(b"x-leer-primario") == b"1"
+            or f"{COOKIE_LEER_PRIMARIO}=".encode() in cabeceras.get(b"cookie", b"")
+        )
+        estado = {"leer_primario": leer_primario, "escribio": False, "origen": None}
+        token = _estado_peticion.set(estado)
+
+        async def send_con_estado(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                if estado["origen"]:
+                    headers.append((b"x-origen-lectura", estado["origen"].encode()))
+                if estado["escribio"]:
+                    ventana = int(settings.REPLICA_VENTANA_LECTURA_PROPIA)
+                    headers.append((b"set-cookie", (
+                        f"{COOKIE_LEER_PRIMARIO}={int(time.time())}; Max-Age={ventana}; Path=/; HttpOnly; SameSite=Lax"
+                    ).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_con_estado)
+        finally:
+            _estado_peticion.reset(token)
@@ -0,0 +1,194 @@
+# app/db/versiones.py
+"""
+Contadores de versión de los datos, para ETags de /eventos y /consultas.
+
+  - Cada escritura del ORM (flush de objetos o INSERT/UPDATE/DELETE enviados con
+    session.execute) sube, dentro de la misma transacción, el contador de su tabla y, para
+    las tablas de ENTIDADES_VERSIONADAS, el de la entidad ("Evento:42"). Si la transacción
+    se revierte, los contadores también.
+  - Contador de tabla fragmentado: FRAGMENTOS filas ("Evento", "Evento#1", ...) y cada
+    transacción sube una al azar; la versión de la tabla es la suma. Así dos escrituras
+    concurrentes sobre la misma tabla casi nunca esperan por la misma fila hasta el commit.
+  - Entidades: versión propia (0 si nunca se modificó por el ORM) más la generación de su
+    tabla ("Evento:*"), que sube con los UPDATE/DELETE en bloque (no se sabe qué filas tocan)
+    y al activar el versionado en cada arranque (por si hubo escrituras con el versionado
+    desactivado).
+  - Los contadores viven en la BD (tabla VersionDatos): todos los workers y la réplica ven
+    la misma versión; leerlos es una búsqueda por PK.
+  - Las cargas que no pasan por el ORM (scripts.sembrar_datos, SQL manual) deben llamar a
+    reiniciar_versiones al terminar; si no, un cliente podría recibir 304 con datos viejos.
+
+Los hooks solo se instalan (activar_versionado, en el arranque) con ETAGS_HABILITADOS y
+la tabla creada (migración 0004); sin ellos las escrituras no tocan VersionDatos y
+condicional no emite ETags. Las claves se actualizan en orden para que dos transacciones
+no se bloqueen en orden inverso.
+"""
+import logging
+import random
+import time
+from typing import Dict, Iterable, Optional, Set
+
+from sqlalchemy import delete, event, inspect, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.eventos.version import VersionDatosModel
+
+logger = logging.getLogger(__name__)
+
+# tablas con versión por fila además de la de tabla (detalle con ETag propio)
+ENTIDADES_VERSIONADAS = {"Evento"}
+# filas por contador de tabla
+FRAGMENTOS = 16
+
+_activo = False
+
+
+def clave_entidad(tabla: str, *pk) -> str:
+    return f"{tabla}:{','.join(str(v) for v in pk)}"
+
+
+def clave_generacion(tabla: str) -> str:
+    return f"{tabla}:*"
+
+
+def _clave_fragmento(tabla: str, i: int) -> str:
+    return tabla if i == 0 else f"{tabla}#{i}"
+
+
+def versionado_activo() -> bool:
+    return _activo
+
+
+# -----------------------------
+# Escritura: subir contadores
+# -----------------------------
+def _subir_en(conn: Connection, claves: Set[str]) -> None:
+    if not claves:
+        return
+    inicial = time.time_ns() // 1000  # µs: una tabla recreada no repite versiones anteriores
+    filas = [{"clave": c, "version": inicial} for c in sorted(claves)]
+    if conn.dialect.name == "sqlite":
+        stmt = sqlite_insert(VersionDatosModel).values(filas)
+        stmt = stmt.on_conflict_do_update(index_elements=["clave"], set_={"version": VersionDatosModel.version + 1})
+    else:
+        stmt = mysql_insert(VersionDatosModel).values(filas)
+        stmt = stmt.on_duplicate_key_update(version=VersionDatosModel.version + 1)
+    conn.execute(stmt)
+
+
+def _subir(session: Session, tablas: Set[str], entidades: Set[str] = frozenset()) -> None:
+    if not tablas and not entidades:
+        return
+    fragmento = random.randrange(FRAGMENTOS)
+    _subir_en(session.connection(), {_clave_fragmento(t, fragmento) for t in tablas} | set(entidades))
+
+
+def _despues_de_flush(session: Session, flush_context) -> None:
+    tablas: Set[str] = set()
+    entidades: Set[str] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        tabla = getattr(obj, "__tablename__", None)
+        if tabla is None or tabla == VersionDatosModel.__tablename__:
+            continue
+        tablas.add(tabla)
+        if tabla in ENTIDADES_VERSIONADAS:
+            # las altas aún no tienen identity key en after_flush, pero sí la PK asignada
+            entidades.add(clave_entidad(tabla, *inspect(obj).mapper.primary_key_from_instance(obj)))
+    _subir(session, tablas, entidades)
+
+
+def _al_ejecutar(orm_execute_state) -> None:
+    # escrituras en bloque (update(EventoModel)..., insert(...).values([...])): no se sabe qué
+    # filas tocan, así que un UPDATE/DELETE sube la generación de todas las entidades de la tabla
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or mapper.local_table.name == VersionDatosModel.__tablename__:
+        return
+    tabla = mapper.local_table.name
+    generacion = set()
+    if tabla in ENTIDADES_VERSIONADAS and not orm_execute_state.is_insert:
+        generacion.add(clave_generacion(tabla))
+    _subir(orm_execute_state.session, {tabla}, generacion)
+
+
+def _claves_iniciales() -> Set[str]:
+    from app.db.mysql import Base
+
+    tablas = [t for t in Base.metadata.tables if t != VersionDatosModel.__tablename__]
+    return {*tablas, *(clave_generacion(t) for t in ENTIDADES_VERSIONADAS)}
+
+
+async def activar_versionado(motor: AsyncEngine) -> bool:
+    """
+    Instala los hooks si ETAGS_HABILITADOS y VersionDatos existe (llamado en el arranque).
+    Sube las versiones de todas las tablas y generaciones: las escrituras hechas mientras el
+    versionado estaba desactivado no subieron ningún contador.
+    """
+    global _activo
+    if not settings.ETAGS_HABILITADOS:
+        return False
+    async with motor.begin() as conn:
+        if not await conn.run_sync(lambda c: inspect(c).has_table(VersionDatosModel.__tablename__)):
+            logger.warning("Tabla VersionDatos inexistente (¿falta la migración 0004?): ETags desactivados")
+            return False
+        await conn.run_sync(_subir_en, _claves_iniciales())
+    if not event.contains(Session, "after_flush", _despues_de_flush):
+        event.listen(Session, "after_flush", _despues_de_flush)
+        event.listen(Session, "do_orm_execute", _al_ejecutar)
+    _activo = True
+    return True
+
+
+def reiniciar_versiones(conn: Connection) -> None:
+    """
+    Versión nueva para todas las tablas y generaciones (nunca menor que la anterior: se
+    suben las filas existentes en vez de recrearlas). Se olvidan las versiones de entidad.
+    """
+    if not inspect(conn).has_table(VersionDatosModel.__tablename__):
+        return
+    clave = VersionDatosModel.clave
+    conn.execute(delete(VersionDatosModel).where(clave.like("%:%"), clave.not_like("%:*")))
+    conn.execute(update(VersionDatosModel).values(version=VersionDatosModel.version + 1))
+    _subir_en(conn, _claves_iniciales())  # las que faltan entran con la marca de tiempo
+
+
+# -----------------------------
+# Lectura
+# -----------------------------
+async def leer_versiones(session: AsyncSession, claves: Iterable[str]) -> Optional[Dict[str, int]]:
+    """
+    Versión de cada clave: tabla (suma de sus fragmentos), entidad o generación (0 sin fila).
+    None si alguna tabla aún no tiene contador o VersionDatos no existe: sin ETag.
+    """
+    claves = list(claves)
+    buscar = set()
+    for c in claves:
+        if ":" in c:
+            buscar.add(c)
+        else:
+            buscar.update(_clave_fragmento(c, i) for i in range(FRAGMENTOS))
+    try:
+        filas = dict((await session.execute(
+            select(VersionDatosModel.clave, VersionDatosModel.version).where(VersionDatosModel.clave.in_(buscar))
+        )).all())
+    except DBAPIError as e:
+        await session.rollback()
+        logger.warning("No se pudieron leer las versiones (¿falta la migración 0004?): %s", e)
+        return None
+    versiones = {}
+    for c in claves:
+        if ":" in c:
+            versiones[c] = filas.get(c, 0)
+            continue
+        fragmentos = [filas[k] for k in (_clave_fragmento(c, i) for i in range(FRAGMENTOS)) if k in filas]
+        if not fragmentos:
+            return None
+        versiones[c] = sum(fragmentos)
+    return versiones
@@ -1,4 +1,6 @@
 # app/main.py
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
@@ -10,17 +12,32 @@ from app.core.config import settings
 from app.api.routes.consultas_eventos import router as consultas_router
 
 from app.api.routes.eventos import router as eventos_router
+from app.api.routes.representante import router as representantes_router
 
-# Publica todas las rutas de "eventos" bajo el prefijo /api/v1
-app.include_router(eventos_router, prefix="/api/v1")  # ← monta el router de eventos en la app
+from app.db.mysql import engine, iniciar_engine, cerrar_engine
+from app.db.versiones import activar_versionado
+from app.db.replica import engine_replica, instalar_deteccion_escrituras, LecturaConsistenteMiddleware
 
-from app.api.routes.representante import router as representantes_router
-app.include_router(representantes_router, prefix="/api/v1")  # monta subrutas /api/v1/eventos/{id_evento}/organizaciones
+# Registra todos los modelos para que las relaciones por nombre se resuelvan
+from app import models as _modelos  # noqa: F401
 
 
+# --- Ciclo de vida: pool por worker, precalentado al arrancar y cerrado al apagar ---
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await iniciar_engine(settings.DB_POOL_PRECALENTAR)
+    if engine_replica is not None:
+        await iniciar_engine(settings.DB_POOL_PRECALENTAR, engine_replica)
+    # contadores de versión (ETags): solo con ETAGS_HABILITADOS y la tabla VersionDatos creada
+    await activar_versionado(engine)
+    yield
+    await cerrar_engine()
+    if engine_replica is not None:
+        await cerrar_engine(engine_replica)
 
 
 app = FastAPI(
+    lifespan=lifespan,
     title=settings.APP_NAME,
     description="API para registro, evaluación y consultas analíticas de eventos académicos/lúdicos.",
     version=settings.APP_VERSION,
@@ -35,17 +52,83 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Motores instrumentados: el primario y, si existe, la réplica (ahí corren las rutas de lectura)
+motores = {"primario": engine, **({"replica": engine_replica} if engine_replica is not None else {})}
+
+# --- Instrumentación SQL por petición (Server-Timing + log estructurado) ---
+if settings.INSTRUMENTAR_SQL:
+    from app.db.instrumentacion import instalar_instrumentacion_sql, InstrumentacionSQLMiddleware
+    for motor in motores.values():
+        instalar_instrumentacion_sql(motor.sync_engine)
+    app.add_middleware(InstrumentacionSQLMiddleware)
+
+# --- Registro de consultas lentas por huella (GET /api/v1/admin/consultas-lentas) ---
+if settings.REGISTRAR_CONSULTAS_LENTAS:
+    from app.db.consultas_lentas import instalar_registro_lentas
+    for motor in motores.values():
+        instalar_registro_lentas(motor.sync_engine)
+
+# --- Detección de N+1 (cargas perezosas repetidas por sesión) ---
+if settings.MODO_ESTRICTO_CARGAS != "off":
+    from app.db.cargas_perezosas import instalar_deteccion_cargas_perezosas
+    instalar_deteccion_cargas_perezosas()
+
+# --- Métricas Prometheus (GET /metrics) ---
+if settings.METRICAS_HABILITADAS:
+    from fastapi.responses import PlainTextResponse
+    from app.core.metricas import registro, registrar_pool, MetricasMiddleware
+    for nombre, motor in motores.items():
+        registrar_pool(motor.sync_engine, nombre)
+    app.add_middleware(MetricasMiddleware)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return PlainTextResponse(registro.exponer(), media_type="text/plain; version=0.0.4")
+
+# --- Réplica de lectura: lectura de las propias escrituras (cookie leer_primario) ---
+if engine_replica is not None:
+    instalar_deteccion_escrituras()
+    app.add_middleware(LecturaConsistenteMiddleware)
+
+# --- Compresión (gzip / br / zstd) de respuestas de texto; el más externo, ve las cabeceras finales ---
+if settings.COMPRESION_HABILITADA:
+    from app.core.compresion import CompresionMiddleware, codificadores_disponibles
+    app.add_middleware(
+        CompresionMiddleware,
+        codificadores=codificadores_disponibles(
+            settings.COMPRESION_ALGORITMOS, settings.COMPRESION_NIVEL_GZIP,
+            settings.COMPRESION_CALIDAD_BROTLI, settings.COMPRESION_NIVEL_ZSTD,
+        ),
+        minimo_bytes=settings.COMPRESION_MINIMO_BYTES,
+        umbral_hilo=settings.COMPRESION_UMBRAL_HILO,
+    )
+
 # --- Routers /api/v1 ---
 # Si en el futuro creas un agregador (api_router_v1), usa:
 # app.include_router(api_router_v1, prefix="/api/v1")
 # Por ahora montamos routers individuales:
 app.include_router(consultas_router, prefix="/api/v1")
-# app.include_router(eventos_router, prefix="/api/v1")
+# Publica todas las rutas de "eventos" bajo el prefijo /api/v1
+app.include_router(eventos_router, prefix="/api/v1")
+app.include_router(representantes_router, prefix="/api/v1")  # monta subrutas /api/v1/eventos/{id_evento}/organizaciones
+# admin (consultas lentas): solo con el registro activo y protegido por ADMIN_TOKEN
+if settings.REGISTRAR_CONSULTAS_LENTAS and settings.ADMIN_TOKEN:
+    from app.api.routes.admin import router as admin_router
+    app.include_router(admin_router, prefix="/api/v1")
 # app.include_router(usuarios_router, prefix="/api/v1")
 # app.include_router(organizaciones_router, prefix="/api/v1")
 # app.include_router(evaluaciones_router, prefix="/api/v1")
 # app.include_router(notificaciones_router, prefix="/api/v1")
 
+# --- Tablas resumen de consultas (mantenimiento incremental en cada flush) ---
+if settings.USAR_RESUMENES:
+    from app.crud.eventos.resumenes import instalar_mantenimiento_resumenes
+    instalar_mantenimiento_resumenes()
+
+# --- Invalidación de la caché de /consultas en cada commit ---
+from app.core.cache import instalar_invalidacion_cache
+instalar_invalidacion_cache()
+
 # --- Redirección raíz a /docs ---
 @app.get("/")
 async def root():
@@ -0,0 +1,8 @@
+# app/models/__init__.py
+# Importa todos los modelos para que las relaciones declaradas por nombre
+# (relationship("InstalacionModel"), ...) se resuelvan sin importar el orden de carga.
+from app.models.organizaciones import facultad, programa, unidad_academica, organizacion_externa, instalacion  # noqa: F401
+from app.models.usuarios import usuario, docente, estudiante, secretaria_academica, credencial  # noqa: F401
+from app.models.eventos import (  # noqa: F401
+    evento, evento_responsable, instalacion_evento, representante, evaluacion, notificacion, resumen, version,
+)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Enum, Date, ForeignKey
+from sqlalchemy import Column, Integer, String, Enum, Date, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.db.mysql import Base
 import enum
@@ -14,6 +14,10 @@ class EvaluacionModel(Base):
     Evaluaciones realizadas por la Secretaría Académica sobre eventos.
     """
     __tablename__ = "Evaluacion"
+    __table_args__ = (
+        # q10: ventana por evento ordenada por fecha; incluye estado para no leer la fila
+        Index("ix_evaluacion_evento_fecha", "id_evento", "fecha_evaluacion", "id_evaluacion", "estado"),
+    )
 
     id_evaluacion = Column(Integer, primary_key=True, index=True, autoincrement=True)
     id_evento = Column(Integer, ForeignKey("Evento.id_evento"))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Enum, Date, Time
+from sqlalchemy import Column, Integer, String, Enum, Date, Time, Index
 from sqlalchemy.orm import relationship
 from app.db.mysql import Base
 import enum
@@ -20,6 +20,12 @@ class EventoModel(Base):
     Modelo de base de datos para eventos académicos y lúdicos.
     """
     __tablename__ = "Evento"
+    __table_args__ = (
+        # q3 (estado + periodo ordenado por fecha) y listado filtrado por estado
+        Index("ix_evento_estado_fecha_inicio", "estado", "fecha_inicio"),
+        # listado paginado por (fecha_inicio, id_evento) y q9 (periodo)
+        Index("ix_evento_fecha_inicio", "fecha_inicio"),
+    )
 
     id_evento = Column(Integer, primary_key=True, index=True, autoincrement=True)
     nombre = Column(String(100), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, Date
+from sqlalchemy import Column, Integer, ForeignKey, Date, Index
 from sqlalchemy.orm import relationship
 from app.db.mysql import Base
 
@@ -9,6 +9,10 @@ class EventoResponsableModel(Base):
     Un evento puede tener varios responsables y un usuario puede estar en varios eventos.
     """
     __tablename__ = "EventoResponsable"
+    __table_args__ = (
+        # q8/q9: eventos por usuario organizador
+        Index("ix_evento_responsable_usuario", "id_usuario", "id_evento"),
+    )
 
     id_evento = Column(Integer, ForeignKey("Evento.id_evento"), primary_key=True)
     id_usuario = Column(Integer, ForeignKey("Usuario.id_usuario"), primary_key=True)
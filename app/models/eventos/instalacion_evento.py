@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey
+from sqlalchemy import Column, Integer, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.db.mysql import Base
 
@@ -8,6 +8,10 @@ class InstalacionEventoModel(Base):
     Tabla intermedia para asociar eventos con instalaciones.
     """
     __tablename__ = "InstalacionEvento"
+    __table_args__ = (
+        # q2/q4: eventos por instalación y conteo agrupado por instalación
+        Index("ix_instalacion_evento_instalacion", "id_instalacion", "id_evento"),
+    )
 
     id_evento = Column(Integer, ForeignKey("Evento.id_evento"), primary_key=True)
     id_instalacion = Column(Integer, ForeignKey("Instalacion.id_instalacion"), primary_key=True)
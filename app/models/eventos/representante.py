@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, Boolean, String
+from sqlalchemy import Column, Integer, ForeignKey, Boolean, String, Index
 from sqlalchemy.orm import relationship
 from app.db.mysql import Base
 
@@ -8,13 +8,22 @@ class RepresentanteModel(Base):
     Tabla intermedia para registrar la participación de organizaciones externas en eventos.
     """
     __tablename__ = "Representante"
+    __table_args__ = (
+        # q1: eventos de una organización (la PK empieza por id_evento)
+        Index("ix_representante_organizacion", "id_organizacion", "id_evento"),
+    )
 
     id_evento = Column(Integer, ForeignKey("Evento.id_evento"), primary_key=True)
     id_organizacion = Column(Integer, ForeignKey("OrganizacionExterna.id_organizacion"), primary_key=True)
 
     # Atributos adicionales
     es_legal = Column(Boolean, default=True)  # True si es el representante legal
-    certificado_participacion = Column(String(255), nullable=True)  # Ruta o nombre del archivo PDF
+    nombre_representante = Column(String(100), nullable=True)  # quien asiste al evento
+    representante_legal = Column(String(2), nullable=True)  # 'Si' | 'No'
+    # Certificado PDF: los bytes viven en el almacén de blobs (app/core/blobs.py), aquí solo sus metadatos
+    certificado_sha256 = Column(String(64), nullable=True)
+    certificado_tamano = Column(Integer, nullable=True)
+    certificado_media_type = Column(String(100), nullable=True)
 
     # Relaciones
     evento = relationship("EventoModel", back_populates="organizaciones")
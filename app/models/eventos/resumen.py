@@ -0,0 +1,52 @@
+from sqlalchemy import Column, Integer, Enum
+from app.db.mysql import Base
+from app.models.eventos.evento import TipoEventoEnum
+
+
+class ResumenOrganizacionTipoModel(Base):
+    """
+    Resumen: eventos por organización externa y tipo (consulta 1).
+    Se mantiene incrementalmente desde las escrituras de Representante.
+    """
+    __tablename__ = "ResumenOrganizacionTipo"
+
+    id_organizacion = Column(Integer, primary_key=True)
+    tipo = Column(Enum(TipoEventoEnum), primary_key=True)
+    n_eventos = Column(Integer, nullable=False, default=0)
+
+
+class ResumenInstalacionTipoModel(Base):
+    """
+    Resumen: eventos por instalación y tipo (consultas 2 y 4).
+    Se mantiene incrementalmente desde las escrituras de InstalacionEvento.
+    """
+    __tablename__ = "ResumenInstalacionTipo"
+
+    id_instalacion = Column(Integer, primary_key=True)
+    tipo = Column(Enum(TipoEventoEnum), primary_key=True)
+    n_eventos = Column(Integer, nullable=False, default=0)
+
+
+class ResumenUsuarioTipoModel(Base):
+    """
+    Resumen: eventos organizados por usuario y tipo (consulta 8).
+    Se mantiene incrementalmente desde las escrituras de EventoResponsable.
+    """
+    __tablename__ = "ResumenUsuarioTipo"
+
+    id_usuario = Column(Integer, primary_key=True)
+    tipo = Column(Enum(TipoEventoEnum), primary_key=True)
+    n_eventos = Column(Integer, nullable=False, default=0)
+
+
+class ResumenInstalacionOrganizadorModel(Base):
+    """
+    Resumen: eventos por instalación, tipo y organizador (organizadores distintos en consultas 2 y 4).
+    Depende de InstalacionEvento y EventoResponsable a la vez.
+    """
+    __tablename__ = "ResumenInstalacionOrganizador"
+
+    id_instalacion = Column(Integer, primary_key=True)
+    tipo = Column(Enum(TipoEventoEnum), primary_key=True)
+    id_usuario = Column(Integer, primary_key=True)
+    n_eventos = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, BigInteger
+from app.db.mysql import Base
+
+
+class VersionDatosModel(Base):
+    """
+    Contadores de cambios para ETags (app/db/versiones.py).
+    clave = fragmento de tabla ("Evento", "Evento#3"), entidad ("Evento:42") o generación
+    ("Evento:*"); version sube con cada escritura confirmada que la toca. El valor inicial es una marca de tiempo, así que
+    recrear la tabla no repite versiones ya entregadas a los clientes.
+    """
+    __tablename__ = "VersionDatos"
+
+    clave = Column(String(100), primary_key=True)
+    version = Column(BigInteger, nullable=False)
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.orm import relationship
+from app.db.mysql import Base
+
+
+class InstalacionModel(Base):
+    """
+    Tabla de instalaciones (espacios físicos) donde se realizan los eventos.
+    """
+    __tablename__ = "Instalacion"
+
+    id_instalacion = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    nombre = Column(String(150), nullable=False)
+    ubicacion = Column(String(200), nullable=True)
+    capacidad = Column(Integer, nullable=True)
+
+    # Relación con eventos
+    eventos = relationship("InstalacionEventoModel", back_populates="instalacion")
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Enum
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Enum, Index
 from sqlalchemy.orm import relationship
 from app.db.mysql import Base
 import enum
@@ -17,6 +17,10 @@ class CredencialModel(Base):
     pero solo una estará vigente.
     """
     __tablename__ = "Credencial"
+    __table_args__ = (
+        # q6: credenciales activas anteriores a una fecha; incluye id_usuario para no leer la fila
+        Index("ix_credencial_estado_fecha", "estado", "fecha_creacion", "id_usuario"),
+    )
 
     id_credencial = Column(Integer, primary_key=True, index=True, autoincrement=True)
     id_usuario = Column(Integer, ForeignKey("Usuario.id_usuario"), nullable=False)
@@ -13,6 +13,7 @@ class UsuarioModel(Base):
     nombre = Column(String(100), nullable=False)
     correo = Column(String(100), unique=True, nullable=False)
     telefono = Column(String(20), nullable=True)
+    rol = Column(String(30), nullable=False)  # estudiante | docente | secretaria_academica
 
     # Relaciones hacia las tablas hijas
     estudiante = relationship("EstudianteModel", back_populates="usuario", uselist=False)
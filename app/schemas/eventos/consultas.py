@@ -0,0 +1,54 @@
+from pydantic import BaseModel, Field, model_validator
+from typing import Any, Dict, List, Literal, Optional
+from datetime import date
+
+
+class ParamsVacios(BaseModel):
+    pass
+
+
+class ParamsOrganizacion(BaseModel):
+    id_organizacion: int = Field(..., description="ID de la organización externa")
+
+
+class ParamsInstalacion(BaseModel):
+    id_instalacion: int = Field(..., description="ID de la instalación")
+
+
+class ParamsPeriodo(BaseModel):
+    desde: date = Field(..., description="Fecha inicial (YYYY-MM-DD)")
+    hasta: date = Field(..., description="Fecha final (YYYY-MM-DD)")
+
+    @model_validator(mode="after")
+    def validar_periodo(self):
+        if self.hasta < self.desde:
+            raise ValueError("El parámetro 'hasta' no puede ser menor que 'desde'.")
+        return self
+
+
+class ParamsFechaBase(BaseModel):
+    fecha_base: Optional[date] = Field(None, description="Fecha de referencia (opcional)")
+
+
+class ConsultaBatchItem(BaseModel):
+    consulta: Literal["q1", "q2", "q3", "q4", "q5", "q6", "q7", "q8", "q9", "q10"]
+    params: Dict[str, Any] = Field(default_factory=dict, description="Parámetros de la consulta")
+
+
+class ConsultaBatchPeticion(BaseModel):
+    consultas: List[ConsultaBatchItem] = Field(..., min_length=1, max_length=50)
+
+
+class ConsultaBatchResultado(BaseModel):
+    consulta: str
+    ok: bool
+    status_code: int = Field(..., description="Código HTTP que habría devuelto la ruta individual")
+    espera_ms: float = Field(..., description="Tiempo en cola hasta obtener turno de ejecución")
+    duracion_ms: float = Field(..., description="Tiempo de ejecución de la consulta")
+    resultado: Optional[Any] = None
+    error: Optional[Any] = None
+
+
+class ConsultaBatchRespuesta(BaseModel):
+    duracion_total_ms: float
+    resultados: List[ConsultaBatchResultado]
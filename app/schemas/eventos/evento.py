@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, ConfigDict, field_validator
-from typing import Optional
+from pydantic import BaseModel, Field, ConfigDict, ValidationInfo, field_validator
+from typing import Any, Optional, List
 from datetime import date, time
 from enum import Enum
 
@@ -28,18 +28,20 @@ class EventoBase(BaseModel):
 
     @field_validator("fecha_fin")
     @classmethod
-    def validar_rango_fechas(cls, v, values):
-        fecha_inicio = values.get("fecha_inicio")
+    def validar_rango_fechas(cls, v, info: ValidationInfo):
+        fecha_inicio = info.data.get("fecha_inicio")
         if fecha_inicio and v < fecha_inicio:
             raise ValueError("La fecha_fin no puede ser anterior a fecha_inicio")
         return v
 
     @field_validator("hora_fin")
     @classmethod
-    def validar_rango_horas(cls, v, values):
-        hora_inicio = values.get("hora_inicio")
-        if hora_inicio and v <= hora_inicio:
-            raise ValueError("La hora_fin debe ser mayor que hora_inicio")
+    def validar_rango_horas(cls, v, info: ValidationInfo):
+        # misma regla que el service: las horas solo se comparan si el evento dura un día
+        hora_inicio = info.data.get("hora_inicio")
+        mismo_dia = info.data.get("fecha_inicio") == info.data.get("fecha_fin")
+        if hora_inicio and mismo_dia and v <= hora_inicio:
+            raise ValueError("En el mismo día, hora_fin debe ser mayor que hora_inicio")
         return v
 
 
@@ -51,4 +53,31 @@ class Evento(EventoBase):
     id_evento: int = Field(..., alias="id_evento")
     estado: EstadoEventoEnum
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+
+class EventoPagina(BaseModel):
+    items: List[Evento]
+    next_cursor: Optional[str] = Field(None, description="Cursor opaco para pedir la siguiente página")
+
+
+# -----------------------------
+# Alta en lote (POST /eventos/bulk)
+# -----------------------------
+class EventoCrearLoteItem(EventoCrear):
+    id_responsable: int = Field(..., description="ID del usuario (estudiante/docente) responsable")
+
+
+class EventoLoteResultado(BaseModel):
+    indice: int = Field(..., description="Posición del item en el array enviado")
+    ok: bool
+    status_code: int = Field(..., description="Código HTTP que habría devuelto POST /eventos para este item")
+    id_evento: Optional[int] = None
+    error: Optional[Any] = None
+
+
+class EventoLoteRespuesta(BaseModel):
+    creados: int
+    fallidos: int
+    duracion_ms: float
+    resultados: List[EventoLoteResultado]
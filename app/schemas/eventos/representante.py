@@ -1,5 +1,8 @@
-from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional
+from pydantic import BaseModel, Field, ConfigDict, computed_field
+from typing import Any, List, Optional
+
+# ruta de descarga (routes/representante.py montado bajo /api/v1 en main.py)
+RUTA_CERTIFICADO = "/api/v1/eventos/{id_evento}/organizaciones/{id_organizacion}/certificado"
 
 class RepresentanteBase(BaseModel):
     id_evento: int = Field(..., description="ID del evento asociado")
@@ -10,19 +13,55 @@ class RepresentanteBase(BaseModel):
     representante_legal: str = Field(
         ..., description="Indica si es el representante legal", pattern="^(Si|No)$"
     )
-    certificado_participacion: Optional[bytes] = Field(
-        None, description="Archivo PDF firmado por el representante legal"
-    )
 
 class RepresentanteCrear(RepresentanteBase):
     pass
 
 class Representante(RepresentanteBase):
+    """Solo metadatos del certificado: el archivo se descarga aparte, en url_certificado."""
     model_config = ConfigDict(from_attributes=True)
 
+    certificado_sha256: Optional[str] = Field(None, description="SHA-256 del certificado PDF")
+    certificado_tamano: Optional[int] = Field(None, description="Tamaño del certificado en bytes")
+    certificado_media_type: Optional[str] = Field(None, description="Tipo de contenido del certificado")
+
+    @computed_field(description="True si la organización adjuntó certificado")
+    @property
+    def tiene_certificado(self) -> bool:
+        return self.certificado_sha256 is not None
+
+    @computed_field(description="Ruta de descarga del certificado (None si no hay)")
+    @property
+    def url_certificado(self) -> Optional[str]:
+        if self.certificado_sha256 is None:
+            return None
+        return RUTA_CERTIFICADO.format(id_evento=self.id_evento, id_organizacion=self.id_organizacion)
+
 class RepresentanteActualizar(BaseModel):
     nombre_representante: Optional[str] = None
     representante_legal: Optional[str] = Field(
         None, pattern="^(Si|No)$", description="Actualizar si es representante legal"
     )
-    certificado_participacion: Optional[bytes] = None
\ No newline at end of file
+
+# -----------------------------
+# Alta en lote (POST /eventos/{id_evento}/organizaciones/bulk)
+# -----------------------------
+class RepresentanteLoteItem(BaseModel):
+    id_organizacion: int = Field(..., description="ID de la organización externa")
+    nombre_representante: str = Field(..., min_length=1, max_length=100)
+    representante_legal: str = Field(..., pattern="^(Si|No)$")
+    certificado: Optional[int] = Field(
+        None, ge=0, description="Posición en `certificados` del PDF de esta organización (None = sin certificado)"
+    )
+
+class RepresentanteLoteResultado(BaseModel):
+    indice: int = Field(..., description="Posición del item en el array enviado")
+    ok: bool
+    status_code: int = Field(..., description="Código HTTP que habría devuelto POST /eventos/{id}/organizaciones")
+    representante: Optional[Representante] = None
+    error: Optional[Any] = None
+
+class RepresentanteLoteRespuesta(BaseModel):
+    creados: int
+    fallidos: int
+    resultados: List[RepresentanteLoteResultado]
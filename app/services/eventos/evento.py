@@ -1,18 +1,30 @@
 # app/services/eventos/evento_service.py
+import base64
+import csv
+import io
+import json
 from datetime import datetime, time, date
-from typing import Optional, Sequence, Dict, Any
+from enum import Enum
+from typing import Optional, Sequence, Dict, Any, Tuple, AsyncIterator, List
 
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from app.models.eventos.evento import EventoModel, EstadoEventoEnum, TipoEventoEnum
+from app.schemas.eventos.evento import EventoCrearLoteItem
 from app.models.usuarios.usuario import UsuarioModel
+from app.db.replica import sesion_lectura
 from app.crud.eventos.evento import (
     crear_evento as crud_crear_evento,
-    listar_eventos as crud_listar_eventos,          # si tu CRUD 2 no trae filtros, igual lo exponemos
+    crear_eventos_en_lote as crud_crear_eventos_en_lote,
+    listar_eventos as crud_listar_eventos,
     buscar_evento_por_id as crud_buscar_evento_por_id,
     actualizar_evento as crud_actualizar_evento,
     eliminar_evento as crud_eliminar_evento,
+    iterar_eventos_por_lotes as crud_iterar_eventos_por_lotes,
+    COLUMNAS_EXPORTACION,
 )
 
 # -----------------------------
@@ -29,6 +41,21 @@ def _validar_fechas_horas(
     if fecha_inicio == fecha_fin and hora_fin <= hora_inicio:
         raise ValueError("En el mismo día, hora_fin debe ser mayor que hora_inicio.")
 
+_CAMPOS_FECHA_HORA = (("fecha_inicio", date), ("fecha_fin", date), ("hora_inicio", time), ("hora_fin", time))
+
+def _parsear_fechas_horas(datos: Dict[str, Any]) -> Dict[str, Any]:
+    """El cuerpo de un PATCH llega como JSON: fechas y horas en ISO 8601 -> date/time."""
+    parseados = dict(datos)
+    for campo, tipo in _CAMPOS_FECHA_HORA:
+        valor = parseados.get(campo)
+        if valor is None or isinstance(valor, tipo):
+            continue
+        try:
+            parseados[campo] = tipo.fromisoformat(valor)
+        except (TypeError, ValueError):
+            raise ValueError(f"{campo} inválido: {valor!r} (formato ISO 8601).")
+    return parseados
+
 async def _validar_responsable_puede_crear(session: AsyncSession, id_responsable: int) -> UsuarioModel:
     stmt = select(UsuarioModel).where(UsuarioModel.id_usuario == id_responsable)
     res = await session.execute(stmt)
@@ -39,6 +66,19 @@ async def _validar_responsable_puede_crear(session: AsyncSession, id_responsable
         raise PermissionError("Solo usuarios con rol 'estudiante' o 'docente' pueden crear eventos.")
     return usuario
 
+def _codificar_cursor(fecha_inicio: date, id_evento: int) -> str:
+    """Cursor opaco (base64 url-safe) con la última clave (fecha_inicio, id_evento) entregada."""
+    crudo = json.dumps([fecha_inicio.isoformat(), id_evento]).encode()
+    return base64.urlsafe_b64encode(crudo).decode().rstrip("=")
+
+def _decodificar_cursor(cursor: str) -> Tuple[date, int]:
+    try:
+        relleno = "=" * (-len(cursor) % 4)
+        fecha, id_evento = json.loads(base64.urlsafe_b64decode(cursor + relleno))
+        return date.fromisoformat(fecha), int(id_evento)
+    except (ValueError, TypeError):
+        raise ValueError("Cursor de paginación inválido.")
+
 # -----------------------------
 # Services (fachada de negocio)
 # -----------------------------
@@ -65,31 +105,97 @@ async def crear_evento_service(
     evento = await crud_crear_evento(session, evento_in, id_responsable)
     return evento
 
+async def crear_eventos_lote_service(
+    session: AsyncSession,
+    items: Sequence[Any],
+) -> List[Dict[str, Any]]:
+    """
+    Mismas reglas que crear_evento_service, item a item, pero con una sola consulta para los
+    responsables (IN) y una sola transacción para insertar todos los items válidos.
+    Devuelve un resultado por item, en el orden recibido (ver EventoLoteResultado).
+    """
+    resultados: list = [None] * len(items)
+
+    def _error(i: int, status_code: int, error: Any) -> None:
+        resultados[i] = {"indice": i, "ok": False, "status_code": status_code, "error": error}
+
+    # 1) Validación de cada item (schema + coherencia fecha/hora)
+    validos = []
+    for i, crudo in enumerate(items):
+        try:
+            item = EventoCrearLoteItem.model_validate(crudo)
+            _validar_fechas_horas(item.fecha_inicio, item.fecha_fin, item.hora_inicio, item.hora_fin)
+        except ValidationError as e:
+            _error(i, 422, e.errors(include_url=False, include_context=False))
+            continue
+        except ValueError as e:
+            _error(i, 400, str(e))
+            continue
+        validos.append((i, item))
+
+    # 2) Responsables: existencia y rol con una sola consulta
+    ids_usuario = {item.id_responsable for _, item in validos}
+    roles = dict((await session.execute(
+        select(UsuarioModel.id_usuario, UsuarioModel.rol).where(UsuarioModel.id_usuario.in_(ids_usuario))
+    )).all()) if ids_usuario else {}
+    a_insertar = []
+    for i, item in validos:
+        rol = roles.get(item.id_responsable)
+        if rol is None:
+            _error(i, 400, f"Usuario responsable con id {item.id_responsable} no existe.")
+        elif rol not in ("estudiante", "docente"):
+            _error(i, 403, "Solo usuarios con rol 'estudiante' o 'docente' pueden crear eventos.")
+        else:
+            a_insertar.append((i, item))
+
+    # 3) Inserción en bloque (todo o nada para los items válidos)
+    if a_insertar:
+        filas = [
+            {
+                **item.model_dump(exclude={"estado", "id_responsable", "tipo"}),
+                "tipo": TipoEventoEnum(item.tipo.value),  # enum del modelo
+            }
+            for _, item in a_insertar
+        ]
+        try:
+            ids_evento = await crud_crear_eventos_en_lote(session, filas, [item.id_responsable for _, item in a_insertar])
+        except (SQLAlchemyError, RuntimeError) as e:
+            await session.rollback()
+            for i, _ in a_insertar:
+                _error(i, 500, f"No se insertó ningún evento del lote: {type(e).__name__}: {e}")
+        else:
+            for (i, _), id_evento in zip(a_insertar, ids_evento):
+                resultados[i] = {"indice": i, "ok": True, "status_code": 201, "id_evento": id_evento}
+    return resultados
+
+
 async def listar_eventos_service(
     session: AsyncSession,
     estado: Optional[EstadoEventoEnum] = None,
     tipo: Optional[TipoEventoEnum] = None,
     desde: Optional[date] = None,
     hasta: Optional[date] = None,
-) -> Sequence[EventoModel]:
+    cursor: Optional[str] = None,
+    limite: int = 50,
+    solo_columnas: bool = False,
+) -> Tuple[Sequence[EventoModel], Optional[str]]:
     """
-    Si tu CRUD v2 no implementa filtros, puedes:
-      - (A) extender el CRUD para aceptar filtros (recomendado), o
-      - (B) traer todo y filtrar en memoria (no recomendado en producción).
-    Aquí asumimos que el CRUD ya puede listar, con o sin filtros.
+    Lista una página de eventos con los filtros resueltos en SQL.
+    Devuelve (eventos, next_cursor); next_cursor es None en la última página.
+    Con solo_columnas los eventos son Row (tuplas con nombre) en vez de objetos ORM.
     """
-    # Si tu CRUD.listar_eventos no acepta filtros aún, cambia esta llamada y filtra aquí.
-    eventos = await crud_listar_eventos(session)  # <- reemplaza por la versión con filtros cuando la tengas
-    # Filtro opcional simple en memoria (temporal, si tu CRUD no tiene filtros)
-    if estado is not None:
-        eventos = [e for e in eventos if e.estado == estado]
-    if tipo is not None:
-        eventos = [e for e in eventos if e.tipo == tipo]
-    if desde is not None:
-        eventos = [e for e in eventos if e.fecha_inicio >= desde]
-    if hasta is not None:
-        eventos = [e for e in eventos if e.fecha_inicio <= hasta]
-    return eventos
+    despues_de = _decodificar_cursor(cursor) if cursor else None
+    # Pedimos una fila extra para saber si hay otra página sin hacer un COUNT
+    eventos = await crud_listar_eventos(
+        session, estado, tipo, desde, hasta, despues_de=despues_de, limite=limite + 1,
+        solo_columnas=solo_columnas,
+    )
+    next_cursor = None
+    if len(eventos) > limite:
+        eventos = eventos[:limite]
+        ultimo = eventos[-1]
+        next_cursor = _codificar_cursor(ultimo.fecha_inicio, ultimo.id_evento)
+    return eventos, next_cursor
 
 async def obtener_evento_service(session: AsyncSession, id_evento: int) -> Optional[EventoModel]:
     return await crud_buscar_evento_por_id(session, id_evento)
@@ -103,14 +209,18 @@ async def actualizar_evento_service(
     Reglas:
       - Solo si estado = 'registrado' (lo valida el CRUD y aquí revalidamos fechas si vienen).
     """
-    # Validaciones de coherencia solo si los campos vienen en el payload
-    fi = datos_actualizados.get("fecha_inicio")
-    ff = datos_actualizados.get("fecha_fin")
-    hi = datos_actualizados.get("hora_inicio")
-    hf = datos_actualizados.get("hora_fin")
-    # Si vienen pares suficientes, valida
-    if fi is not None and ff is not None and hi is not None and hf is not None:
-        _validar_fechas_horas(fi, ff, hi, hf)
+    datos_actualizados = _parsear_fechas_horas(datos_actualizados)
+    # Si cambia alguna fecha u hora se valida el resultado completo (lo que llega + lo guardado):
+    # un PATCH parcial no puede dejar un evento que luego el schema de respuesta rechace
+    campos = tuple(c for c, _ in _CAMPOS_FECHA_HORA)
+    if any(datos_actualizados.get(c) is not None for c in campos):
+        actual = await crud_buscar_evento_por_id(session, id_evento)  # queda en el identity map
+        if actual is not None:
+            fi, ff, hi, hf = (
+                datos_actualizados[c] if datos_actualizados.get(c) is not None else getattr(actual, c)
+                for c in campos
+            )
+            _validar_fechas_horas(fi, ff, hi, hf)
     # Delegar al CRUD v2 (usa dict)
     evento = await crud_actualizar_evento(session, id_evento, datos_actualizados)
     return evento
@@ -121,3 +231,44 @@ async def eliminar_evento_service(session: AsyncSession, id_evento: int) -> bool
       - Solo si estado = 'registrado' (lo valida el CRUD v2).
     """
     return await crud_eliminar_evento(session, id_evento)
+
+
+# -----------------------------
+# Exportación en streaming (NDJSON / CSV)
+# -----------------------------
+def _valor_exportable(v: Any) -> Any:
+    if isinstance(v, Enum):
+        return v.value
+    if isinstance(v, (date, time)):
+        return v.isoformat()
+    return v
+
+async def exportar_eventos_service(
+    formato: str,
+    estado: Optional[EstadoEventoEnum] = None,
+    tipo: Optional[TipoEventoEnum] = None,
+    desde: Optional[date] = None,
+    hasta: Optional[date] = None,
+    tamano_lote: int = 1000,
+) -> AsyncIterator[str]:
+    """
+    Genera el export lote a lote. Abre su propia sesión porque el StreamingResponse
+    sigue consumiendo el generador después de que la dependencia get_session se cerró.
+    """
+    async with sesion_lectura() as session:
+        if formato == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(COLUMNAS_EXPORTACION)
+            yield buffer.getvalue()
+        async for lote in crud_iterar_eventos_por_lotes(session, estado, tipo, desde, hasta, tamano_lote):
+            if formato == "csv":
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows([_valor_exportable(v) for v in fila] for fila in lote)
+                yield buffer.getvalue()
+            else:
+                yield "".join(
+                    json.dumps(dict(zip(COLUMNAS_EXPORTACION, map(_valor_exportable, fila))), ensure_ascii=False) + "\n"
+                    for fila in lote
+                )
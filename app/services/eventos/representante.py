@@ -1,8 +1,10 @@
-from typing import List, Optional
+from typing import Any, AsyncIterable, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.eventos import representante as crud_rep
 from app.models.eventos.representante import RepresentanteModel
+from app.schemas.eventos.representante import RepresentanteLoteItem
 
 
 async def agregar_representante_service(
@@ -11,16 +13,50 @@ async def agregar_representante_service(
     id_organizacion: int,
     nombre_representante: str,
     representante_legal: str,           # 'Si' | 'No'
-    certificado_bytes: Optional[bytes],
+    certificado: Optional[Union[bytes, AsyncIterable[bytes]]],
+    certificado_media_type: str = "application/pdf",
 ) -> RepresentanteModel:
     # Aquí podrías validar 'Si'/'No' explícitamente si quieres
     if representante_legal not in ("Si", "No"):
         raise ValueError("representante_legal debe ser 'Si' o 'No'")
     return await crud_rep.agregar_representante(
-        session, id_evento, id_organizacion, nombre_representante, representante_legal, certificado_bytes
+        session, id_evento, id_organizacion, nombre_representante, representante_legal, certificado,
+        certificado_media_type,
     )
 
 
+async def agregar_representantes_lote_service(
+    session: AsyncSession,
+    id_evento: int,
+    items: Sequence[Dict[str, Any]],
+    certificados: Sequence[Tuple[Callable[[], AsyncIterable[bytes]], str]] = (),
+) -> List[Dict[str, Any]]:
+    """
+    `certificados`: (abrir, media_type) por archivo subido; cada item lo referencia por su
+    posición. Devuelve un resultado por item, en el orden recibido (ver RepresentanteLoteResultado).
+    """
+    resultados: List[Dict[str, Any]] = []
+    validos = []
+    for i, crudo in enumerate(items):
+        try:
+            item = RepresentanteLoteItem.model_validate(crudo)
+        except ValidationError as e:
+            resultados.append({"indice": i, "ok": False, "status_code": 422, "error": e.errors(include_url=False, include_context=False)})
+            continue
+        datos = item.model_dump(exclude={"certificado"})
+        if item.certificado is not None:
+            if item.certificado >= len(certificados):
+                resultados.append({"indice": i, "ok": False, "status_code": 422,
+                                   "error": f"certificado {item.certificado} no existe: se enviaron {len(certificados)} archivos"})
+                continue
+            abrir, media_type = certificados[item.certificado]
+            datos.update(certificado=abrir(), certificado_media_type=media_type)
+        validos.append((i, datos))
+    # se llama aunque no quede ningún válido: un evento inexistente o cerrado es error de toda la petición
+    resultados.extend(await crud_rep.agregar_representantes_en_lote(session, id_evento, validos))
+    return sorted(resultados, key=lambda r: r["indice"])
+
+
 async def listar_representantes_por_evento_service(
     session: AsyncSession, id_evento: int
 ) -> List[RepresentanteModel]:
@@ -35,5 +71,11 @@ async def eliminar_representante_service(
 
 async def obtener_certificado_service(
     session: AsyncSession, id_evento: int, id_organizacion: int
-) -> Optional[bytes]:
+) -> Optional[Tuple[bytes, str]]:
     return await crud_rep.obtener_certificado(session, id_evento, id_organizacion)
+
+
+async def obtener_metadatos_certificado_service(
+    session: AsyncSession, id_evento: int, id_organizacion: int
+) -> Optional[Tuple[str, int, str]]:
+    return await crud_rep.obtener_metadatos_certificado(session, id_evento, id_organizacion)
@@ -0,0 +1,24 @@
+# scripts/_estadisticas.py
+"""Utilidades compartidas por los benchmarks de scripts/."""
+import math
+from typing import Dict, Sequence
+
+
+def percentil(muestras: Sequence[float], p: float) -> float:
+    """Percentil por rango más cercano (p en 0..100) sobre una lista ya ordenada."""
+    if not muestras:
+        return 0.0
+    k = max(0, math.ceil(p / 100 * len(muestras)) - 1)
+    return muestras[k]
+
+
+def resumen_latencias(muestras_ms: Sequence[float]) -> Dict[str, float]:
+    orden = sorted(muestras_ms)
+    return {
+        "n": len(orden),
+        "media_ms": sum(orden) / len(orden) if orden else 0.0,
+        "p50_ms": percentil(orden, 50),
+        "p95_ms": percentil(orden, 95),
+        "p99_ms": percentil(orden, 99),
+        "max_ms": orden[-1] if orden else 0.0,
+    }
@@ -0,0 +1,71 @@
+# scripts/bench_consultas_paralelas.py
+"""
+Compara la latencia de q2, q4, q8, q9 y q10 en modo secuencial vs. paralelo
+(sub-consultas independientes en conexiones separadas con asyncio.gather).
+
+Requiere una BD con datos (DATABASE_URL). Uso:
+    python -m scripts.bench_consultas_paralelas --iteraciones 50 --desde 2024-01-01 --hasta 2024-12-31
+"""
+import argparse
+import asyncio
+import time
+from datetime import date
+
+from sqlalchemy import select, func, desc
+
+from app.db.mysql import engine, AsyncSessionLocal
+from app.crud.eventos import consultas as q
+from app.models.eventos.instalacion_evento import InstalacionEventoModel
+from scripts._estadisticas import resumen_latencias
+
+
+async def _medir(llamada, iteraciones: int) -> dict:
+    muestras = []
+    for _ in range(iteraciones):
+        async with AsyncSessionLocal() as session:
+            t0 = time.perf_counter()
+            await llamada(session)
+            muestras.append((time.perf_counter() - t0) * 1000)
+    return resumen_latencias(muestras)
+
+
+async def _instalacion_mas_usada() -> int:
+    async with AsyncSessionLocal() as session:
+        stmt = (
+            select(InstalacionEventoModel.id_instalacion)
+            .group_by(InstalacionEventoModel.id_instalacion)
+            .order_by(desc(func.count()))
+            .limit(1)
+        )
+        return (await session.execute(stmt)).scalar_one()
+
+
+async def main(args) -> None:
+    id_instalacion = args.id_instalacion or await _instalacion_mas_usada()
+    consultas = {
+        "q2": lambda s, p: q.q2_resumen_por_instalacion(s, id_instalacion, paralelo=p),
+        "q4": lambda s, p: q.q4_instalacion_top_y_detalle(s, paralelo=p),
+        "q8": lambda s, p: q.q8_usuarios_por_rol_y_mas_participa(s, paralelo=p),
+        "q9": lambda s, p: q.q9_top5_usuarios_activos(s, args.desde, args.hasta, paralelo=p),
+        "q10": lambda s, p: q.q10_rechazo_inicial_y_revisiones(s, paralelo=p),
+    }
+    print(f"{'consulta':<9}{'modo':<12}{'media':>9}{'p50':>9}{'p95':>9}{'p99':>9}   (ms)")
+    for nombre, fn in consultas.items():
+        # una pasada de calentamiento para no medir el establecimiento de conexiones
+        await _medir(lambda s: fn(s, True), 1)
+        sec = await _medir(lambda s: fn(s, False), args.iteraciones)
+        par = await _medir(lambda s: fn(s, True), args.iteraciones)
+        for modo, r in (("secuencial", sec), ("paralelo", par)):
+            print(f"{nombre:<9}{modo:<12}{r['media_ms']:>9.2f}{r['p50_ms']:>9.2f}{r['p95_ms']:>9.2f}{r['p99_ms']:>9.2f}")
+        if par["media_ms"]:
+            print(f"{'':<9}{'speedup':<12}{sec['media_ms'] / par['media_ms']:>9.2f}x")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iteraciones", type=int, default=30)
+    parser.add_argument("--id-instalacion", type=int, default=None, help="por defecto, la más usada")
+    parser.add_argument("--desde", type=date.fromisoformat, default=date(2000, 1, 1))
+    parser.add_argument("--hasta", type=date.fromisoformat, default=date(2100, 1, 1))
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,143 @@
+# scripts/bench_crud.py
+"""
+Micro-benchmarks de la capa de consultas: cada función de app/crud/eventos/consultas.py
+y app/crud/eventos/representante.py, con p50/p95/p99 y número de sentencias SQL por llamada.
+
+Sembrar antes con scripts.sembrar_datos. Uso:
+    python -m scripts.bench_crud --iteraciones 50 [--solo q2,q9] [--salida resultados.json]
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import date
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from sqlalchemy import event, select, func, desc
+
+import app.models  # noqa: F401
+from app.db.mysql import engine, AsyncSessionLocal
+from app.crud.eventos import consultas as q
+from app.crud.eventos import representante as crud_rep
+from app.models.eventos.evento import EventoModel, EstadoEventoEnum
+from app.models.eventos.representante import RepresentanteModel
+from app.models.eventos.instalacion_evento import InstalacionEventoModel
+from app.models.organizaciones.organizacion_externa import OrganizacionExternaModel
+from scripts._estadisticas import resumen_latencias
+
+
+class ContadorSQL:
+    """Cuenta sentencias enviadas al driver (incluye las de selectinload)."""
+
+    def __init__(self, sync_engine):
+        self.n = 0
+        event.listen(sync_engine, "before_cursor_execute", self._contar)
+
+    def _contar(self, *args, **kwargs) -> None:
+        self.n += 1
+
+
+Caso = Callable[[Any], Awaitable[Any]]
+
+
+async def _medir(nombre: str, caso: Caso, iteraciones: int, contador: ContadorSQL) -> Dict[str, Any]:
+    latencias: List[float] = []
+    sentencias: List[int] = []
+    async with AsyncSessionLocal() as session:
+        await caso(session)  # calentamiento (conexión, caché de compilación)
+        for _ in range(iteraciones):
+            antes = contador.n
+            t0 = time.perf_counter()
+            await caso(session)
+            latencias.append((time.perf_counter() - t0) * 1000)
+            sentencias.append(contador.n - antes)
+    return {"funcion": nombre, **resumen_latencias(latencias),
+            "sentencias_por_llamada": sum(sentencias) / len(sentencias) if sentencias else 0}
+
+
+async def _parametros(session) -> Dict[str, Any]:
+    """Elige ids representativos (los más usados) del dataset sembrado."""
+    top_org = (await session.execute(
+        select(RepresentanteModel.id_organizacion).group_by(RepresentanteModel.id_organizacion)
+        .order_by(desc(func.count())).limit(1))).scalar_one_or_none()
+    top_inst = (await session.execute(
+        select(InstalacionEventoModel.id_instalacion).group_by(InstalacionEventoModel.id_instalacion)
+        .order_by(desc(func.count())).limit(1))).scalar_one_or_none()
+    evento_con_orgs = (await session.execute(
+        select(RepresentanteModel.id_evento).group_by(RepresentanteModel.id_evento)
+        .order_by(desc(func.count())).limit(1))).scalar_one_or_none()
+    registrados = (await session.execute(
+        select(EventoModel.id_evento).where(EventoModel.estado == EstadoEventoEnum.REGISTRADO).limit(500))).scalars().all()
+    max_org = (await session.execute(select(func.max(OrganizacionExternaModel.id_organizacion)))).scalar_one()
+    return {"id_organizacion": top_org, "id_instalacion": top_inst, "evento_con_orgs": evento_con_orgs,
+            "registrados": registrados, "max_org": max_org}
+
+
+def _pares_libres(ocupados: set, registrados: List[int], max_org: int, n: int, rng: random.Random) -> List[Tuple[int, int]]:
+    pares = []
+    while len(pares) < n:
+        par = (rng.choice(registrados), rng.randint(1, max_org))
+        if par not in ocupados:
+            ocupados.add(par)
+            pares.append(par)
+    return pares
+
+
+async def main(args) -> None:
+    contador = ContadorSQL(engine.sync_engine)
+    async with AsyncSessionLocal() as session:
+        p = await _parametros(session)
+        existentes = set((await session.execute(
+            select(RepresentanteModel.id_evento, RepresentanteModel.id_organizacion)
+            .where(RepresentanteModel.id_evento.in_(p["registrados"] or [-1])))).all())
+
+    casos: Dict[str, Caso] = {
+        "q1_eventos_por_organizacion": lambda s: q.q1_eventos_por_organizacion(s, p["id_organizacion"]),
+        "q2_resumen_por_instalacion": lambda s: q.q2_resumen_por_instalacion(s, p["id_instalacion"]),
+        "q3_pendientes_por_periodo": lambda s: q.q3_pendientes_por_periodo(s, args.desde, args.hasta),
+        "q4_instalacion_top_y_detalle": q.q4_instalacion_top_y_detalle,
+        "q5_eventos_por_unidad_organizadora": q.q5_eventos_por_unidad_organizadora,
+        "q6_usuarios_con_password_activa_vencida": q.q6_usuarios_con_password_activa_vencida,
+        "q7_proporcion_representantes_por_rol_organizador": q.q7_proporcion_representantes_por_rol_organizador,
+        "q8_usuarios_por_rol_y_mas_participa": q.q8_usuarios_por_rol_y_mas_participa,
+        "q9_top5_usuarios_activos": lambda s: q.q9_top5_usuarios_activos(s, args.desde, args.hasta),
+        "q10_rechazo_inicial_y_revisiones": q.q10_rechazo_inicial_y_revisiones,
+        "listar_representantes_por_evento": lambda s: crud_rep.listar_representantes_por_evento(s, p["evento_con_orgs"]),
+        "obtener_certificado": lambda s: crud_rep.obtener_certificado(s, p["evento_con_orgs"], p["id_organizacion"] or 1),
+    }
+
+    # agregar/eliminar sobre pares (evento registrado, organización) nuevos: el dataset queda igual al final
+    if p["registrados"]:
+        pares = _pares_libres(existentes, p["registrados"], p["max_org"], args.iteraciones + 1, random.Random(7))
+        alta, baja = iter(pares), iter(pares)
+        casos["agregar_representante"] = lambda s: crud_rep.agregar_representante(
+            s, *next(alta), "Asistente bench", "Si", None)
+        casos["eliminar_representante"] = lambda s: crud_rep.eliminar_representante(s, *next(baja))
+
+    if args.solo:
+        elegidos = args.solo.split(",")
+        casos = {k: v for k, v in casos.items() if any(k.startswith(e) for e in elegidos)}
+
+    resultados = []
+    print(f"{'función':<48}{'p50':>9}{'p95':>9}{'p99':>9}{'sql/llamada':>13}   (ms)")
+    for nombre, caso in casos.items():
+        r = await _medir(nombre, caso, args.iteraciones, contador)
+        resultados.append(r)
+        print(f"{nombre:<48}{r['p50_ms']:>9.2f}{r['p95_ms']:>9.2f}{r['p99_ms']:>9.2f}{r['sentencias_por_llamada']:>13.1f}")
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump({"dialecto": engine.dialect.name, "iteraciones": args.iteraciones,
+                       "resultados": resultados}, f, indent=2)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iteraciones", type=int, default=30)
+    parser.add_argument("--solo", default=None, help="prefijos separados por coma (ej. q2,q9,listar)")
+    parser.add_argument("--desde", type=date.fromisoformat, default=date(2024, 1, 1))
+    parser.add_argument("--hasta", type=date.fromisoformat, default=date(2024, 6, 30))
+    parser.add_argument("--salida", default=None, help="archivo JSON con los resultados")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,124 @@
+# scripts/bench_eventos_lote.py
+"""
+Alta de N eventos: uno por uno (crear_evento_service, una transacción y un commit por
+evento, como N llamadas a POST /eventos) frente a POST /eventos/bulk
+(crear_eventos_lote_service: una consulta de responsables, INSERT de varias filas y un
+único commit). Informa eventos/s, sentencias SQL por evento y la aceleración (objetivo ≥20x).
+
+Usa como responsable el primer estudiante/docente del dataset sembrado. Los eventos
+creados se eliminan al final con eliminar_evento (así resúmenes y versiones quedan
+coherentes).
+
+    python -m scripts.bench_eventos_lote --eventos 1000
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import date, time as hora, timedelta
+from typing import Any, Dict, List
+
+from sqlalchemy import select
+
+import app.models  # noqa: F401
+from app.crud.eventos.evento import eliminar_evento
+from app.db.mysql import engine, AsyncSessionLocal
+from app.models.usuarios.usuario import UsuarioModel
+from app.schemas.eventos.evento import EventoCrear, TipoEventoEnum
+from app.services.eventos.evento import crear_evento_service, crear_eventos_lote_service
+from scripts.bench_crud import ContadorSQL
+
+OBJETIVO = 20.0
+
+
+def _items(n: int, id_responsable: int, rng: random.Random) -> List[Dict[str, Any]]:
+    base = date(2031, 1, 1)
+    items = []
+    for i in range(n):
+        inicio = base + timedelta(days=rng.randint(0, 365))
+        items.append({
+            "nombre": f"Bench lote {i}",
+            "descripcion": None,
+            "tipo": rng.choice(list(TipoEventoEnum)).value,
+            "fecha_inicio": inicio.isoformat(),
+            "fecha_fin": inicio.isoformat(),
+            "hora_inicio": hora(9, 0).isoformat(),
+            "hora_fin": hora(rng.randint(10, 20), 0).isoformat(),
+            "id_responsable": id_responsable,
+        })
+    return items
+
+
+async def _uno_por_uno(items: List[Dict[str, Any]]) -> List[int]:
+    ids = []
+    async with AsyncSessionLocal() as session:
+        for item in items:
+            evento_in = EventoCrear.model_validate({k: v for k, v in item.items() if k != "id_responsable"})
+            evento = await crear_evento_service(session, evento_in, item["id_responsable"])
+            ids.append(evento.id_evento)
+    return ids
+
+
+async def _en_lote(items: List[Dict[str, Any]]) -> List[int]:
+    async with AsyncSessionLocal() as session:
+        resultados = await crear_eventos_lote_service(session, items)
+    fallidos = [r for r in resultados if not r["ok"]]
+    if fallidos:
+        raise SystemExit(f"{len(fallidos)} items fallaron en el lote, p. ej.: {fallidos[0]}")
+    return [r["id_evento"] for r in resultados]
+
+
+async def _medir(nombre: str, caso, items: List[Dict[str, Any]], contador: ContadorSQL) -> Dict[str, Any]:
+    antes = contador.n
+    t0 = time.perf_counter()
+    ids = await caso(items)
+    segundos = time.perf_counter() - t0
+    sentencias = contador.n - antes
+    # limpieza fuera de la medición
+    async with AsyncSessionLocal() as session:
+        for id_evento in ids:
+            await eliminar_evento(session, id_evento)
+    return {"variante": nombre, "eventos": len(ids), "segundos": segundos,
+            "eventos_por_s": len(ids) / segundos if segundos else 0.0,
+            "sentencias_por_evento": sentencias / len(ids) if ids else 0.0}
+
+
+async def main(args) -> None:
+    contador = ContadorSQL(engine.sync_engine)
+    async with AsyncSessionLocal() as session:
+        id_responsable = (await session.execute(
+            select(UsuarioModel.id_usuario).where(UsuarioModel.rol.in_(("estudiante", "docente"))).limit(1)
+        )).scalar()
+    if id_responsable is None:
+        print("sin estudiantes/docentes: sembrar antes con scripts.sembrar_datos")
+        await engine.dispose()
+        return
+
+    items = _items(args.eventos, id_responsable, random.Random(5))
+    await _en_lote(items[:10])  # calentamiento (conexiones, caché de compilación)
+    resultados = [
+        await _medir("uno_por_uno", _uno_por_uno, items, contador),
+        await _medir("lote", _en_lote, items, contador),
+    ]
+
+    print(f"{args.eventos} eventos, responsable {id_responsable} ({engine.dialect.name})")
+    print(f"{'variante':<14}{'s':>9}{'eventos/s':>12}{'sql/evento':>12}")
+    for r in resultados:
+        print(f"{r['variante']:<14}{r['segundos']:>9.2f}{r['eventos_por_s']:>12.0f}{r['sentencias_por_evento']:>12.2f}")
+    uno, lote = resultados
+    aceleracion = lote["eventos_por_s"] / uno["eventos_por_s"] if uno["eventos_por_s"] else 0.0
+    print(f"lote: {aceleracion:.1f}x más eventos/s (objetivo ≥{OBJETIVO:.0f}x: {'sí' if aceleracion >= OBJETIVO else 'NO'})")
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump({"dialecto": engine.dialect.name, "eventos": args.eventos, "resultados": resultados,
+                       "aceleracion": aceleracion}, f, indent=2)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--eventos", type=int, default=1000)
+    parser.add_argument("--salida", default=None, help="archivo JSON con los resultados")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,93 @@
+# scripts/bench_indices.py
+"""
+Tiempos antes/después de los índices de la migración 0002 sobre el dataset sembrado.
+
+Revierte la migración (queda el esquema base), mide las consultas afectadas, vuelve a
+aplicarla y repite la medición. Al terminar el esquema queda con los índices.
+
+    python -m scripts.sembrar_datos --reset
+    python -m scripts.bench_indices --iteraciones 30 [--salida indices.json]
+"""
+import argparse
+import asyncio
+import json
+from datetime import date
+from typing import Any, Dict, List
+
+from sqlalchemy import text
+
+import app.models  # noqa: F401
+from app.db.mysql import engine, AsyncSessionLocal
+from app.db import migraciones
+from app.crud.eventos import consultas as q
+from app.crud.eventos import evento as crud_evento
+from app.models.eventos.evento import EstadoEventoEnum
+from scripts.bench_crud import ContadorSQL, _medir, _parametros
+
+VERSION_INDICES = "0002"
+TABLAS = ("Evento", "Representante", "InstalacionEvento", "EventoResponsable", "Evaluacion", "Credencial")
+
+
+def _casos(p: Dict[str, Any], desde: date, hasta: date) -> Dict[str, Any]:
+    return {
+        "q1_eventos_por_organizacion": lambda s: q.q1_eventos_por_organizacion(s, p["id_organizacion"]),
+        "q2_resumen_por_instalacion": lambda s: q.q2_resumen_por_instalacion(s, p["id_instalacion"], paralelo=False),
+        "q3_pendientes_por_periodo": lambda s: q.q3_pendientes_por_periodo(s, desde, hasta),
+        "q4_instalacion_top_y_detalle": lambda s: q.q4_instalacion_top_y_detalle(s, paralelo=False),
+        "q6_usuarios_con_password_activa_vencida": q.q6_usuarios_con_password_activa_vencida,
+        "q8_usuarios_por_rol_y_mas_participa": lambda s: q.q8_usuarios_por_rol_y_mas_participa(s, paralelo=False),
+        "q9_top5_usuarios_activos": lambda s: q.q9_top5_usuarios_activos(s, desde, hasta, paralelo=False),
+        "q10_rechazo_inicial_y_revisiones": lambda s: q.q10_rechazo_inicial_y_revisiones(s, paralelo=False),
+        "listar_eventos_en_revision": lambda s: crud_evento.listar_eventos(
+            s, estado=EstadoEventoEnum.EN_REVISION, limite=50),
+    }
+
+
+async def _analizar() -> None:
+    # estadísticas del optimizador al día tras crear/borrar índices
+    if engine.dialect.name == "mysql":
+        async with engine.begin() as conn:
+            for t in TABLAS:
+                await conn.execute(text(f"ANALYZE TABLE `{t}`"))
+
+
+async def _medir_todo(casos: Dict[str, Any], iteraciones: int, contador: ContadorSQL) -> Dict[str, Dict[str, Any]]:
+    return {nombre: await _medir(nombre, caso, iteraciones, contador) for nombre, caso in casos.items()}
+
+
+async def main(args) -> None:
+    contador = ContadorSQL(engine.sync_engine)
+    # una base sembrada con create_all ya tiene los índices: se registra todo antes de revertir
+    await migraciones.subir(engine)
+    async with AsyncSessionLocal() as session:
+        casos = _casos(await _parametros(session), args.desde, args.hasta)
+
+    print(f"revirtiendo índices: {await migraciones.bajar(engine, '0001')}")
+    await _analizar()
+    antes = await _medir_todo(casos, args.iteraciones, contador)
+
+    print(f"aplicando índices: {await migraciones.subir(engine, VERSION_INDICES)}")
+    await _analizar()
+    despues = await _medir_todo(casos, args.iteraciones, contador)
+
+    filas: List[Dict[str, Any]] = []
+    print(f"{'consulta':<44}{'p50 antes':>11}{'p50 desp.':>11}{'p95 antes':>11}{'p95 desp.':>11}{'x p50':>8}   (ms)")
+    for nombre in casos:
+        a, d = antes[nombre], despues[nombre]
+        mejora = a["p50_ms"] / d["p50_ms"] if d["p50_ms"] else 0.0
+        filas.append({"consulta": nombre, "antes": a, "despues": d, "mejora_p50": mejora})
+        print(f"{nombre:<44}{a['p50_ms']:>11.2f}{d['p50_ms']:>11.2f}{a['p95_ms']:>11.2f}{d['p95_ms']:>11.2f}{mejora:>8.1f}")
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump({"dialecto": engine.dialect.name, "iteraciones": args.iteraciones, "resultados": filas}, f, indent=2)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iteraciones", type=int, default=30)
+    parser.add_argument("--desde", type=date.fromisoformat, default=date(2024, 1, 1))
+    parser.add_argument("--hasta", type=date.fromisoformat, default=date(2024, 6, 30))
+    parser.add_argument("--salida", default=None, help="archivo JSON con los resultados")
+    asyncio.run(main(parser.parse_args()))
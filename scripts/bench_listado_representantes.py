@@ -0,0 +1,139 @@
+# scripts/bench_listado_representantes.py
+"""
+Listado de organizaciones de un evento: respuesta completa (entidad entera + certificado
+embebido en base64, como antes del almacén de blobs) frente a la proyección ligera actual
+(metadatos y url_certificado). Mide latencia, tamaño del JSON y sentencias SQL.
+
+Trabaja sobre el evento con más organizaciones del dataset sembrado; con --orgs completa
+hasta N vínculos y adjunta a todos un certificado de --kb KiB. Todo se hace en una
+transacción que se revierte al final (el blob queda en el almacén: direccionado por contenido).
+
+    python -m scripts.bench_listado_representantes --orgs 200 --kb 256 --iteraciones 30
+"""
+import argparse
+import asyncio
+import base64
+import json
+import os
+import time
+from typing import Any, Dict, List
+
+from pydantic import TypeAdapter
+from sqlalchemy import select, update
+
+import app.models  # noqa: F401
+from app.core.blobs import obtener_almacen
+from app.db.mysql import engine, AsyncSessionLocal
+from app.crud.eventos import representante as crud_rep
+from app.models.eventos.representante import RepresentanteModel
+from app.models.organizaciones.organizacion_externa import OrganizacionExternaModel
+from app.schemas.eventos.representante import Representante
+from scripts.bench_crud import ContadorSQL, _parametros
+from scripts._estadisticas import resumen_latencias
+
+_lista = TypeAdapter(List[Representante])
+
+
+async def _preparar(session, id_evento: int, orgs: int, kb: int) -> int:
+    """Completa el evento hasta `orgs` vínculos y les adjunta el mismo certificado (sin commit)."""
+    ligadas = set((await session.execute(
+        select(RepresentanteModel.id_organizacion).where(RepresentanteModel.id_evento == id_evento))).scalars())
+    libres: List[int] = []
+    if len(ligadas) < orgs:
+        libres = (await session.execute(
+            select(OrganizacionExternaModel.id_organizacion)
+            .where(OrganizacionExternaModel.id_organizacion.not_in(ligadas or [-1]))
+            .limit(orgs - len(ligadas)))).scalars().all()
+        session.add_all([
+            RepresentanteModel(id_evento=id_evento, id_organizacion=o,
+                               nombre_representante="Asistente bench", representante_legal="Si")
+            for o in libres
+        ])
+        await session.flush()
+    blob = await obtener_almacen().guardar(os.urandom(kb * 1024))
+    await session.execute(
+        update(RepresentanteModel).where(RepresentanteModel.id_evento == id_evento)
+        .values(certificado_sha256=blob.sha256, certificado_tamano=blob.tamano,
+                certificado_media_type="application/pdf"))
+    session.expunge_all()
+    return len(ligadas) + len(libres)
+
+
+async def _respuesta_completa(session, id_evento: int) -> bytes:
+    # forma anterior: todas las columnas y el archivo de cada vínculo dentro del JSON
+    reps = (await session.execute(
+        select(RepresentanteModel).where(RepresentanteModel.id_evento == id_evento))).scalars().all()
+    almacen = obtener_almacen()
+    cuerpo = []
+    for r in reps:
+        contenido = await almacen.obtener(r.certificado_sha256) if r.certificado_sha256 else None
+        cuerpo.append({
+            "id_evento": r.id_evento,
+            "id_organizacion": r.id_organizacion,
+            "nombre_representante": r.nombre_representante,
+            "representante_legal": r.representante_legal,
+            "certificado_participacion": base64.b64encode(contenido).decode() if contenido else None,
+        })
+    return json.dumps(cuerpo).encode()
+
+
+async def _respuesta_ligera(session, id_evento: int) -> bytes:
+    reps = await crud_rep.listar_representantes_por_evento(session, id_evento)
+    return _lista.dump_json(_lista.validate_python(reps, from_attributes=True))
+
+
+async def _medir(session, nombre: str, caso, iteraciones: int, contador: ContadorSQL) -> Dict[str, Any]:
+    latencias: List[float] = []
+    await caso(session)  # calentamiento
+    sentencias = contador.n
+    for _ in range(iteraciones):
+        session.expunge_all()  # sin identity map compartido entre iteraciones
+        t0 = time.perf_counter()
+        cuerpo = await caso(session)
+        latencias.append((time.perf_counter() - t0) * 1000)
+    return {"variante": nombre, **resumen_latencias(latencias), "bytes_respuesta": len(cuerpo),
+            "sentencias_por_llamada": (contador.n - sentencias) / iteraciones if iteraciones else 0}
+
+
+async def main(args) -> None:
+    contador = ContadorSQL(engine.sync_engine)
+    async with AsyncSessionLocal() as session:
+        p = await _parametros(session)
+        if p["evento_con_orgs"] is None:
+            print("sin vínculos evento-organización: sembrar antes con scripts.sembrar_datos")
+            await engine.dispose()
+            return
+        id_evento = p["evento_con_orgs"]
+        try:
+            n = await _preparar(session, id_evento, args.orgs, args.kb)
+            print(f"evento {id_evento}: {n} organizaciones, certificado de {args.kb} KiB cada una")
+            resultados = [
+                await _medir(session, "completa", lambda s: _respuesta_completa(s, id_evento), args.iteraciones, contador),
+                await _medir(session, "ligera", lambda s: _respuesta_ligera(s, id_evento), args.iteraciones, contador),
+            ]
+        finally:
+            await session.rollback()
+
+    print(f"{'variante':<12}{'p50':>9}{'p95':>9}{'p99':>9}{'KiB resp.':>12}{'sql/llamada':>13}   (ms)")
+    for r in resultados:
+        print(f"{r['variante']:<12}{r['p50_ms']:>9.2f}{r['p95_ms']:>9.2f}{r['p99_ms']:>9.2f}"
+              f"{r['bytes_respuesta'] / 1024:>12.1f}{r['sentencias_por_llamada']:>13.1f}")
+    completa, ligera = resultados
+    if ligera["p50_ms"] and ligera["bytes_respuesta"]:
+        print(f"ligera: {completa['bytes_respuesta'] / ligera['bytes_respuesta']:.0f}x menos bytes, "
+              f"{completa['p50_ms'] / ligera['p50_ms']:.1f}x más rápida (p50)")
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump({"dialecto": engine.dialect.name, "organizaciones": n, "kb_certificado": args.kb,
+                       "iteraciones": args.iteraciones, "resultados": resultados}, f, indent=2)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orgs", type=int, default=100, help="vínculos mínimos del evento medido")
+    parser.add_argument("--kb", type=int, default=128, help="tamaño del certificado adjunto (KiB)")
+    parser.add_argument("--iteraciones", type=int, default=30)
+    parser.add_argument("--salida", default=None, help="archivo JSON con los resultados")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,107 @@
+# scripts/bench_serializacion.py
+"""
+CPU por cada 10k filas al serializar una lista de eventos:
+
+  - response_model: objeto ORM -> Evento.model_validate -> jsonable_encoder -> json.dumps
+    (lo que hacía /consultas/eventos/pendientes y, vía response_model, GET /eventos).
+  - rapida: tuplas de columnas -> TypeAdapter(List[Evento]) cacheado -> dump_json
+    (app/core/serializacion.py).
+
+No necesita base de datos: genera los eventos en memoria (objetos ORM transitorios y
+tuplas con nombre equivalentes a los Row que devuelve select(*COLUMNAS_EVENTO)).
+Mide tiempo de CPU del proceso (time.process_time), no de reloj.
+
+    python -m scripts.bench_serializacion --filas 10000 --repeticiones 10
+"""
+import argparse
+import json
+import random
+import time
+from collections import namedtuple
+from datetime import date, time as hora, timedelta
+from typing import Any, Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+
+import app.models  # noqa: F401
+from app.core.serializacion import serializar
+from app.crud.eventos.evento import COLUMNAS_EXPORTACION
+from app.models.eventos.evento import EventoModel, EstadoEventoEnum, TipoEventoEnum
+from app.schemas.eventos.evento import Evento
+from scripts._estadisticas import resumen_latencias
+
+Fila = namedtuple("Fila", COLUMNAS_EXPORTACION)
+
+
+def _generar(n: int, rng: random.Random) -> List[Dict[str, Any]]:
+    base = date(2024, 1, 1)
+    datos = []
+    for i in range(1, n + 1):
+        inicio = base + timedelta(days=rng.randint(0, 365))
+        datos.append({
+            "id_evento": i,
+            "nombre": f"Evento {i}",
+            "descripcion": "Descripción de prueba " * rng.randint(0, 5) or None,
+            "tipo": rng.choice(list(TipoEventoEnum)),
+            "estado": rng.choice(list(EstadoEventoEnum)),
+            "fecha_inicio": inicio,
+            "fecha_fin": inicio + timedelta(days=rng.randint(0, 3)),
+            "hora_inicio": hora(8, 0),
+            "hora_fin": hora(rng.randint(9, 20), 0),
+        })
+    return datos
+
+
+def _por_response_model(objetos: List[EventoModel]) -> bytes:
+    modelos = [Evento.model_validate(e, from_attributes=True) for e in objetos]
+    return json.dumps(jsonable_encoder(modelos), ensure_ascii=False).encode()
+
+
+def _rapida(filas: List[Fila]) -> bytes:
+    return serializar(List[Evento], filas)
+
+
+def _medir(fn: Callable[[Any], bytes], entrada: Any, repeticiones: int, filas: int) -> Dict[str, Any]:
+    fn(entrada)  # calentamiento (TypeAdapter y caches de pydantic)
+    cpu_por_10k: List[float] = []
+    for _ in range(repeticiones):
+        t0 = time.process_time()
+        cuerpo = fn(entrada)
+        cpu_por_10k.append((time.process_time() - t0) * 1000 * 10_000 / filas)
+    return {**resumen_latencias(cpu_por_10k), "bytes": len(cuerpo), "cuerpo": cuerpo}
+
+
+def main(args) -> None:
+    datos = _generar(args.filas, random.Random(11))
+    objetos = [EventoModel(**d) for d in datos]
+    filas = [Fila(**d) for d in datos]
+
+    resultados = {
+        "response_model": _medir(_por_response_model, objetos, args.repeticiones, args.filas),
+        "rapida": _medir(_rapida, filas, args.repeticiones, args.filas),
+    }
+    # mismo contrato: el JSON de ambos caminos describe los mismos datos
+    iguales = json.loads(resultados["response_model"].pop("cuerpo")) == json.loads(resultados["rapida"].pop("cuerpo"))
+
+    print(f"{args.filas} filas, {args.repeticiones} repeticiones (ms de CPU por 10k filas)")
+    print(f"{'camino':<16}{'p50':>9}{'p95':>9}{'max':>9}{'KiB':>10}")
+    for nombre, r in resultados.items():
+        print(f"{nombre:<16}{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}{r['max_ms']:>9.1f}{r['bytes'] / 1024:>10.1f}")
+    if resultados["rapida"]["p50_ms"]:
+        print(f"rapida: {resultados['response_model']['p50_ms'] / resultados['rapida']['p50_ms']:.1f}x menos CPU (p50)")
+    print(f"salida equivalente: {'sí' if iguales else 'NO'}")
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump({"filas": args.filas, "repeticiones": args.repeticiones, "resultados": resultados,
+                       "salida_equivalente": iguales}, f, indent=2)
+    if not iguales:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filas", type=int, default=10_000)
+    parser.add_argument("--repeticiones", type=int, default=10)
+    parser.add_argument("--salida", default=None, help="archivo JSON con los resultados")
+    main(parser.parse_args())
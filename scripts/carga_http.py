@@ -0,0 +1,234 @@
+# scripts/carga_http.py
+"""
+Generador de carga HTTP sobre las rutas reales de la API, con latencias por ruta.
+
+Dos modos:
+  - en proceso (por defecto): httpx.ASGITransport sobre app.main.app, sin red.
+  - contra un uvicorn local:  --url http://127.0.0.1:8000
+
+Mezcla configurable por grupo de rutas y concurrencia fija. Reporta throughput,
+p50/p95/p99, histograma y tasa de errores por ruta, y guarda un JSON comparable entre versiones.
+
+    python -m scripts.carga_http --duracion 30 --concurrencia 32 --mezcla eventos=4,organizaciones=2,consultas=4 \\
+        --salida carga_v1.json
+    python -m scripts.carga_http --duracion 30 --salida carga_v2.json --comparar carga_v1.json --tolerancia 15
+Con --comparar sale con código 1 si alguna ruta empeora su p95 o su tasa de errores más allá de la tolerancia.
+"""
+import argparse
+import asyncio
+import bisect
+import json
+import random
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from scripts._estadisticas import resumen_latencias
+
+PREFIJO = "/api/v1"
+# límites superiores (ms) de los buckets del histograma; el último es +inf
+BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+@dataclass
+class EstadisticaRuta:
+    latencias_ms: List[float] = field(default_factory=list)
+    histograma: List[int] = field(default_factory=lambda: [0] * (len(BUCKETS_MS) + 1))
+    errores_4xx: int = 0
+    errores_5xx: int = 0
+    excepciones: int = 0
+
+    def registrar(self, ms: float, status: Optional[int]) -> None:
+        self.latencias_ms.append(ms)
+        self.histograma[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        if status is None:
+            self.excepciones += 1
+        elif status >= 500:
+            self.errores_5xx += 1
+        elif status >= 400:
+            self.errores_4xx += 1
+
+    def resumen(self, duracion_s: float) -> Dict:
+        n = len(self.latencias_ms)
+        fallos = self.errores_5xx + self.excepciones
+        return {
+            **resumen_latencias(self.latencias_ms),
+            "rps": n / duracion_s if duracion_s else 0.0,
+            "errores_4xx": self.errores_4xx,
+            "errores_5xx": self.errores_5xx,
+            "excepciones": self.excepciones,
+            "tasa_error": fallos / n if n else 0.0,
+            "histograma": {f"le_{b}": c for b, c in zip((*BUCKETS_MS, "inf"), self.histograma)},
+        }
+
+
+# (plantilla de ruta, generador de URL concreta)
+Ruta = Tuple[str, Callable[[random.Random], str]]
+
+
+def construir_rutas(args, ids_evento: List[int]) -> Dict[str, List[Ruta]]:
+    d, h = args.desde, args.hasta
+    orgs = range(1, args.max_organizacion + 1)
+    insts = range(1, args.max_instalacion + 1)
+    return {
+        "eventos": [
+            ("GET /eventos", lambda r: f"{PREFIJO}/eventos/?limite=50"),
+            ("GET /eventos?tipo", lambda r: f"{PREFIJO}/eventos/?limite=50&tipo={r.choice(('ludico', 'academico'))}"),
+            ("GET /eventos/{id}", lambda r: f"{PREFIJO}/eventos/{r.choice(ids_evento)}"),
+        ],
+        "organizaciones": [
+            ("GET /eventos/{id}/organizaciones", lambda r: f"{PREFIJO}/eventos/{r.choice(ids_evento)}/organizaciones"),
+        ],
+        "consultas": [
+            ("GET /consultas/organizaciones/{id}/resumen", lambda r: f"{PREFIJO}/consultas/organizaciones/{r.choice(orgs)}/resumen"),
+            ("GET /consultas/instalaciones/{id}/resumen", lambda r: f"{PREFIJO}/consultas/instalaciones/{r.choice(insts)}/resumen"),
+            ("GET /consultas/eventos/pendientes", lambda r: f"{PREFIJO}/consultas/eventos/pendientes?desde={d}&hasta={h}"),
+            ("GET /consultas/instalaciones/top", lambda r: f"{PREFIJO}/consultas/instalaciones/top"),
+            ("GET /consultas/organizadores/unidades/resumen", lambda r: f"{PREFIJO}/consultas/organizadores/unidades/resumen"),
+            ("GET /consultas/credenciales/activas-vencidas", lambda r: f"{PREFIJO}/consultas/credenciales/activas-vencidas"),
+            ("GET /consultas/representantes/proporcion-por-rol", lambda r: f"{PREFIJO}/consultas/representantes/proporcion-por-rol"),
+            ("GET /consultas/usuarios/resumen-participacion", lambda r: f"{PREFIJO}/consultas/usuarios/resumen-participacion"),
+            ("GET /consultas/organizadores/top", lambda r: f"{PREFIJO}/consultas/organizadores/top?desde={d}&hasta={h}"),
+            ("GET /consultas/eventos/revisiones/tasa-rechazo", lambda r: f"{PREFIJO}/consultas/eventos/revisiones/tasa-rechazo"),
+        ],
+    }
+
+
+def parsear_mezcla(texto: str) -> Dict[str, float]:
+    mezcla = {}
+    for parte in texto.split(","):
+        grupo, _, peso = parte.partition("=")
+        mezcla[grupo.strip()] = float(peso or 1)
+    return mezcla
+
+
+async def _ids_evento(cliente: httpx.AsyncClient, n: int) -> List[int]:
+    resp = await cliente.get(f"{PREFIJO}/eventos/", params={"limite": min(n, 500)})
+    resp.raise_for_status()
+    ids = [e["id_evento"] for e in resp.json()["items"]]
+    if not ids:
+        sys.exit("No hay eventos: siembra datos con 'python -m scripts.sembrar_datos'")
+    return ids
+
+
+def _cliente(args) -> httpx.AsyncClient:
+    limites = httpx.Limits(max_connections=args.concurrencia, max_keepalive_connections=args.concurrencia)
+    if args.url:
+        return httpx.AsyncClient(base_url=args.url, timeout=args.timeout, limits=limites)
+    from app.main import app
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://carga", timeout=args.timeout)
+
+
+async def ejecutar(args) -> Dict:
+    mezcla = parsear_mezcla(args.mezcla)
+    estadisticas: Dict[str, EstadisticaRuta] = {}
+    async with _cliente(args) as cliente:
+        rutas = construir_rutas(args, await _ids_evento(cliente, 500))
+        candidatas = [(ruta, mezcla.get(grupo, 0) / len(lista))
+                      for grupo, lista in rutas.items() for ruta in lista if mezcla.get(grupo, 0) > 0]
+        plantillas, pesos = zip(*candidatas)
+        fin = time.perf_counter() + args.duracion
+        restantes = [args.peticiones] if args.peticiones else None
+
+        async def trabajador(semilla: int) -> None:
+            rng = random.Random(semilla)
+            while time.perf_counter() < fin:
+                if restantes is not None:
+                    if restantes[0] <= 0:
+                        return
+                    restantes[0] -= 1
+                nombre, url = rng.choices(plantillas, pesos)[0]
+                t0 = time.perf_counter()
+                try:
+                    status = (await cliente.get(url(rng))).status_code
+                except httpx.HTTPError:
+                    status = None
+                estadisticas.setdefault(nombre, EstadisticaRuta()).registrar((time.perf_counter() - t0) * 1000, status)
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(trabajador(args.semilla + i) for i in range(args.concurrencia)))
+        duracion = time.perf_counter() - t0
+
+    total = sum(len(e.latencias_ms) for e in estadisticas.values())
+    return {
+        "meta": {
+            "fecha": datetime.now(timezone.utc).isoformat(),
+            "commit": _commit_git(),
+            "modo": args.url or "en_proceso",
+            "concurrencia": args.concurrencia,
+            "mezcla": mezcla,
+            "duracion_s": duracion,
+        },
+        "total": {"peticiones": total, "rps": total / duracion if duracion else 0.0},
+        "rutas": {nombre: e.resumen(duracion) for nombre, e in sorted(estadisticas.items())},
+    }
+
+
+def _commit_git() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def imprimir(resultado: Dict) -> None:
+    print(f"{'ruta':<52}{'n':>7}{'rps':>8}{'p50':>8}{'p95':>8}{'p99':>8}{'err%':>7}")
+    for nombre, r in resultado["rutas"].items():
+        print(f"{nombre:<52}{r['n']:>7}{r['rps']:>8.1f}{r['p50_ms']:>8.1f}{r['p95_ms']:>8.1f}"
+              f"{r['p99_ms']:>8.1f}{r['tasa_error'] * 100:>7.2f}")
+    print(f"total: {resultado['total']['peticiones']} peticiones, {resultado['total']['rps']:.1f} rps")
+
+
+def comparar(actual: Dict, base: Dict, tolerancia_pct: float) -> List[str]:
+    """Regresiones de p95 (más de tolerancia_pct) o de tasa de error respecto a una corrida base."""
+    regresiones = []
+    for nombre, r in actual["rutas"].items():
+        b = base["rutas"].get(nombre)
+        if not b:
+            continue
+        if b["p95_ms"] and r["p95_ms"] > b["p95_ms"] * (1 + tolerancia_pct / 100):
+            regresiones.append(f"{nombre}: p95 {b['p95_ms']:.1f} -> {r['p95_ms']:.1f} ms")
+        if r["tasa_error"] > b["tasa_error"] + 0.001:
+            regresiones.append(f"{nombre}: errores {b['tasa_error']:.2%} -> {r['tasa_error']:.2%}")
+    return regresiones
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--url", default=None, help="base URL de un uvicorn local; sin ella se usa la app en proceso")
+    p.add_argument("--duracion", type=float, default=20.0, help="segundos")
+    p.add_argument("--peticiones", type=int, default=0, help="tope de peticiones (0 = solo por duración)")
+    p.add_argument("--concurrencia", type=int, default=16)
+    p.add_argument("--mezcla", default="eventos=4,organizaciones=2,consultas=4")
+    p.add_argument("--desde", default="2024-01-01")
+    p.add_argument("--hasta", default="2024-06-30")
+    p.add_argument("--max-organizacion", type=int, default=200)
+    p.add_argument("--max-instalacion", type=int, default=60)
+    p.add_argument("--timeout", type=float, default=30.0)
+    p.add_argument("--semilla", type=int, default=1)
+    p.add_argument("--salida", default=None, help="archivo JSON con los resultados")
+    p.add_argument("--comparar", default=None, help="JSON de una corrida base")
+    p.add_argument("--tolerancia", type=float, default=10.0, help="% de empeoramiento de p95 admitido")
+    args = p.parse_args()
+
+    resultado = asyncio.run(ejecutar(args))
+    imprimir(resultado)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, indent=2)
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            regresiones = comparar(resultado, json.load(f), args.tolerancia)
+        for r in regresiones:
+            print(f"REGRESIÓN {r}")
+        return 1 if regresiones else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
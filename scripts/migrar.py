@@ -0,0 +1,45 @@
+# scripts/migrar.py
+"""
+Migraciones de esquema (app/db/migraciones).
+
+Uso (desde la raíz del repo):
+    python -m scripts.migrar estado               # versiones y cuándo se aplicaron
+    python -m scripts.migrar subir [--hasta 0002] # aplica las pendientes
+    python -m scripts.migrar bajar --hasta 0001   # revierte las posteriores a esa versión
+"""
+import argparse
+import asyncio
+import sys
+
+from app.db.mysql import engine
+from app.db import migraciones
+
+
+async def _ejecutar(args) -> int:
+    try:
+        if args.accion == "estado":
+            for m, aplicada_en in await migraciones.estado(engine):
+                marca = aplicada_en.isoformat(sep=" ", timespec="seconds") if aplicada_en else "pendiente"
+                print(f"{m.version}  {marca:<20}  {m.descripcion}")
+        elif args.accion == "subir":
+            hechas = await migraciones.subir(engine, args.hasta)
+            print(f"aplicadas: {', '.join(hechas)}" if hechas else "sin migraciones pendientes")
+        else:
+            if args.hasta is None:
+                sys.exit("bajar requiere --hasta VERSION")
+            hechas = await migraciones.bajar(engine, args.hasta)
+            print(f"revertidas: {', '.join(hechas)}" if hechas else "nada que revertir")
+        return 0
+    finally:
+        await engine.dispose()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("accion", choices=["estado", "subir", "bajar"])
+    parser.add_argument("--hasta", default=None, help="versión (p. ej. 0001)")
+    return asyncio.run(_ejecutar(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+# scripts/planes_consultas.py
+"""
+Captura de planes EXPLAIN FORMAT=JSON de las consultas q1..q10 (app/crud/eventos/consultas.py)
+y verificación de regresiones contra un snapshot. Solo MySQL 8+, sobre el dataset sembrado.
+
+    python -m scripts.planes_consultas capturar    # guarda el snapshot (revisar el diff en git)
+    python -m scripts.planes_consultas verificar   # exit 1 si algún plan empeora o no hay snapshot
+
+En la suite de tests lo ejecuta tests/test_planes_consultas.py cuando TESTS_MYSQL_URL está definida.
+
+Se considera regresión, por sentencia (identificada por consulta + huella del SQL):
+  - una tabla que pasa a leerse con full scan (access_type ALL),
+  - aparece un filesort o una tabla temporal que el snapshot no tenía,
+  - en las rutas calientes (CONSULTAS_CALIENTES) cualquier full scan, haya snapshot o no.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from datetime import date
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import event
+
+import app.models  # noqa: F401
+from app.db.mysql import engine, AsyncSessionLocal
+from app.db.consultas_lentas import huella
+from app.crud.eventos import consultas as q
+from scripts.bench_crud import _parametros
+
+SNAPSHOT = os.path.join(os.path.dirname(__file__), "snapshots", "planes_consultas.json")
+
+# consultas parametrizadas que se sirven en caliente: nunca deben recorrer una tabla entera
+CONSULTAS_CALIENTES = {
+    "q1_eventos_por_organizacion",
+    "q2_resumen_por_instalacion",
+    "q3_pendientes_por_periodo",
+    "q6_usuarios_con_password_activa_vencida",
+}
+
+
+class CapturadorSQL:
+    """Guarda las SELECT que llegan al driver mientras está activo."""
+
+    def __init__(self, sync_engine):
+        self.activo = False
+        self.sentencias: List[Tuple[str, Any]] = []
+        event.listen(sync_engine, "before_cursor_execute", self._capturar)
+
+    def _capturar(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if self.activo and statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            self.sentencias.append((statement, parameters))
+
+
+# -----------------------------
+# Resumen del plan
+# -----------------------------
+def resumir_plan(plan: Dict[str, Any]) -> Dict[str, Any]:
+    """Accesos por tabla y operaciones costosas; estable entre ejecuciones (sin costes ni filas)."""
+    accesos: List[Dict[str, Any]] = []
+    filesort, temporal = set(), set()
+
+    def _recorrer(nodo: Any, contexto: str) -> None:
+        if isinstance(nodo, dict):
+            if "access_type" in nodo:
+                accesos.append({
+                    "tabla": nodo.get("table_name"),
+                    "acceso": nodo["access_type"],
+                    "indice": nodo.get("key"),
+                })
+            if nodo.get("using_filesort"):
+                filesort.add(contexto)
+            if nodo.get("using_temporary_table"):
+                temporal.add(contexto)
+            for clave, valor in nodo.items():
+                _recorrer(valor, clave if isinstance(valor, (dict, list)) else contexto)
+        elif isinstance(nodo, list):
+            for valor in nodo:
+                _recorrer(valor, contexto)
+
+    _recorrer(plan, "query_block")
+    return {
+        "accesos": sorted(accesos, key=lambda a: (a["tabla"] or "", a["acceso"], a["indice"] or "")),
+        "filesort": sorted(filesort),
+        "temporal": sorted(temporal),
+    }
+
+
+async def capturar_planes(desde: date, hasta: date) -> Dict[str, Dict[str, Any]]:
+    capturador = CapturadorSQL(engine.sync_engine)
+    async with AsyncSessionLocal() as session:
+        p = await _parametros(session)
+    casos = {
+        "q1_eventos_por_organizacion": lambda s: q.q1_eventos_por_organizacion(s, p["id_organizacion"]),
+        "q2_resumen_por_instalacion": lambda s: q.q2_resumen_por_instalacion(s, p["id_instalacion"], paralelo=False),
+        "q3_pendientes_por_periodo": lambda s: q.q3_pendientes_por_periodo(s, desde, hasta),
+        "q4_instalacion_top_y_detalle": lambda s: q.q4_instalacion_top_y_detalle(s, paralelo=False),
+        "q5_eventos_por_unidad_organizadora": q.q5_eventos_por_unidad_organizadora,
+        "q6_usuarios_con_password_activa_vencida": q.q6_usuarios_con_password_activa_vencida,
+        "q7_proporcion_representantes_por_rol_organizador": q.q7_proporcion_representantes_por_rol_organizador,
+        "q8_usuarios_por_rol_y_mas_participa": lambda s: q.q8_usuarios_por_rol_y_mas_participa(s, paralelo=False),
+        "q9_top5_usuarios_activos": lambda s: q.q9_top5_usuarios_activos(s, desde, hasta, paralelo=False),
+        "q10_rechazo_inicial_y_revisiones": lambda s: q.q10_rechazo_inicial_y_revisiones(s, paralelo=False),
+    }
+
+    planes: Dict[str, Dict[str, Any]] = {}
+    for nombre, caso in casos.items():
+        capturador.sentencias.clear()
+        async with AsyncSessionLocal() as session:
+            capturador.activo = True
+            try:
+                await caso(session)
+            finally:
+                capturador.activo = False
+        async with engine.connect() as conn:
+            for statement, parameters in capturador.sentencias:
+                fila = (await conn.exec_driver_sql("EXPLAIN FORMAT=JSON " + statement, parameters)).first()
+                plan = json.loads(fila[0])
+                planes[f"{nombre} :: {huella(statement)}"] = {
+                    "consulta": nombre,
+                    "resumen": resumir_plan(plan),
+                    "plan": plan,
+                }
+    return planes
+
+
+# -----------------------------
+# Comparación
+# -----------------------------
+def regresiones(actual: Dict[str, Dict[str, Any]], base: Dict[str, Dict[str, Any]]) -> List[str]:
+    salida = []
+    for clave, entrada in actual.items():
+        r = entrada["resumen"]
+        escaneos = {a["tabla"] for a in r["accesos"] if a["acceso"] == "ALL"}
+        if entrada["consulta"] in CONSULTAS_CALIENTES and escaneos:
+            salida.append(f"{clave}\n    full scan en ruta caliente: {', '.join(sorted(escaneos))}")
+
+        previo = base.get(clave)
+        if previo is None:
+            continue
+        b = previo["resumen"]
+        escaneos_previos = {a["tabla"] for a in b["accesos"] if a["acceso"] == "ALL"}
+        if escaneos - escaneos_previos and entrada["consulta"] not in CONSULTAS_CALIENTES:
+            salida.append(f"{clave}\n    nuevo full scan: {', '.join(sorted(escaneos - escaneos_previos))}")
+        for operacion in ("filesort", "temporal"):
+            nuevos = set(r[operacion]) - set(b[operacion])
+            if nuevos:
+                salida.append(f"{clave}\n    nuevo {operacion} en: {', '.join(sorted(nuevos))}")
+
+    # una sentencia que cambia de forma ya no casa con el snapshot: hay que revisarla y recapturar
+    for clave in sorted(set(base) - set(actual)):
+        salida.append(f"{clave}\n    sentencia del snapshot que ya no se emite (¿cambió la consulta? recapturar)")
+    return salida
+
+
+async def main(args) -> int:
+    # sin snapshot no hay con qué comparar: fallar en vez de dar por buena la verificación
+    if args.accion == "verificar" and not os.path.exists(args.snapshot):
+        print(f"sin snapshot en {args.snapshot}: capturarlo antes con "
+              f"`python -m scripts.planes_consultas capturar` y añadirlo al repo")
+        await engine.dispose()
+        return 1
+    if engine.dialect.name != "mysql":
+        print(f"EXPLAIN FORMAT=JSON requiere MySQL (dialecto actual: {engine.dialect.name})")
+        return 2
+    try:
+        planes = await capturar_planes(args.desde, args.hasta)
+    finally:
+        await engine.dispose()
+
+    if args.accion == "capturar":
+        os.makedirs(os.path.dirname(args.snapshot), exist_ok=True)
+        with open(args.snapshot, "w", encoding="utf-8") as f:
+            json.dump(planes, f, indent=2, sort_keys=True, ensure_ascii=False)
+        print(f"{len(planes)} planes guardados en {args.snapshot}")
+        return 0
+
+    with open(args.snapshot, encoding="utf-8") as f:
+        base = json.load(f)
+    problemas = regresiones(planes, base)
+    for p in problemas:
+        print(f"REGRESIÓN {p}")
+    print(f"{len(planes)} sentencias revisadas, {len(problemas)} regresiones")
+    return 1 if problemas else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("accion", choices=["capturar", "verificar"])
+    parser.add_argument("--snapshot", default=SNAPSHOT)
+    parser.add_argument("--desde", type=date.fromisoformat, default=date(2024, 1, 1))
+    parser.add_argument("--hasta", type=date.fromisoformat, default=date(2024, 6, 30))
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,51 @@
+# scripts/resumenes.py
+"""
+Mantenimiento de las tablas resumen de las consultas analíticas.
+
+Uso (desde la raíz del repo):
+    python -m scripts.resumenes reconstruir   # crea las tablas si faltan y recalcula todo
+    python -m scripts.resumenes verificar     # compara contra las tablas crudas (exit 1 si difiere)
+"""
+import argparse
+import asyncio
+import sys
+
+from app.db.mysql import engine, AsyncSessionLocal, Base
+from app.crud.eventos.resumenes import RESUMENES, reconstruir_resumenes, verificar_resumenes
+
+
+async def _reconstruir() -> int:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[m.__table__ for m, _c, _s in RESUMENES])
+    async with AsyncSessionLocal() as session:
+        for tabla, n in (await reconstruir_resumenes(session)).items():
+            print(f"{tabla}: {n} filas")
+    return 0
+
+
+async def _verificar() -> int:
+    async with AsyncSessionLocal() as session:
+        diferencias = await verificar_resumenes(session)
+    for d in diferencias:
+        print(f"{d['resumen']} {d['clave']}: esperado={d['esperado']} actual={d['actual']}")
+    print("OK: resúmenes consistentes" if not diferencias else f"{len(diferencias)} diferencias")
+    return 1 if diferencias else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("accion", choices=["reconstruir", "verificar"])
+    args = parser.parse_args()
+    accion = _reconstruir if args.accion == "reconstruir" else _verificar
+
+    async def _run() -> int:
+        try:
+            return await accion()
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+# scripts/verificar_formas_consultas.py
+"""
+Comprueba que la forma de una sola sentencia (consultas_unicas) y, opcionalmente, la
+de tablas resumen (consultas_resumen) devuelven lo mismo que la forma de varias
+sentencias (consultas) sobre los datos de la BD actual.
+
+Las listas se comparan sin orden, salvo en las consultas de ranking (ORDENADAS), donde el
+orden (y el desempate) forma parte del resultado.
+
+Pensado para correr tras sembrar datos sintéticos. Uso:
+    python -m scripts.verificar_formas_consultas [--resumenes] [--desde 2024-01-01 --hasta 2024-12-31]
+Sale con código 1 si alguna consulta difiere. tests/test_formas_consultas.py lo ejecuta sobre
+un dataset sembrado con semilla fija.
+"""
+import argparse
+import asyncio
+import json
+import sys
+from datetime import date
+from decimal import Decimal
+from typing import Any, List, Tuple
+
+from sqlalchemy import select
+
+from app.db.mysql import engine, AsyncSessionLocal
+from app.crud.eventos import consultas as q
+from app.crud.eventos import consultas_unicas as qu
+from app.crud.eventos import consultas_resumen as qr
+from app.models.eventos.instalacion_evento import InstalacionEventoModel
+from app.models.eventos.representante import RepresentanteModel
+
+
+# rankings: el orden de la lista (q9) o el elemento elegido como top (q4, q8) es el resultado
+ORDENADAS = {"q4_instalacion_top_y_detalle", "q8_usuarios_por_rol_y_mas_participa", "q9_top5_usuarios_activos"}
+
+
+def _normalizar(valor, ordenado: bool = False):
+    """Forma canónica: números como float, claves como str, listas ordenadas salvo `ordenado`."""
+    if isinstance(valor, dict):
+        return {str(k): _normalizar(v, ordenado) for k, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        items = [_normalizar(v, ordenado) for v in valor]
+        if ordenado:
+            return items
+        return sorted(items, key=lambda x: json.dumps(x, sort_keys=True, default=str))
+    if isinstance(valor, (int, float, Decimal)) and not isinstance(valor, bool):
+        return round(float(valor), 9)
+    return valor
+
+
+async def _ids(session, columna, limite: int):
+    return (await session.execute(select(columna).distinct().limit(limite))).scalars().all()
+
+
+async def comparar_formas(
+    session, resumenes: bool = False, muestras: int = 20,
+    desde: date = date(2000, 1, 1), hasta: date = date(2100, 1, 1),
+) -> List[Tuple[str, str, tuple, Any, Any]]:
+    """
+    Ejecuta cada consulta en todas sus formas; devuelve una tupla
+    (forma, consulta, params, esperado, obtenido) por comparación, ya normalizados.
+    """
+    alternativas = [("una_sentencia", qu)] + ([("resumenes", qr)] if resumenes else [])
+    casos = [("q4_instalacion_top_y_detalle", ()), ("q5_eventos_por_unidad_organizadora", ()),
+             ("q8_usuarios_por_rol_y_mas_participa", ()), ("q10_rechazo_inicial_y_revisiones", ()),
+             ("q9_top5_usuarios_activos", (desde, hasta))]
+    casos += [("q1_eventos_por_organizacion", (i,))
+              for i in await _ids(session, RepresentanteModel.id_organizacion, muestras)]
+    casos += [("q2_resumen_por_instalacion", (i,))
+              for i in await _ids(session, InstalacionEventoModel.id_instalacion, muestras)]
+
+    comparaciones = []
+    for nombre, params in casos:
+        ordenado = nombre in ORDENADAS
+        referencia = None
+        for etiqueta, modulo in alternativas:
+            fn = getattr(modulo, nombre, None)
+            if fn is None:
+                continue
+            if referencia is None:
+                referencia = _normalizar(await getattr(q, nombre)(session, *params), ordenado)
+            obtenido = _normalizar(await fn(session, *params), ordenado)
+            comparaciones.append((etiqueta, nombre, params, referencia, obtenido))
+    return comparaciones
+
+
+async def main(args) -> int:
+    async with AsyncSessionLocal() as session:
+        comparaciones = await comparar_formas(session, args.resumenes, args.muestras, args.desde, args.hasta)
+    fallos = 0
+    for etiqueta, nombre, params, referencia, obtenido in comparaciones:
+        ok = obtenido == referencia
+        fallos += not ok
+        print(f"{'OK  ' if ok else 'FAIL'} {etiqueta:<14} {nombre}{params}")
+        if not ok:
+            print(f"     esperado: {json.dumps(referencia, sort_keys=True, default=str)}")
+            print(f"     obtenido: {json.dumps(obtenido, sort_keys=True, default=str)}")
+    await engine.dispose()
+    print(f"{fallos} diferencias")
+    return 1 if fallos else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumenes", action="store_true", help="compara también las tablas resumen")
+    parser.add_argument("--muestras", type=int, default=20, help="ids distintos a probar en q1 y q2")
+    parser.add_argument("--desde", type=date.fromisoformat, default=date(2000, 1, 1))
+    parser.add_argument("--hasta", type=date.fromisoformat, default=date(2100, 1, 1))
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,65 @@
+# tests/conftest.py
+"""
+Los tests corren sobre SQLite (aiosqlite) en un archivo temporal, sin servicios externos.
+DATABASE_URL se fija aquí, antes de que ningún test importe app (settings se lee al importar).
+"""
+import asyncio
+import os
+import tempfile
+
+import pytest
+
+_DIRECTORIO = tempfile.mkdtemp(prefix="tests_eventos_")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{os.path.join(_DIRECTORIO, 'tests.db')}"
+os.environ["BLOBS_DIR"] = os.path.join(_DIRECTORIO, "blobs")
+os.environ.pop("REPLICA_DATABASE_URL", None)
+
+
+def ejecutar(corrutina):
+    """Corre la corrutina en un loop nuevo y cierra el pool al terminar (sus conexiones son de ese loop)."""
+    from app.db.mysql import engine
+
+    async def _envuelta():
+        try:
+            return await corrutina
+        finally:
+            await engine.dispose()
+    return asyncio.run(_envuelta())
+
+
+@pytest.fixture(scope="session")
+def datos_sembrados():
+    """Dataset pequeño y determinista (scripts.sembrar_datos con semilla fija), compartido y de solo lectura."""
+    from scripts.sembrar_datos import Sembrador, parsear_args
+
+    args = parsear_args([
+        "--reset", "--semilla", "7", "--facultades", "3", "--instalaciones", "8",
+        "--organizaciones", "40", "--usuarios", "200", "--eventos", "400",
+    ])
+    ejecutar(Sembrador(args).sembrar())
+    return args
+
+
+@pytest.fixture(scope="session")
+def usuarios(datos_sembrados):
+    """Un id de usuario por rol del dataset sembrado."""
+    from sqlalchemy import func, select
+    from app.db.mysql import AsyncSessionLocal
+    from app.models.usuarios.usuario import UsuarioModel
+
+    async def caso():
+        async with AsyncSessionLocal() as session:
+            filas = await session.execute(
+                select(UsuarioModel.rol, func.min(UsuarioModel.id_usuario)).group_by(UsuarioModel.rol))
+            return dict(filas.all())
+    return ejecutar(caso())
+
+
+@pytest.fixture
+def cliente(datos_sembrados):
+    """TestClient de la app completa (el `with` ejecuta el lifespan: pool y versionado)."""
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    with TestClient(app) as c:
+        yield c
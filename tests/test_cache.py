@@ -0,0 +1,90 @@
+# tests/test_cache.py
+from sqlalchemy import select
+
+from app.core.cache import CacheTTL, cache_consultas
+from app.db.mysql import AsyncSessionLocal
+from app.models.eventos.evento import EventoModel
+from app.models.usuarios.usuario import UsuarioModel
+from tests.conftest import ejecutar
+
+TOP = "/api/v1/consultas/instalaciones/top"
+
+
+def _estadisticas(cliente):
+    return cliente.get("/api/v1/consultas/cache/estadisticas").json()
+
+
+def test_commit_invalida_la_consulta(cliente, usuarios):
+    cache_consultas.limpiar()
+    primera = cliente.get(TOP)
+    antes = _estadisticas(cliente)
+    assert cliente.get(TOP).json() == primera.json()
+    despues = _estadisticas(cliente)
+    assert (despues["hits"], despues["misses"]) == (antes["hits"] + 1, antes["misses"])
+
+    r = cliente.post(f"/api/v1/eventos/?id_responsable={usuarios['docente']}", json={
+        "nombre": "Evento que invalida", "descripcion": None, "tipo": "ludico",
+        "fecha_inicio": "2031-10-01", "fecha_fin": "2031-10-01",
+        "hora_inicio": "08:00:00", "hora_fin": "09:00:00",
+    })
+    assert r.status_code == 201, r.text
+    tras_escritura = _estadisticas(cliente)
+    assert tras_escritura["invalidaciones"] > despues["invalidaciones"]
+    assert tras_escritura["entradas"] == despues["entradas"] - 1
+
+    cliente.get(TOP)
+    assert _estadisticas(cliente)["misses"] == tras_escritura["misses"] + 1
+
+
+def test_solo_invalidan_commits_sobre_tablas_leidas(datos_sembrados):
+    from app.core.cache import instalar_invalidacion_cache
+
+    instalar_invalidacion_cache()
+    cache_consultas.limpiar()
+    calculos = []
+
+    @cache_consultas.cachear("Evento")
+    async def consulta(x):
+        calculos.append(x)
+        return x
+
+    async def escribir(modelo, campo, valor, confirmar):
+        async with AsyncSessionLocal() as session:
+            obj = (await session.execute(select(modelo).limit(1))).scalar_one()
+            setattr(obj, campo, valor)
+            await session.flush()
+            await (session.commit() if confirmar else session.rollback())
+
+    async def caso():
+        await consulta(1)
+        await consulta(1)
+        assert calculos == [1]
+        await escribir(UsuarioModel, "telefono", "3000000000", confirmar=True)  # otra tabla
+        await consulta(1)
+        assert calculos == [1]
+        await escribir(EventoModel, "descripcion", "descartada", confirmar=False)  # rollback
+        await consulta(1)
+        assert calculos == [1]
+        await escribir(EventoModel, "descripcion", "cambiada en test_cache", confirmar=True)
+        await consulta(1)
+        assert calculos == [1, 1]
+    ejecutar(caso())
+
+
+def test_no_guarda_lo_calculado_durante_una_invalidacion():
+    cache = CacheTTL(max_entradas=10, ttl_segundos=60)
+    calculos = []
+
+    @cache.cachear("Evento")
+    async def consulta():
+        calculos.append(1)
+        if len(calculos) == 1:
+            cache.invalidar({"Evento"})  # commit concurrente mientras se calculaba
+        return len(calculos)
+
+    async def caso():
+        assert await consulta() == 1
+        assert await consulta() == 2
+        assert await consulta() == 2
+    ejecutar(caso())
+    assert len(calculos) == 2
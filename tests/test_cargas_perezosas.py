@@ -0,0 +1,81 @@
+# tests/test_cargas_perezosas.py
+import logging
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, selectinload
+
+from app.core.config import settings
+from app.db import cargas_perezosas as cp
+from app.db.mysql import AsyncSessionLocal
+from app.models.eventos.evento import EventoModel
+from tests.conftest import ejecutar
+
+RELACION = "EventoModel.responsables"
+
+
+@pytest.fixture
+def deteccion(monkeypatch, datos_sembrados):
+    monkeypatch.setattr(settings, "CARGAS_PEREZOSAS_UMBRAL", 3)
+    cp.instalar_deteccion_cargas_perezosas()
+    yield
+    event.remove(Session, "do_orm_execute", cp._al_ejecutar)
+
+
+async def _recorrer_responsables(n: int, cargar_antes: bool = False):
+    """Carga n eventos y recorre sus responsables; devuelve el conteo de cargas perezosas."""
+    stmt = select(EventoModel).order_by(EventoModel.id_evento).limit(n)
+    if cargar_antes:
+        stmt = stmt.options(selectinload(EventoModel.responsables))
+    async with AsyncSessionLocal() as session:
+        eventos = (await session.execute(stmt)).scalars().all()
+        await session.run_sync(lambda _: [len(e.responsables) for e in eventos])
+        return cp.cargas_perezosas(session)
+
+
+# -----------------------------
+# max_sentencias
+# -----------------------------
+def test_max_sentencias_dentro_del_limite(datos_sembrados):
+    async def caso():
+        with cp.max_sentencias(1) as contador:
+            async with AsyncSessionLocal() as session:
+                await session.execute(select(EventoModel.id_evento).limit(1))
+        return contador.n
+    assert ejecutar(caso()) == 1
+
+
+def test_max_sentencias_falla_si_se_excede(datos_sembrados):
+    async def caso():
+        with cp.max_sentencias(1):
+            async with AsyncSessionLocal() as session:
+                await session.execute(select(EventoModel.id_evento).limit(1))
+                await session.execute(select(EventoModel.id_evento).limit(1))
+    with pytest.raises(AssertionError, match="2 sentencias"):
+        ejecutar(caso())
+
+
+# -----------------------------
+# Modo estricto
+# -----------------------------
+def test_warn_avisa_al_llegar_al_umbral(monkeypatch, caplog, deteccion):
+    monkeypatch.setattr(settings, "MODO_ESTRICTO_CARGAS", "warn")
+    with caplog.at_level(logging.WARNING, logger="app.cargas_perezosas"):
+        assert ejecutar(_recorrer_responsables(2)) == {RELACION: 2}
+        assert not caplog.records
+        assert ejecutar(_recorrer_responsables(5)) == {RELACION: 5}
+    assert len(caplog.records) == 1  # solo al llegar al umbral, no en cada carga posterior
+    assert RELACION in caplog.records[0].getMessage()
+
+
+def test_raise_falla_al_llegar_al_umbral(monkeypatch, deteccion):
+    monkeypatch.setattr(settings, "MODO_ESTRICTO_CARGAS", "raise")
+    assert ejecutar(_recorrer_responsables(2)) == {RELACION: 2}
+    with pytest.raises(cp.CargaPerezosaRepetida, match=RELACION):
+        ejecutar(_recorrer_responsables(3))
+
+
+def test_selectinload_no_cuenta(monkeypatch, deteccion):
+    monkeypatch.setattr(settings, "MODO_ESTRICTO_CARGAS", "raise")
+    with cp.max_sentencias(2):
+        assert ejecutar(_recorrer_responsables(10, cargar_antes=True)) == {}
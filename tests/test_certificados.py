@@ -0,0 +1,107 @@
+# tests/test_certificados.py
+import pytest
+
+from app.core.config import settings
+
+PDF = b"%PDF-1.4\n" + bytes(range(256)) * 40
+GRANDE = PDF * 20  # supera CERTIFICADO_MAX_BYTES + margen multipart con el máximo reducido a 1 KiB
+
+
+@pytest.fixture
+def id_evento(cliente, usuarios):
+    r = cliente.post(f"/api/v1/eventos/?id_responsable={usuarios['docente']}", json={
+        "nombre": "Evento con certificados", "descripcion": None, "tipo": "academico",
+        "fecha_inicio": "2031-10-01", "fecha_fin": "2031-10-01",
+        "hora_inicio": "09:00:00", "hora_fin": "10:00:00",
+    })
+    assert r.status_code == 201, r.text
+    return r.json()["id_evento"]
+
+
+def _subir(cliente, id_evento, datos=PDF, id_organizacion=1):
+    return cliente.post(
+        f"/api/v1/eventos/{id_evento}/organizaciones",
+        data={"id_organizacion": str(id_organizacion), "nombre_representante": "Ana", "representante_legal": "Si"},
+        files={"certificado": ("certificado.pdf", datos, "application/pdf")},
+    )
+
+
+@pytest.fixture
+def url_certificado(cliente, id_evento):
+    r = _subir(cliente, id_evento)
+    assert r.status_code == 201, r.text
+    return f"/api/v1/eventos/{id_evento}/organizaciones/1/certificado"
+
+
+# -----------------------------
+# Descarga: ETag, If-None-Match, Range
+# -----------------------------
+def test_descarga_completa_y_304(cliente, url_certificado):
+    r = cliente.get(url_certificado)
+    assert r.status_code == 200 and r.content == PDF
+    etag = r.headers["etag"]
+    assert etag.startswith('"') and r.headers["accept-ranges"] == "bytes"
+
+    r = cliente.get(url_certificado, headers={"If-None-Match": etag})
+    assert r.status_code == 304 and r.content == b"" and r.headers["etag"] == etag
+    assert cliente.get(url_certificado, headers={"If-None-Match": '"otro"'}).status_code == 200
+
+
+def test_rangos(cliente, url_certificado):
+    r = cliente.get(url_certificado, headers={"Range": "bytes=10-99"})
+    assert r.status_code == 206 and r.content == PDF[10:100]
+    assert r.headers["content-range"] == f"bytes 10-99/{len(PDF)}"
+
+    r = cliente.get(url_certificado, headers={"Range": "bytes=-16"})
+    assert r.status_code == 206 and r.content == PDF[-16:]
+
+    r = cliente.get(url_certificado, headers={"Range": f"bytes={len(PDF)}-"})
+    assert r.status_code == 416 and r.headers["content-range"] == f"bytes */{len(PDF)}"
+
+    # If-Range con un ETag distinto: se sirve el archivo completo
+    r = cliente.get(url_certificado, headers={"Range": "bytes=0-9", "If-Range": '"otro"'})
+    assert r.status_code == 200 and r.content == PDF
+
+
+# -----------------------------
+# Subida: 413 antes de leer el cuerpo
+# -----------------------------
+def test_subida_demasiado_grande_por_content_length(cliente, id_evento, monkeypatch):
+    monkeypatch.setattr(settings, "CERTIFICADO_MAX_BYTES", 1024)
+    r = _subir(cliente, id_evento, GRANDE)
+    assert r.status_code == 413, r.text
+    assert "cuerpo" in r.json()["detail"]  # lo rechazó CuerpoLimitado, no la comprobación por archivo
+
+
+def test_subida_demasiado_grande_sin_content_length(cliente, id_evento, monkeypatch):
+    monkeypatch.setattr(settings, "CERTIFICADO_MAX_BYTES", 1024)
+    limite = "X" * 16
+    partes = [
+        f"--{limite}\r\nContent-Disposition: form-data; name=\"id_organizacion\"\r\n\r\n1\r\n".encode(),
+        f"--{limite}\r\nContent-Disposition: form-data; name=\"certificado\"; filename=\"c.pdf\"\r\n"
+        "Content-Type: application/pdf\r\n\r\n".encode(),
+        *(GRANDE[i:i + 4096] for i in range(0, len(GRANDE), 4096)),
+        f"\r\n--{limite}--\r\n".encode(),
+    ]
+    r = cliente.post(
+        f"/api/v1/eventos/{id_evento}/organizaciones",
+        content=iter(partes),  # sin Content-Length: transfer-encoding chunked
+        headers={"Content-Type": f"multipart/form-data; boundary={limite}"},
+    )
+    assert r.status_code == 413, r.text
+    assert "cuerpo" in r.json()["detail"]
+
+
+def test_lote_demasiado_grande(cliente, id_evento, monkeypatch):
+    monkeypatch.setattr(settings, "REPRESENTANTES_LOTE_MAX_BYTES", 4096)
+    r = cliente.post(
+        f"/api/v1/eventos/{id_evento}/organizaciones/bulk",
+        data={"items": '[{"id_organizacion": 1, "nombre_representante": "Ana", "representante_legal": "Si", '
+                       '"certificado": 0}]'},
+        files=[("certificados", ("c.pdf", PDF, "application/pdf"))],
+    )
+    assert r.status_code == 413, r.text
+
+
+def test_subida_dentro_del_limite(cliente, id_evento):
+    assert _subir(cliente, id_evento, id_organizacion=2).status_code == 201
@@ -0,0 +1,134 @@
+# tests/test_compresion.py
+import gzip
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compresion import Codificador, CompresionMiddleware, codificadores_disponibles, negociar
+
+DATOS = {"items": [{"id": i, "nombre": f"Evento {i}"} for i in range(200)]}
+ETAG = '"abc123"'
+
+
+def _falso(nombre):
+    return Codificador(nombre, lambda datos: datos, None)
+
+
+@pytest.mark.parametrize("accept_encoding, esperado", [
+    (None, None),
+    ("", None),
+    ("identity", None),
+    ("gzip", "gzip"),
+    ("gzip, br, zstd", "zstd"),           # manda el orden del servidor, no el del cliente
+    ("zstd;q=0, gzip;q=0.1, br", "br"),
+    ("gzip;q=0", None),
+    ("GZIP;Q=0.5", "gzip"),
+    ("*", "zstd"),
+    ("*;q=0.3, zstd;q=0", "br"),
+    ("gzip;q=0, *", "zstd"),
+    ("gzip;q=abc", None),
+])
+def test_negociar_respeta_q(accept_encoding, esperado):
+    codificadores = [_falso("zstd"), _falso("br"), _falso("gzip")]
+    elegido = negociar(accept_encoding, codificadores)
+    assert (elegido.nombre if elegido else None) == esperado
+
+
+def test_sin_paquetes_opcionales_solo_gzip():
+    nombres = [c.nombre for c in codificadores_disponibles(["zstd", "br", "gzip"])]
+    assert "gzip" in nombres and set(nombres) <= {"zstd", "br", "gzip"}
+    assert codificadores_disponibles(["gzip"])[0].de_una_vez(b"x" * 10)[:2] == b"\x1f\x8b"
+
+
+@pytest.fixture(scope="module")
+def cliente_compresion():
+    app = FastAPI()
+
+    @app.get("/json")
+    async def json_():
+        return JSONResponse(DATOS, headers={"ETag": ETAG, "Vary": "Cookie"})
+
+    @app.get("/pequeno")
+    async def pequeno():
+        return JSONResponse({"ok": True})
+
+    @app.get("/parcial")
+    async def parcial():
+        cuerpo = json.dumps(DATOS).encode()
+        return Response(cuerpo[:4096], status_code=206, media_type="application/json",
+                        headers={"Content-Range": f"bytes 0-4095/{len(cuerpo)}"})
+
+    @app.get("/no-modificado")
+    async def no_modificado():
+        return Response(status_code=304, headers={"ETag": ETAG})
+
+    @app.get("/sin-transformar")
+    async def sin_transformar():
+        return JSONResponse(DATOS, headers={"Cache-Control": "no-transform"})
+
+    @app.get("/binario")
+    async def binario():
+        return Response(b"\0" * 4096, media_type="application/pdf")
+
+    @app.get("/stream")
+    async def stream():
+        async def lineas():
+            for item in DATOS["items"]:
+                yield json.dumps(item) + "\n"
+        return StreamingResponse(lineas(), media_type="application/x-ndjson")
+
+    app.add_middleware(CompresionMiddleware, codificadores=codificadores_disponibles(["gzip"]), minimo_bytes=1024)
+    with TestClient(app) as c:
+        yield c
+
+
+def test_comprime_y_debilita_etag(cliente_compresion):
+    r = cliente_compresion.get("/json", headers={"Accept-Encoding": "gzip"})
+    assert r.headers["content-encoding"] == "gzip"
+    assert r.headers["etag"] == f"W/{ETAG}"
+    assert r.headers["vary"] == "Cookie, Accept-Encoding"
+    assert int(r.headers["content-length"]) < len(json.dumps(DATOS))
+    assert r.json() == DATOS
+
+
+def test_q0_no_comprime(cliente_compresion):
+    r = cliente_compresion.get("/json", headers={"Accept-Encoding": "gzip;q=0"})
+    assert "content-encoding" not in r.headers
+    assert r.headers["etag"] == ETAG
+    assert r.json() == DATOS
+
+
+@pytest.mark.parametrize("ruta", ["/parcial", "/no-modificado", "/sin-transformar", "/binario"])
+def test_respuestas_que_no_se_tocan(cliente_compresion, ruta):
+    r = cliente_compresion.get(ruta, headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in r.headers
+    assert "accept-encoding" not in r.headers.get("vary", "").lower()
+    if "etag" in r.headers:
+        assert r.headers["etag"] == ETAG  # sigue fuerte
+
+
+def test_cuerpo_pequeno_sin_comprimir_con_vary(cliente_compresion):
+    r = cliente_compresion.get("/pequeno", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in r.headers
+    assert r.headers["vary"] == "Accept-Encoding"
+
+
+def test_streaming_por_bloques(cliente_compresion):
+    with cliente_compresion.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as r:
+        assert r.headers["content-encoding"] == "gzip"
+        assert "content-length" not in r.headers
+        crudo = b"".join(r.iter_raw())
+    lineas = gzip.decompress(crudo).decode().splitlines()
+    assert [json.loads(linea) for linea in lineas] == DATOS["items"]
+
+
+def test_etag_debil_revalida_en_la_app(cliente):
+    url = "/api/v1/eventos/?limite=50"
+    r = cliente.get(url, headers={"Accept-Encoding": "gzip"})
+    assert r.status_code == 200 and r.headers["content-encoding"] == "gzip"
+    assert r.headers["etag"].startswith('W/"')
+    r = cliente.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": r.headers["etag"]})
+    assert r.status_code == 304 and "content-encoding" not in r.headers
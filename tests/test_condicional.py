@@ -0,0 +1,84 @@
+# tests/test_condicional.py
+import pytest
+from sqlalchemy import update
+
+from app.db.mysql import AsyncSessionLocal
+from app.models.eventos.evento import EventoModel
+
+
+@pytest.fixture
+def dos_eventos(cliente, usuarios):
+    ids = []
+    for i in range(2):
+        r = cliente.post(f"/api/v1/eventos/?id_responsable={usuarios['docente']}", json={
+            "nombre": f"Evento con ETag {i}", "descripcion": None, "tipo": "academico",
+            "fecha_inicio": "2031-11-03", "fecha_fin": "2031-11-03",
+            "hora_inicio": "10:00:00", "hora_fin": "11:00:00",
+        })
+        assert r.status_code == 201, r.text
+        ids.append(r.json()["id_evento"])
+    return ids
+
+
+def _etag(cliente, url):
+    r = cliente.get(url)
+    assert r.status_code == 200, r.text
+    assert r.headers["cache-control"] == "no-cache"
+    return r.headers["etag"]
+
+
+def _revalidar(cliente, url, etag):
+    return cliente.get(url, headers={"If-None-Match": etag})
+
+
+def test_304_si_coincide(cliente, dos_eventos):
+    url = f"/api/v1/eventos/{dos_eventos[0]}"
+    etag = _etag(cliente, url)
+    assert not etag.startswith("W/")
+    for cabecera in (etag, f"W/{etag}", f'"otro", {etag}', "*"):
+        r = _revalidar(cliente, url, cabecera)
+        assert r.status_code == 304 and r.content == b""
+        assert r.headers["etag"] == etag
+    assert _revalidar(cliente, url, '"otro"').status_code == 200
+
+
+def test_etag_por_entidad(cliente, dos_eventos):
+    uno, otro = (f"/api/v1/eventos/{i}" for i in dos_eventos)
+    etag = _etag(cliente, uno)
+
+    # escribir otro evento no cambia el detalle de este
+    assert cliente.patch(otro, json={"nombre": "Otro renombrado"}).status_code == 200
+    assert _revalidar(cliente, uno, etag).status_code == 304
+
+    # escribir este sí
+    assert cliente.patch(uno, json={"nombre": "Renombrado"}).status_code == 200
+    r = _revalidar(cliente, uno, etag)
+    assert r.status_code == 200 and r.json()["nombre"] == "Renombrado"
+    assert r.headers["etag"] != etag
+
+
+def test_escritura_en_bloque_cambia_todos_los_detalles(cliente, dos_eventos):
+    uno = f"/api/v1/eventos/{dos_eventos[0]}"
+    etag = _etag(cliente, uno)
+
+    async def actualizar_en_bloque():
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                update(EventoModel).where(EventoModel.id_evento == dos_eventos[1]).values(descripcion="en bloque"))
+            await session.commit()
+    cliente.portal.call(actualizar_en_bloque)
+
+    # un UPDATE en bloque no dice qué filas toca: sube la generación de toda la tabla
+    assert _revalidar(cliente, uno, etag).status_code == 200
+
+
+def test_listado_y_consulta_cambian_tras_escribir(cliente, dos_eventos):
+    urls = ["/api/v1/eventos/?limite=5", "/api/v1/consultas/instalaciones/top"]
+    etags = {url: _etag(cliente, url) for url in urls}
+    for url in urls:
+        assert _revalidar(cliente, url, etags[url]).status_code == 304  # también servida desde la caché
+
+    assert cliente.patch(f"/api/v1/eventos/{dos_eventos[0]}", json={"descripcion": "cambio"}).status_code == 200
+    for url in urls:
+        r = _revalidar(cliente, url, etags[url])
+        assert r.status_code == 200 and r.headers["etag"] != etags[url]
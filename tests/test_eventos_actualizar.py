@@ -0,0 +1,34 @@
+# tests/test_eventos_actualizar.py
+import pytest
+
+
+@pytest.fixture
+def id_evento(cliente, usuarios):
+    r = cliente.post(f"/api/v1/eventos/?id_responsable={usuarios['docente']}", json={
+        "nombre": "Evento para editar", "descripcion": None, "tipo": "ludico",
+        "fecha_inicio": "2031-05-10", "fecha_fin": "2031-05-10",
+        "hora_inicio": "10:00:00", "hora_fin": "12:00:00",
+    })
+    assert r.status_code == 201, r.text
+    return r.json()["id_evento"]
+
+
+def test_patch_parcial_de_una_fecha(cliente, id_evento):
+    r = cliente.patch(f"/api/v1/eventos/{id_evento}", json={"fecha_fin": "2031-05-12"})
+    assert r.status_code == 200, r.text
+    assert (r.json()["fecha_inicio"], r.json()["fecha_fin"]) == ("2031-05-10", "2031-05-12")
+    # ya son varios días: la hora de fin puede ser anterior a la de inicio
+    r = cliente.patch(f"/api/v1/eventos/{id_evento}", json={"hora_fin": "08:00:00"})
+    assert r.status_code == 200, r.text
+
+
+@pytest.mark.parametrize("datos", [
+    {"fecha_fin": "2031-05-01"},          # antes de fecha_inicio (guardada)
+    {"hora_fin": "09:00:00"},             # mismo día, antes de hora_inicio (guardada)
+    {"fecha_fin": "12/05/2031"},          # formato no ISO
+    {"hora_inicio": 930},                 # tipo incorrecto
+])
+def test_patch_parcial_invalido_responde_400(cliente, id_evento, datos):
+    r = cliente.patch(f"/api/v1/eventos/{id_evento}", json=datos)
+    assert r.status_code == 400, r.text
+    assert cliente.get(f"/api/v1/eventos/{id_evento}").json()["fecha_fin"] == "2031-05-10"
@@ -0,0 +1,46 @@
+# tests/test_eventos_lote.py
+def _item(id_responsable, **cambios):
+    item = {
+        "nombre": "Evento de lote", "descripcion": None, "tipo": "academico",
+        "fecha_inicio": "2031-03-01", "fecha_fin": "2031-03-01",
+        "hora_inicio": "09:00:00", "hora_fin": "11:00:00", "id_responsable": id_responsable,
+    }
+    item.update(cambios)
+    return item
+
+
+def test_lote_con_items_invalidos_responde_por_item(cliente, usuarios):
+    estudiante, secretaria = usuarios["estudiante"], usuarios["secretaria_academica"]
+    items = [
+        _item(estudiante),
+        _item(estudiante, fecha_fin="2031-02-01"),        # validador del schema: 422
+        _item(estudiante, nombre="x"),                    # longitud mínima: 422
+        _item(estudiante, hora_fin="08:00:00"),           # mismo día, hora_fin < hora_inicio: 422
+        _item(10 ** 9),                                   # responsable inexistente: 400
+        _item(secretaria),                                # rol sin permiso: 403
+        _item(estudiante, fecha_fin="2031-03-02", hora_fin="08:00:00"),  # varios días: válido
+    ]
+    r = cliente.post("/api/v1/eventos/bulk", json=items)
+    assert r.status_code == 200, r.text
+    cuerpo = r.json()
+    assert [x["status_code"] for x in cuerpo["resultados"]] == [201, 422, 422, 422, 400, 403, 201]
+    assert (cuerpo["creados"], cuerpo["fallidos"]) == (2, 5)
+    assert all(isinstance(e["msg"], str) for e in cuerpo["resultados"][1]["error"])
+
+    for resultado in (cuerpo["resultados"][0], cuerpo["resultados"][6]):
+        assert cliente.get(f"/api/v1/eventos/{resultado['id_evento']}").status_code == 200
+
+
+def test_item_que_no_es_objeto_falla_solo_el(cliente, usuarios):
+    r = cliente.post("/api/v1/eventos/bulk", json=[_item(usuarios["docente"]), 5])
+    assert r.status_code == 200, r.text
+    assert [x["status_code"] for x in r.json()["resultados"]] == [201, 422]
+
+
+def test_openapi_documenta_los_items(cliente):
+    esquema = cliente.get("/openapi.json").json()
+    cuerpo = esquema["paths"]["/api/v1/eventos/bulk"]["post"]["requestBody"]["content"]["application/json"]
+    items = cuerpo["schema"]["items"]
+    assert "id_responsable" in items["required"] and "fecha_inicio" in items["properties"]
+    assert items["properties"]["tipo"]["$ref"].split("/")[-1] in esquema["components"]["schemas"]
+    assert cuerpo["examples"]
@@ -0,0 +1,41 @@
+# tests/test_formas_consultas.py
+import json
+
+import pytest
+
+from app.crud.eventos.resumenes import reconstruir_resumenes
+from app.db.mysql import AsyncSessionLocal
+from scripts.verificar_formas_consultas import _normalizar, comparar_formas
+from tests.conftest import ejecutar
+
+
+@pytest.fixture(scope="module")
+def comparaciones(datos_sembrados):
+    async def caso():
+        async with AsyncSessionLocal() as session:
+            await reconstruir_resumenes(session)  # el sembrador inserta sin pasar por los hooks
+            return await comparar_formas(session, resumenes=True)
+    return ejecutar(caso())
+
+
+def test_todas_las_formas_coinciden(comparaciones):
+    formas = {(etiqueta, nombre) for etiqueta, nombre, *_ in comparaciones}
+    assert ("una_sentencia", "q9_top5_usuarios_activos") in formas
+    assert ("resumenes", "q4_instalacion_top_y_detalle") in formas
+    for etiqueta, nombre, params, esperado, obtenido in comparaciones:
+        assert obtenido == esperado, (
+            f"{etiqueta} {nombre}{params}\n"
+            f"esperado: {json.dumps(esperado, sort_keys=True, default=str)}\n"
+            f"obtenido: {json.dumps(obtenido, sort_keys=True, default=str)}"
+        )
+
+
+def test_top5_no_vacio(comparaciones):
+    top5 = next(esp for _e, nombre, _p, esp, _o in comparaciones if nombre == "q9_top5_usuarios_activos")
+    assert len(top5) == 5
+
+
+def test_normalizar_respeta_el_orden_solo_si_se_pide():
+    a = [{"id_usuario": 1, "eventos": 3}, {"id_usuario": 2, "eventos": 3}]
+    assert _normalizar(a) == _normalizar(a[::-1])
+    assert _normalizar(a, ordenado=True) != _normalizar(a[::-1], ordenado=True)
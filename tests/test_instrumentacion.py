@@ -0,0 +1,28 @@
+# tests/test_instrumentacion.py
+import re
+
+SERVER_TIMING = re.compile(r'db;dur=[\d.]+;desc="(\d+) sentencias, (\d+) filas modificadas", total;dur=[\d.]+')
+
+
+def _db(respuesta):
+    m = SERVER_TIMING.search(respuesta.headers["server-timing"])
+    assert m, respuesta.headers["server-timing"]
+    return int(m.group(1)), int(m.group(2))
+
+
+def test_lectura_cuenta_sentencias_sin_filas_modificadas(cliente):
+    r = cliente.get("/api/v1/eventos/?limite=2")
+    assert r.status_code == 200 and len(r.json()["items"]) == 2
+    sentencias, modificadas = _db(r)
+    assert sentencias >= 1 and modificadas == 0
+
+
+def test_escritura_cuenta_filas_modificadas(cliente, usuarios):
+    r = cliente.post(f"/api/v1/eventos/?id_responsable={usuarios['estudiante']}", json={
+        "nombre": "Evento instrumentado", "descripcion": None, "tipo": "academico",
+        "fecha_inicio": "2031-09-01", "fecha_fin": "2031-09-01",
+        "hora_inicio": "09:00:00", "hora_fin": "10:00:00",
+    })
+    assert r.status_code == 201, r.text
+    _sentencias, modificadas = _db(r)
+    assert modificadas >= 2  # Evento + EventoResponsable (más contadores de versión)
@@ -0,0 +1,84 @@
+# tests/test_migraciones.py
+import asyncio
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import app.models  # noqa: F401
+from app.crud.eventos.resumenes import RESUMENES
+from app.db import migraciones
+from app.db.migraciones import TABLA_MIGRACIONES
+from app.db.mysql import Base
+
+# las tablas resumen no las crea ninguna migración (python -m scripts.resumenes reconstruir)
+RESUMENES_TABLAS = {modelo.__tablename__ for modelo, _c, _s in RESUMENES}
+
+
+def _describir(conn):
+    i = inspect(conn)
+    esquema = {}
+    for tabla in i.get_table_names():
+        if tabla == TABLA_MIGRACIONES.name:
+            continue
+        esquema[tabla] = {
+            "columnas": sorted((c["name"], str(c["type"]), c["nullable"]) for c in i.get_columns(tabla)),
+            "pk": i.get_pk_constraint(tabla)["constrained_columns"],
+            "fks": sorted((tuple(f["constrained_columns"]), f["referred_table"]) for f in i.get_foreign_keys(tabla)),
+            "indices": sorted((x["name"], tuple(x["column_names"]), bool(x["unique"])) for x in i.get_indexes(tabla)),
+            "unicas": sorted(tuple(u["column_names"]) for u in i.get_unique_constraints(tabla)),
+        }
+    return esquema
+
+
+async def _esquema(motor):
+    async with motor.connect() as conn:
+        return await conn.run_sync(_describir)
+
+
+def test_migraciones_producen_el_esquema_de_los_modelos(tmp_path):
+    async def caso():
+        migrado = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'migrado.db'}")
+        modelos = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'modelos.db'}")
+        try:
+            aplicadas = await migraciones.subir(migrado)
+            esquema_migrado = await _esquema(migrado)
+
+            # volver a subir no aplica nada ni cambia el esquema
+            assert await migraciones.subir(migrado) == []
+            # y cada migración es idempotente aunque se reejecute a mano
+            for m in migraciones.descubrir():
+                async with migrado.begin() as conn:
+                    await conn.run_sync(m.subir)
+            assert await _esquema(migrado) == esquema_migrado
+
+            async with modelos.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all, tables=[
+                    t for nombre, t in Base.metadata.tables.items() if nombre not in RESUMENES_TABLAS
+                ])
+            return aplicadas, esquema_migrado, await _esquema(modelos)
+        finally:
+            await migrado.dispose()
+            await modelos.dispose()
+
+    aplicadas, esquema_migrado, esquema_modelos = asyncio.run(caso())
+    assert aplicadas == [m.version for m in migraciones.descubrir()]
+    assert set(esquema_migrado) == set(esquema_modelos)
+    for tabla in esquema_modelos:
+        assert esquema_migrado[tabla] == esquema_modelos[tabla], tabla
+
+
+def test_indices_de_0002_existen(tmp_path):
+    from app.db.migraciones.versiones.v0002_indices_consultas import INDICES
+
+    async def caso():
+        motor = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'migrado.db'}")
+        try:
+            await migraciones.subir(motor)
+            return await _esquema(motor)
+        finally:
+            await motor.dispose()
+
+    esquema = asyncio.run(caso())
+    for indice, _fk in INDICES:
+        columnas = tuple(c.name for c in indice.columns)
+        assert (indice.name, columnas, False) in esquema[indice.table.name]["indices"]
@@ -0,0 +1,42 @@
+# tests/test_paralelo.py
+import pytest
+from sqlalchemy import event, func, select
+
+from app.core.config import settings
+from app.db.mysql import AsyncSessionLocal, engine
+from app.db.paralelo import ejecutar_independientes
+from app.models.eventos.evento import EventoModel
+from tests.conftest import ejecutar
+
+
+@pytest.mark.parametrize("maximo", [1, 2, 3])
+def test_paralelo_cuenta_la_conexion_de_la_peticion(datos_sembrados, monkeypatch, maximo):
+    monkeypatch.setattr(settings, "CONSULTAS_MAX_CONEXIONES_POR_PETICION", maximo)
+    stmts = [select(func.count()).select_from(EventoModel).where(EventoModel.id_evento > i) for i in range(5)]
+    uso = {"actual": 0, "pico": 0}
+
+    def al_tomar(*_):
+        uso["actual"] += 1
+        uso["pico"] = max(uso["pico"], uso["actual"])
+
+    def al_devolver(*_):
+        uso["actual"] -= 1
+
+    async def caso():
+        async with AsyncSessionLocal() as session:
+            en_serie = [r.scalar_one() for r in await ejecutar_independientes(session, *stmts, paralelo=False)]
+        uso["pico"] = 0
+        event.listen(engine.sync_engine.pool, "checkout", al_tomar)
+        event.listen(engine.sync_engine.pool, "checkin", al_devolver)
+        try:
+            async with AsyncSessionLocal() as session:
+                await session.execute(select(1))  # como en una petición: la sesión ya tiene su conexión
+                resultados = await ejecutar_independientes(session, *stmts, paralelo=True)
+        finally:
+            event.remove(engine.sync_engine.pool, "checkout", al_tomar)
+            event.remove(engine.sync_engine.pool, "checkin", al_devolver)
+        return en_serie, [r.scalar_one() for r in resultados]
+
+    en_serie, en_paralelo = ejecutar(caso())
+    assert en_paralelo == en_serie
+    assert uso["pico"] == maximo  # cinco sentencias bastan para llenar el límite, nunca para pasarlo
@@ -0,0 +1,94 @@
+# tests/test_replica.py
+"""
+Primario y réplica como dos ficheros SQLite: la "réplica" es una copia del primario que no
+recibe las escrituras posteriores, así se ve de dónde lee cada petición.
+"""
+import asyncio
+import shutil
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.routes.eventos import router as eventos_router
+from app.core.config import settings
+from app.db import replica
+from app.db.mysql import engine
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(replica.LecturaConsistenteMiddleware)
+    app.include_router(eventos_router, prefix="/api/v1")
+    return app
+
+
+@pytest.fixture
+def con_replica(datos_sembrados, tmp_path, monkeypatch):
+    """Réplica en un fichero copiado del primario; devuelve una función para apuntarla a otra URL."""
+    primario = engine.url.database
+    copia = tmp_path / "replica.db"
+    shutil.copyfile(primario, copia)
+    motores = []
+
+    def apuntar(url: str):
+        motor = replica._crear_engine_replica(url)
+        motores.append(motor)
+        monkeypatch.setattr(replica, "engine_replica", motor)
+        monkeypatch.setattr(replica, "AsyncSessionReplica",
+                            sessionmaker(bind=motor, class_=AsyncSession, expire_on_commit=False))
+        monkeypatch.setattr(replica, "_replica_caida_hasta", 0.0)
+
+    apuntar(f"sqlite+aiosqlite:///{copia}")
+    replica.instalar_deteccion_escrituras()
+    yield apuntar
+    for motor in motores:
+        asyncio.run(motor.dispose())
+
+
+def _crear_evento(cliente, id_responsable):
+    r = cliente.post(f"/api/v1/eventos/?id_responsable={id_responsable}", json={
+        "nombre": "Evento en el primario", "descripcion": None, "tipo": "ludico",
+        "fecha_inicio": "2031-11-01", "fecha_fin": "2031-11-01",
+        "hora_inicio": "09:00:00", "hora_fin": "10:00:00",
+    })
+    assert r.status_code == 201, r.text
+    return r
+
+
+def test_lecturas_van_a_la_replica(con_replica):
+    with TestClient(_app()) as cliente:
+        r = cliente.get("/api/v1/eventos/1")
+        assert r.status_code == 200 and r.headers["x-origen-lectura"] == "replica"
+        r = cliente.get("/api/v1/eventos/?limite=5")
+        assert r.headers["x-origen-lectura"] == "replica"
+
+
+def test_tras_escribir_la_cookie_fuerza_el_primario(con_replica, usuarios):
+    with TestClient(_app()) as cliente:
+        r = _crear_evento(cliente, usuarios["estudiante"])
+        assert replica.COOKIE_LEER_PRIMARIO in r.cookies
+        id_evento = r.json()["id_evento"]
+        # el cliente reenvía la cookie: lee su propia escritura del primario
+        r = cliente.get(f"/api/v1/eventos/{id_evento}")
+        assert r.status_code == 200 and r.headers["x-origen-lectura"] == "primario"
+
+    with TestClient(_app()) as otro:
+        # sin la cookie lee de la réplica, que no tiene el evento
+        r = otro.get(f"/api/v1/eventos/{id_evento}")
+        assert r.status_code == 404 and r.headers["x-origen-lectura"] == "replica"
+        # la cabecera también fuerza el primario
+        r = otro.get(f"/api/v1/eventos/{id_evento}", headers={"X-Leer-Primario": "1"})
+        assert r.status_code == 200 and r.headers["x-origen-lectura"] == "primario"
+
+
+def test_replica_caida_lee_del_primario(con_replica, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "REPLICA_REINTENTO_S", 60)
+    con_replica(f"sqlite+aiosqlite:///{tmp_path / 'no_existe' / 'replica.db'}")
+    with TestClient(_app()) as cliente:
+        r = cliente.get("/api/v1/eventos/1")
+        assert r.status_code == 200 and r.headers["x-origen-lectura"] == "primario"
+        assert not replica.replica_disponible()  # descartada durante REPLICA_REINTENTO_S
+        assert cliente.get("/api/v1/eventos/1").headers["x-origen-lectura"] == "primario"
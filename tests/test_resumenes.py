@@ -0,0 +1,110 @@
+# tests/test_resumenes.py
+from datetime import date, time
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, selectinload
+
+from app.crud.eventos import resumenes
+from app.db.mysql import AsyncSessionLocal
+from app.models.eventos.evento import EventoModel, TipoEventoEnum
+from app.models.eventos.evento_responsable import EventoResponsableModel
+from app.models.eventos.instalacion_evento import InstalacionEventoModel
+from app.models.eventos.representante import RepresentanteModel
+from tests.conftest import ejecutar
+
+
+@pytest.fixture
+def mantenimiento(datos_sembrados):
+    async def reconstruir():
+        async with AsyncSessionLocal() as session:
+            await resumenes.reconstruir_resumenes(session)
+    ejecutar(reconstruir())
+    resumenes.instalar_mantenimiento_resumenes()
+    yield
+    event.remove(Session, "before_flush", resumenes._antes_de_flush)
+    event.remove(Session, "after_flush", resumenes._despues_de_flush)
+
+
+async def _verificar():
+    async with AsyncSessionLocal() as session:
+        return await resumenes.verificar_resumenes(session)
+
+
+async def _cargar(session, id_evento):
+    return (await session.execute(
+        select(EventoModel).where(EventoModel.id_evento == id_evento).options(
+            selectinload(EventoModel.instalaciones), selectinload(EventoModel.organizaciones),
+            selectinload(EventoModel.responsables),
+        )
+    )).scalar_one()
+
+
+def test_escrituras_orm_mantienen_los_resumenes(mantenimiento, usuarios):
+    async def caso():
+        # alta con responsable, instalación y organización
+        async with AsyncSessionLocal() as session:
+            evento = EventoModel(
+                nombre="Evento resumen", tipo=TipoEventoEnum.ACADEMICO,
+                fecha_inicio=date(2031, 7, 1), fecha_fin=date(2031, 7, 1),
+                hora_inicio=time(9), hora_fin=time(10),
+                responsables=[EventoResponsableModel(id_usuario=usuarios["docente"], fecha_asignacion=date(2031, 6, 1))],
+                instalaciones=[InstalacionEventoModel(id_instalacion=1)],
+                organizaciones=[RepresentanteModel(id_organizacion=1)],
+            )
+            session.add(evento)
+            await session.commit()
+            id_evento = evento.id_evento
+        assert await _verificar() == []
+
+        # cambio de tipo: mueve todas las contribuciones del evento
+        async with AsyncSessionLocal() as session:
+            evento = await _cargar(session, id_evento)
+            evento.tipo = TipoEventoEnum.LUDICO
+            await session.commit()
+        assert await _verificar() == []
+
+        # otra instalación y cambio de clave de una fila hija
+        async with AsyncSessionLocal() as session:
+            evento = await _cargar(session, id_evento)
+            evento.instalaciones.append(InstalacionEventoModel(id_instalacion=2))
+            evento.organizaciones[0].id_organizacion = 2
+            await session.commit()
+        assert await _verificar() == []
+
+        # baja de una fila hija y luego del evento completo (cascada)
+        async with AsyncSessionLocal() as session:
+            evento = await _cargar(session, id_evento)
+            evento.instalaciones.remove(evento.instalaciones[0])
+            await session.commit()
+        assert await _verificar() == []
+        async with AsyncSessionLocal() as session:
+            await session.delete(await _cargar(session, id_evento))
+            await session.commit()
+        assert await _verificar() == []
+
+    ejecutar(caso())
+
+
+def test_sin_hooks_se_detecta_la_deriva(mantenimiento):
+    # control: verificar_resumenes sí detecta una escritura que no pasó por los hooks
+    event.remove(Session, "after_flush", resumenes._despues_de_flush)
+
+    async def caso():
+        async with AsyncSessionLocal() as session:
+            usadas = set((await session.execute(
+                select(InstalacionEventoModel.id_instalacion).where(InstalacionEventoModel.id_evento == 1)
+            )).scalars())
+            id_instalacion = min(set(range(1, 9)) - usadas)
+            session.add(InstalacionEventoModel(id_evento=1, id_instalacion=id_instalacion))
+            await session.commit()
+        diferencias = await _verificar()
+        async with AsyncSessionLocal() as session:
+            await session.delete(await session.get(InstalacionEventoModel, (1, id_instalacion)))
+            await session.commit()
+        return diferencias
+
+    try:
+        assert ejecutar(caso())
+    finally:
+        event.listen(Session, "after_flush", resumenes._despues_de_flush)